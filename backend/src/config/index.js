@@ -52,8 +52,13 @@ const config = {
     nlpService: {
         baseUrl: process.env.NLP_SERVICE_URL || 'http://localhost:8000',
         timeout: parseInt(process.env.NLP_SERVICE_TIMEOUT, 10) || 30000,
+        // Opt-in: analyses run as queued jobs that are polled, so slow ones don't hit the timeout
+        useJobs: process.env.NLP_SERVICE_USE_JOBS === 'true',
+        jobPollInterval: parseInt(process.env.NLP_SERVICE_JOB_POLL_INTERVAL, 10) || 1000,
+        jobTimeout: parseInt(process.env.NLP_SERVICE_JOB_TIMEOUT, 10) || 10 * 60 * 1000,
         endpoints: {
             analyze: '/api/analyze',
+            jobs: '/api/jobs',
             match: '/api/match',
             skills: '/api/skills',
             roles: '/api/roles',
@@ -18,6 +18,18 @@ const nlpClient = axios.create({
     },
 });
 
+// Analysis fields the backend stores. Compact responses leave out
+// extracted_text unless it is listed here.
+const ANALYZE_FIELDS = [
+    'extracted_text',
+    'extracted_skills',
+    'required_skills',
+    'matched_skills',
+    'gap_skills',
+    'match_score',
+    'recommendations',
+];
+
 // Request interceptor for logging
 nlpClient.interceptors.request.use(
     (request) => {
@@ -73,6 +85,11 @@ exports.analyzeResume = async (filePath, targetRole) => {
         formData.append('file', fs.createReadStream(filePath));
         formData.append('target_role', targetRole);
 
+        if (config.nlpService.useJobs) {
+            const job = await runAnalysisJob(formData);
+            return expandCompactAnalysis(job.result);
+        }
+
         const response = await nlpClient.post(
             config.nlpService.endpoints.analyze,
             formData,
@@ -80,10 +97,15 @@ exports.analyzeResume = async (filePath, targetRole) => {
                 headers: {
                     ...formData.getHeaders(),
                 },
+                // Smaller payload with skills referenced by ID, expanded below
+                params: {
+                    compact: true,
+                    fields: ANALYZE_FIELDS.join(','),
+                },
             }
         );
 
-        return response.data;
+        return expandCompactAnalysis(response.data);
     } catch (error) {
         // Handle NLP service unavailability gracefully
         if (error.code === 'ECONNREFUSED' || error.code === 'ENOTFOUND') {
@@ -153,6 +175,87 @@ exports.getJobRoles = async () => {
     }
 };
 
+/**
+ * Queue an analysis job and poll it until it finishes
+ * @param {FormData} formData - Upload with file and target_role
+ * @returns {Promise<Object>} - Succeeded job, with the analysis as `result`
+ */
+async function runAnalysisJob(formData) {
+    const { endpoints, jobPollInterval, jobTimeout } = config.nlpService;
+    const submitted = await nlpClient.post(endpoints.jobs, formData, {
+        headers: {
+            ...formData.getHeaders(),
+        },
+        params: {
+            compact: true,
+            fields: ANALYZE_FIELDS.join(','),
+        },
+    });
+
+    const jobUrl = `${endpoints.jobs}/${submitted.data.id}`;
+    const deadline = Date.now() + jobTimeout;
+
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, jobPollInterval));
+        const { data: job } = await nlpClient.get(jobUrl);
+
+        if (job.status === 'succeeded') {
+            return job;
+        }
+        if (job.status === 'failed' || job.status === 'cancelled') {
+            throw new Error(`analysis job ${job.status}${job.error ? `: ${job.error}` : ''}`);
+        }
+    }
+
+    // Don't leave the job running for nobody
+    await nlpClient.delete(jobUrl).catch(() => {});
+    throw new Error(`analysis job did not finish within ${jobTimeout}ms`);
+}
+
+/**
+ * Expand a compact analysis response into the full response layout
+ * @param {Object} data - Response with a shared `skills` table
+ * @returns {Object} - Response with skill objects instead of IDs
+ */
+function expandCompactAnalysis(data) {
+    // Services without compact mode already return the full layout
+    if (!data || !Array.isArray(data.skills)) {
+        return data;
+    }
+
+    const skill = (id) => data.skills[id] || { name: String(id), category: null };
+
+    return {
+        extracted_text: data.extracted_text || '',
+        extracted_skills: (data.extracted_skills || []).map(item => ({
+            name: skill(item.id).name,
+            level: item.level,
+            category: skill(item.id).category,
+            confidence: item.confidence,
+        })),
+        required_skills: (data.required_skills || []).map(item => ({
+            name: skill(item.id).name,
+            level: item.level,
+            category: skill(item.id).category,
+            confidence: null,
+        })),
+        matched_skills: (data.matched_skills || []).map(id => ({
+            name: skill(id).name,
+            level: 'intermediate',
+        })),
+        gap_skills: (data.gap_skills || []).map(id => ({
+            name: skill(id).name,
+            level: 'beginner',
+        })),
+        match_score: data.match_score || 0,
+        recommendations: (data.recommendations || []).map(item => ({
+            skill: skill(item.id).name,
+            priority: item.priority,
+            reason: item.reason,
+        })),
+    };
+}
+
 // ============================================
 // FALLBACK FUNCTIONS (when NLP service is unavailable)
 // ============================================
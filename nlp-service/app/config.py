@@ -2,8 +2,16 @@
 Application Configuration
 """
 
+import os
+
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
+
+# nlp-service/; relative data paths are resolved against it, not the working directory
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Set by serve.py in its workers: the supervisor that broadcasts taxonomy reloads
+SUPERVISOR_PID_ENV = "SKILLLENS_SUPERVISOR_PID"
 
 
 class Settings(BaseSettings):
@@ -15,15 +23,127 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
     
+    # Production server (serve.py); main.py is the single-process dev server
+    WORKERS: int = 0  # server processes, 0 = CPUs (cgroup quota aware) / (1 + EXECUTOR_PROCESS_WORKERS)
+    PRELOAD_STEPS: List[str] = ["taxonomy", "parsers", "extraction"]  # warm-up run before forking
+    SERVER_LOOP: str = "auto"  # auto (uvloop when installed), uvloop, asyncio
+    SERVER_HTTP: str = "auto"  # auto (httptools when installed), httptools, h11
+    SERVER_BACKLOG: int = 2048  # pending connections queued by the kernel
+    SERVER_KEEP_ALIVE: int = 75  # seconds, longer than typical load balancer idle timeouts
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # seconds workers get to finish requests on shutdown
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = None  # connections per worker before 503s
+    SERVER_MAX_REQUESTS: Optional[int] = None  # requests before a worker is replaced
+    SERVER_ACCESS_LOG: bool = False
+    
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5000"]
     
     # NLP Models
     SPACY_MODEL: str = "en_core_web_sm"
+    SKILL_ENGINE: str = "scanner"  # scanner (Aho-Corasick) or spacy (PhraseMatcher, needs spaCy)
+    SPACY_TOKENIZER_ONLY: bool = True  # blank English tokenizer instead of loading SPACY_MODEL
+    SPACY_BATCH_SIZE: int = 64  # texts per nlp.pipe batch in batch extraction
+    SPACY_N_PROCESS: int = 1
     SENTENCE_TRANSFORMER_MODEL: str = "all-MiniLM-L6-v2"
+    SEMANTIC_MATCHING: bool = False  # embedding similarity for unmatched skills
+    SEMANTIC_THRESHOLD: float = 0.75  # minimum cosine similarity
+    SEMANTIC_CACHE_SIZE: int = 4096  # embeddings kept for skills outside the taxonomy
+    FUZZY_MATCHING: bool = False  # trigram index for misspelled or respaced skill names
+    FUZZY_MIN_LENGTH: int = 6  # shorter names only match once spaces/punctuation are removed
+    FUZZY_MAX_DISTANCE: int = 2  # edits tolerated (one below 10 characters)
+    FUZZY_MAX_TOKENS: int = 3  # words joined into one candidate, e.g. "Postgre SQL"
+    FUZZY_BUDGET_MS: float = 25.0  # per text, 0 = unlimited
+    FUZZY_CACHE_SIZE: int = 16384  # resolved candidates, misses included
+    
+    # Per-stage latency histograms and fallback counters served at /metrics
+    METRICS_ENABLED: bool = True
+    
+    # On-demand profiling (middleware is only installed when enabled)
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0  # share of all requests profiled, 0 = only X-Profile requests
+    PROFILING_DIR: str = "data/profiles"
+    PROFILING_MAX_FILES: int = 50
+    
+    # Warm-up after startup (readiness is reported at /health/ready)
+    WARMUP_ON_STARTUP: bool = True
+    WARMUP_STEPS: List[str] = ["taxonomy", "parsers", "pools", "extraction", "semantic"]
+    
+    # Skill taxonomy (skills.json, synonyms.json, roles.json)
+    TAXONOMY_DIR: Optional[str] = None  # None = bundled taxonomy/ directory
+    TAXONOMY_ARTIFACT_PATH: Optional[str] = "data/taxonomy.pickle"  # compiled cache, empty = disabled
+    TAXONOMY_RELOAD_INTERVAL: int = 0  # seconds between data file checks, 0 = reload via admin API only
+    
+    # Admin endpoints require this value in the X-Admin-Token header, None = disabled
+    ADMIN_TOKEN: Optional[str] = None
     
     # Processing
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
+    MAX_BATCH_UPLOAD_SIZE: int = 200 * 1024 * 1024  # whole /analyze/batch request
+    MAX_BATCH_EXTRACTED_SIZE: int = 200 * 1024 * 1024  # archive members of one batch, uncompressed
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024
+    UPLOAD_SPOOL_THRESHOLD: int = 1024 * 1024  # larger uploads go to a temp file
+    UPLOAD_SPOOL_DIR: Optional[str] = None  # None = system temp directory
+    PDF_MAX_PAGES: int = 30
+    PDF_TIME_BUDGET_SECONDS: float = 10.0
+    PDF_BACKEND: str = "auto"  # auto, pymupdf, pypdf, pdfminer, pdfplumber
+    PDF_FALLBACK_BACKEND: str = "auto"
+    PDF_AUTO_FAST_MIN_PAGES: int = 5  # larger documents always use the fastest backend
+    PDF_AUTO_FAST_MIN_BYTES: int = 2 * 1024 * 1024
+    DOCX_STREAMING: bool = True  # iterparse the zip directly, python-docx only as fallback
+    SECTION_AWARE_EXTRACTION: bool = True  # weight and level-check mentions by resume section
+    
+    # Executors (blocking work kept off the event loop)
+    EXECUTOR_THREAD_WORKERS: int = 4
+    EXECUTOR_PROCESS_WORKERS: int = 2  # 0 = parse PDFs in the thread pool
+    EXECUTOR_MAX_QUEUE: int = 16  # pending tasks per pool beyond its workers
+    EXECUTOR_RETRY_AFTER: int = 2  # seconds, sent with 503 responses
+    
+    # Batch analysis
+    BATCH_MAX_FILES: int = 500
+    BATCH_CONCURRENCY: int = 4  # files of one batch processed at a time
+    BATCH_SATURATED_RETRIES: int = 3
+    
+    # Analysis cache (keyed by file hash + taxonomy version)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 512
+    CACHE_TTL_SECONDS: int = 3600
+    CACHE_DB_PATH: Optional[str] = None  # SQLite file shared by workers, None = memory only
+    CACHE_DB_MAX_ENTRIES: int = 10000
+    
+    # Async analysis jobs (SQLite queue drained by job runners)
+    JOB_DB_PATH: str = "data/jobs.sqlite3"
+    JOB_DIR: str = "data/jobs"  # uploaded files of queued jobs
+    JOB_WORKERS: int = 2  # runners per API process, 0 = only worker.py drains the queue
+    JOB_POLL_INTERVAL: float = 0.5  # seconds between claims when the queue is empty
+    JOB_LEASE_SECONDS: int = 120  # running jobs without a heartbeat this long are retried
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETENTION_SECONDS: int = 24 * 3600  # finished jobs kept for polling
+    JOB_CALLBACK_TIMEOUT: float = 10.0
+    JOB_CALLBACK_RETRIES: int = 2
+    # Hosts callbacks may be sent to; empty = any host resolving only to public addresses
+    JOB_CALLBACK_ALLOWED_HOSTS: List[str] = []
+    
+    # Candidate index (skill -> resume postings); opt-in since it persists
+    # the file name and skills of every analyzed resume, e.g.
+    # "data/candidate_index.sqlite3"
+    CANDIDATE_INDEX_PATH: Optional[str] = None
+    
+    @field_validator(
+        "PROFILING_DIR",
+        "TAXONOMY_DIR",
+        "TAXONOMY_ARTIFACT_PATH",
+        "UPLOAD_SPOOL_DIR",
+        "CACHE_DB_PATH",
+        "JOB_DB_PATH",
+        "JOB_DIR",
+        "CANDIDATE_INDEX_PATH",
+    )
+    @classmethod
+    def resolve_data_path(cls, path: Optional[str]) -> Optional[str]:
+        """Anchor relative paths at the service directory; empty disables optional ones"""
+        if not path:
+            return None
+        return os.path.join(SERVICE_DIR, path)
     
     class Config:
         env_file = ".env"
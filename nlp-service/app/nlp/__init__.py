@@ -4,5 +4,14 @@ NLP package initialization
 
 from app.nlp.skill_extractor import SkillExtractor
 from app.nlp.skill_matcher import SkillMatcher
+from app.nlp.skill_scanner import SkillScanner
+from app.nlp.role_index import RoleIndex
+from app.nlp.taxonomy import CompiledTaxonomy, TaxonomyStore, taxonomy_store
+from app.nlp.phrase_engine import SpacyPhraseEngine
+from app.nlp.fuzzy_index import FuzzySkillIndex, FuzzySkillResolver, fuzzy_resolver
 
-__all__ = ["SkillExtractor", "SkillMatcher"]
+__all__ = [
+    "SkillExtractor", "SkillMatcher", "SkillScanner", "RoleIndex",
+    "CompiledTaxonomy", "TaxonomyStore", "taxonomy_store", "SpacyPhraseEngine",
+    "FuzzySkillIndex", "FuzzySkillResolver", "fuzzy_resolver",
+]
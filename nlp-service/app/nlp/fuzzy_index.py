@@ -0,0 +1,324 @@
+"""
+Fuzzy Skill Index
+Character-trigram index for misspelled and respaced skill names
+"""
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Characters dropped when comparing names, so "Node JS", "node-js" and "Node.js" agree
+COMPACT_DROP = str.maketrans("", "", " \t-._/")
+
+# Word-like runs in lowercased text ("+" and "#" keep "c++" and "c#" intact),
+# each with the separator joining it to the next one in a multi-token
+# candidate ("Tensor Flow", "Postgre-SQL")
+CANDIDATE_TOKEN = re.compile(r"([a-z0-9][a-z0-9+#]*)(?:[ \-./_]{1,2}(?=[a-z0-9]))?")
+# Stands in for already matched text: neither a token nor a separator
+COVERED_CHAR = "\x00"
+
+# Compact names shorter than this are never looked up
+MIN_CANDIDATE_LENGTH = 3
+# Leading characters a multi-word candidate must share with some term
+PREFIX_LENGTH = 2
+# Compact length from which two edits are tolerated (one below it)
+TWO_EDIT_LENGTH = 10
+# Trigrams one edit can change: three for a substitution, insertion or
+# deletion, four for swapping two adjacent characters ("pyhton")
+TRIGRAMS_PER_EDIT = 4
+# Plain-word synonyms shorter than this only resolve named skills, never free text
+MIN_FREE_TEXT_SYNONYM_LENGTH = 6
+# A single word one edit or more from a skill is only kept in free text with
+# another skill mention this close: on its own it is as likely an ordinary
+# word ("docket", "seaborne", "bootstraps")
+CONTEXT_CHARS = 80
+
+_MISS = (None, 0)
+
+
+def compact(name: str) -> str:
+    """Lowercase a name and drop spaces and separator punctuation"""
+    return name.lower().translate(COMPACT_DROP)
+
+
+def _trigrams(term: str) -> set:
+    padded = f"##{term}$$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """
+    Edit distance between a and b, or None when it exceeds limit
+
+    Levenshtein distance that also counts swapping two adjacent characters
+    ("pyhton") as one edit (optimal string alignment). Only the diagonal
+    band of width 2 * limit + 1 is computed and the loop stops as soon as
+    a whole row is over the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    beyond = limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [beyond] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        ch = a[i - 1]
+        row_min = current[0] if low == 1 else beyond
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (ch != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if before is not None and j > 1 and ch == b[j - 2] and a[i - 2] == b[j - 1]:
+                if before[j - 2] + 1 < cost:
+                    cost = before[j - 2] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return None
+        before, previous = previous, current
+    return previous[len(b)] if previous[len(b)] <= limit else None
+
+
+class FuzzySkillIndex:
+    """
+    Trigram postings over the compact form of every skill name and synonym
+
+    A lookup only visits terms sharing a trigram with the candidate, keeps
+    those sharing enough of them to be within the edit limit (an edit
+    changes at most TRIGRAMS_PER_EDIT trigrams) and verifies the survivors
+    with a banded edit distance. Built with the CompiledTaxonomy and pickled
+    into its artifact.
+
+    Named-only terms resolve exactly (role requirements, lookups by name)
+    but take no part in fuzzy matching, and free-text scans ignore them.
+    """
+
+    def __init__(self, names: Dict[str, str], named_only: Iterable[str] = ()):
+        # Compact term -> lowercased canonical skill; earlier names win conflicts
+        self.targets: Dict[str, str] = {}
+        for name, target in names.items():
+            term = compact(name)
+            if len(term) >= MIN_CANDIDATE_LENGTH:
+                self.targets.setdefault(term, target)
+        self.named_only = frozenset(compact(name) for name in named_only)
+
+        self.terms: List[str] = [term for term in self.targets if term not in self.named_only]
+        self._term_trigrams: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for term_id, term in enumerate(self.terms):
+            grams = _trigrams(term)
+            self._term_trigrams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(term_id)
+        self.max_length = max((len(term) for term in self.terms), default=0)
+        # Multi-word candidates are only looked up when they start like a term
+        self.prefixes = frozenset(term[:PREFIX_LENGTH] for term in self.terms)
+
+    def lookup(self, candidate: str, max_distance: int) -> Tuple[Optional[str], int]:
+        """
+        Closest term to a compact candidate within max_distance edits
+
+        Returns:
+            (canonical skill, distance), or (None, 0) when nothing is close
+            enough or two different skills are equally close
+        """
+        target = self.targets.get(candidate)
+        if target is not None:
+            return target, 0
+        if max_distance <= 0:
+            return _MISS
+
+        grams = _trigrams(candidate)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for term_id in self._postings.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        best, best_distance, ambiguous = None, max_distance + 1, False
+        slack = TRIGRAMS_PER_EDIT * max_distance
+        for term_id, count in shared.items():
+            if count < max(len(grams), self._term_trigrams[term_id]) - slack:
+                continue
+            term = self.terms[term_id]
+            distance = bounded_distance(candidate, term, max_distance)
+            if distance is None:
+                continue
+            target = self.targets[term]
+            if distance < best_distance:
+                best, best_distance, ambiguous = target, distance, False
+            elif distance == best_distance and target != best:
+                ambiguous = True
+        if best is None or ambiguous:
+            return _MISS
+        return best, best_distance
+
+
+class FuzzySkillResolver:
+    """
+    Resolves candidate phrases through the taxonomy's FuzzySkillIndex
+
+    Results, misses included, are kept in an LRU so vocabulary repeated
+    across resumes is looked up once per taxonomy version. Scanning a
+    text stops when its latency budget is spent.
+    """
+
+    def __init__(self, cache_size: int = settings.FUZZY_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[Optional[str], int]]" = OrderedDict()
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def max_distance(candidate: str) -> int:
+        """Edits tolerated for a compact candidate of this length"""
+        if len(candidate) < settings.FUZZY_MIN_LENGTH:
+            return 0
+        return min(settings.FUZZY_MAX_DISTANCE, 1 if len(candidate) < TWO_EDIT_LENGTH else 2)
+
+    def lookup(self, taxonomy, candidate: str) -> Tuple[Optional[str], int]:
+        """Cached FuzzySkillIndex.lookup for a compact candidate"""
+        with self._lock:
+            if self._version != taxonomy.version:
+                self._cache.clear()
+                self._version = taxonomy.version
+            result = self._cache.get(candidate)
+            if result is not None:
+                self._cache.move_to_end(candidate)
+                return result
+
+        result = taxonomy.fuzzy_index.lookup(candidate, self.max_distance(candidate))
+        with self._lock:
+            if self._version == taxonomy.version:
+                self._cache[candidate] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def resolve(self, taxonomy, name: str) -> Optional[str]:
+        """Canonical skill for a name the taxonomy does not know exactly, if any"""
+        candidate = compact(name)
+        if len(candidate) < MIN_CANDIDATE_LENGTH:
+            return None
+        return self.lookup(taxonomy, candidate)[0]
+
+    def find(
+        self,
+        taxonomy,
+        text_lower: str,
+        covered: Iterable[Tuple[int, int]] = (),
+        budget_ms: Optional[float] = None,
+    ) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Skill mentions the exact scanner missed, in the scanner's hit format
+
+        Runs of up to FUZZY_MAX_TOKENS tokens joined by spaces or separator
+        punctuation are compacted and looked up, longest first at each
+        position; a match consumes its tokens. Tokens overlapping a
+        covered (already matched) span are skipped. Named-only terms are
+        not matched, and a single word that is not an exact (compact)
+        match is kept only within CONTEXT_CHARS of another skill mention.
+
+        Args:
+            taxonomy: Compiled taxonomy providing the index
+            text_lower: Lowercased text
+            covered: (start, end) spans of exact hits
+            budget_ms: Stop after this long (default FUZZY_BUDGET_MS, 0 = none)
+
+        Returns:
+            Mapping of lowercased skill to (start, end) offsets of each mention
+        """
+        budget_ms = settings.FUZZY_BUDGET_MS if budget_ms is None else budget_ms
+        deadline = time.perf_counter() + budget_ms / 1000 if budget_ms > 0 else None
+        index = taxonomy.fuzzy_index
+        max_tokens = settings.FUZZY_MAX_TOKENS
+        max_length = index.max_length + settings.FUZZY_MAX_DISTANCE
+
+        # Blank out exact hits so no candidate overlaps or spans them
+        parts, position = [], 0
+        for start, end in sorted(covered):
+            if end > position:
+                start = max(start, position)
+                parts.append(text_lower[position:start])
+                parts.append(COVERED_CHAR * (end - start))
+                position = end
+        parts.append(text_lower[position:])
+        masked = "".join(parts)
+
+        # (start, end, word, joined to the next token)
+        tokens = [
+            (m.start(), m.end(1), m.group(1), m.end() > m.end(1))
+            for m in CANDIDATE_TOKEN.finditer(masked)
+        ]
+
+        hits: Dict[str, List[Tuple[int, int]]] = {}
+        # Misspelled single words, kept once the other mentions are known
+        edited: List[Tuple[str, Tuple[int, int]]] = []
+        anchors = sorted(covered)
+        # Per-text memo in front of the shared cache; resumes repeat their vocabulary
+        seen: Dict[str, Tuple[Optional[str], int]] = {}
+        i = 0
+        while i < len(tokens):
+            if deadline is not None and time.perf_counter() > deadline:
+                metrics.fallback("fuzzy_budget")
+                logger.debug(f"Fuzzy skill scan stopped at the budget after {i}/{len(tokens)} tokens")
+                break
+
+            run = 1
+            if tokens[i][2][:PREFIX_LENGTH] in index.prefixes:
+                while run < max_tokens and tokens[i + run - 1][3]:
+                    run += 1
+
+            matched = 0
+            for width in range(run, 0, -1):
+                # Tokens hold no separator characters, so joining them compacts the run
+                if width == 1:
+                    candidate = tokens[i][2]
+                else:
+                    candidate = "".join(token[2] for token in tokens[i:i + width])
+                if not MIN_CANDIDATE_LENGTH <= len(candidate) <= max_length:
+                    continue
+                result = seen.get(candidate)
+                if result is None:
+                    result = seen[candidate] = self.lookup(taxonomy, candidate)
+                target = result[0]
+                if target is not None and candidate not in index.named_only:
+                    span = (tokens[i][0], tokens[i + width - 1][1])
+                    if width == 1 and result[1]:
+                        edited.append((target, span))
+                    else:
+                        hits.setdefault(target, []).append(span)
+                        anchors.append(span)
+                    matched = width
+                    break
+            i += matched or 1
+
+        if edited:
+            anchors.sort()
+            anchor_starts = [start for start, _ in anchors]
+            for target, (start, end) in edited:
+                # Anchors starting up to CONTEXT_CHARS after the word, ending at most that far before it
+                nearby = anchors[:bisect_right(anchor_starts, end + CONTEXT_CHARS)]
+                if any(anchor_end >= start - CONTEXT_CHARS for _, anchor_end in nearby):
+                    hits.setdefault(target, []).append((start, end))
+        return hits
+
+
+fuzzy_resolver = FuzzySkillResolver()
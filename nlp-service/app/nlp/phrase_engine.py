@@ -0,0 +1,110 @@
+"""
+Phrase Engine
+spaCy PhraseMatcher alternative to the Aho-Corasick skill scanner
+"""
+
+import importlib.util
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.config import settings
+from app.nlp.taxonomy import CompiledTaxonomy
+
+logger = logging.getLogger(__name__)
+
+SKILL_ENGINES = ("scanner", "spacy")
+
+
+def spacy_available() -> bool:
+    """Whether spaCy can be imported (it is an optional dependency)"""
+    return importlib.util.find_spec("spacy") is not None
+
+
+def resolve_engine(name: str) -> str:
+    """Validate a SKILL_ENGINE value, falling back to the scanner without spaCy"""
+    if name not in SKILL_ENGINES:
+        raise ValueError(f"Unknown skill engine: {name}")
+    if name == "spacy" and not spacy_available():
+        logger.warning("SKILL_ENGINE=spacy but spaCy is not installed, using the scanner")
+        return "scanner"
+    return name
+
+
+class SpacyPhraseEngine:
+    """
+    Finds taxonomy skills with a spaCy PhraseMatcher on the LOWER attribute
+
+    Only tokenization matters for LOWER matching, so the pipeline is either
+    a blank tokenizer-only one (SPACY_TOKENIZER_ONLY) or SPACY_MODEL with
+    every component disabled. The matcher is built once per taxonomy
+    version. Hits use the SkillScanner format (lowercased keyword ->
+    character spans) so SkillExtractor handles both engines the same way;
+    unlike the scanner, matches must start and end on token boundaries.
+    """
+
+    def __init__(self):
+        self._nlp = None
+        self._matcher = None
+        self._keys: Dict[int, str] = {}
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _load_nlp(self):
+        import spacy
+
+        if settings.SPACY_TOKENIZER_ONLY:
+            return spacy.blank("en")
+        nlp = spacy.load(settings.SPACY_MODEL)
+        nlp.select_pipes(disable=nlp.pipe_names)
+        return nlp
+
+    def _get_matcher(self, taxonomy: CompiledTaxonomy):
+        """Build (once per taxonomy version) the matcher over every skill name"""
+        if self._version == taxonomy.version:
+            return self._matcher
+        with self._lock:
+            if self._version != taxonomy.version:
+                from spacy.matcher import PhraseMatcher
+
+                if self._nlp is None:
+                    self._nlp = self._load_nlp()
+                matcher = PhraseMatcher(self._nlp.vocab, attr="LOWER")
+                keys = {}
+                names = list(taxonomy.all_skills)
+                for key, pattern in zip(names, self._nlp.tokenizer.pipe(names)):
+                    keys[self._nlp.vocab.strings.add(key)] = key
+                    matcher.add(key, [pattern])
+                self._matcher, self._keys = matcher, keys
+                self._version = taxonomy.version
+                logger.info(f"Built PhraseMatcher over {len(names)} skills ({taxonomy.version})")
+        return self._matcher
+
+    def _hits(self, matcher, doc) -> Dict[str, List[Tuple[int, int]]]:
+        hits: Dict[str, List[Tuple[int, int]]] = {}
+        for match_id, start, end in matcher(doc):
+            span = doc[start:end]
+            hits.setdefault(self._keys[match_id], []).append((span.start_char, span.end_char))
+        return hits
+
+    def scan(self, taxonomy: CompiledTaxonomy, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """Match one text (tokenized only, no pipeline components run)"""
+        matcher = self._get_matcher(taxonomy)
+        return self._hits(matcher, self._nlp.make_doc(text))
+
+    def scan_many(
+        self,
+        taxonomy: CompiledTaxonomy,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> Iterator[Dict[str, List[Tuple[int, int]]]]:
+        """Match many texts, tokenized in batches through nlp.pipe"""
+        matcher = self._get_matcher(taxonomy)
+        docs = self._nlp.pipe(
+            texts,
+            batch_size=batch_size or settings.SPACY_BATCH_SIZE,
+            n_process=n_process or settings.SPACY_N_PROCESS,
+        )
+        for doc in docs:
+            yield self._hits(matcher, doc)
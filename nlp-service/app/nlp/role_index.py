@@ -0,0 +1,172 @@
+"""
+Role Index
+Precomputed role requirements with integer skill IDs and bitset masks
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RoleIndex:
+    """
+    Static index over job role requirements
+
+    Every normalized required skill gets an integer ID; a role is stored as
+    a Python int whose set bits are its requirement IDs. Matching a resume
+    against a role is then a bitwise AND plus a popcount, and the
+    normalized-to-original name maps are built once instead of per request.
+    """
+
+    def __init__(self, roles: Dict[str, Dict], normalize: Callable[[str], str]):
+        self.normalize = normalize
+        self.skill_ids: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        self.roles: Dict[str, Dict] = {}
+        # Role x skill 0/1 matrix, built on first use of score_all
+        self._matrix = None
+        self._sizes = None
+
+        for role_id, role in roles.items():
+            mask = 0
+            # (original name, skill id) in the role's own order
+            requirements: List[Tuple[str, int]] = []
+            for skill in role["skills"]:
+                skill_id = self._skill_id(normalize(skill["name"]))
+                mask |= 1 << skill_id
+                requirements.append((skill["name"], skill_id))
+
+            self.roles[role_id] = {
+                "label": role.get("label", role_id),
+                "mask": mask,
+                "size": mask.bit_count(),
+                "requirements": requirements,
+            }
+
+        logger.info(f"Role index built: {len(self.roles)} roles, {len(self.skill_names)} skills")
+
+    def _skill_id(self, normalized: str) -> int:
+        skill_id = self.skill_ids.get(normalized)
+        if skill_id is None:
+            skill_id = len(self.skill_names)
+            self.skill_ids[normalized] = skill_id
+            self.skill_names.append(normalized)
+        return skill_id
+
+    def user_skill_ids(self, user_skills: Iterable[str]) -> List[int]:
+        """IDs of the user's skills that appear in any role (others cannot match)"""
+        skill_ids = self.skill_ids
+        ids = {skill_ids.get(self.normalize(skill)) for skill in user_skills}
+        ids.discard(None)
+        return sorted(ids)
+
+    def user_mask(self, user_skills: Iterable[str]) -> int:
+        """Bitset of the user's skills that appear in any role (others cannot match)"""
+        mask = 0
+        skill_ids = self.skill_ids
+        for skill in user_skills:
+            skill_id = skill_ids.get(self.normalize(skill))
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def match_role(self, role_id: str, user_mask: int) -> Optional[Dict]:
+        """
+        Match a user skill bitset against one role
+
+        Returns:
+            Same shape as SkillMatcher.match_skills, or None for unknown roles
+        """
+        role = self.roles.get(role_id)
+        if role is None:
+            return None
+
+        matched_mask = role["mask"] & user_mask
+        matched_count = matched_mask.bit_count()
+        score = (matched_count / role["size"]) * 100 if role["size"] else 0
+
+        matched = []
+        gaps = []
+        for original, skill_id in role["requirements"]:
+            if matched_mask >> skill_id & 1:
+                matched.append(original)
+            else:
+                gaps.append(original)
+
+        return {
+            "matched": matched,
+            "gaps": gaps,
+            "score": round(score, 1),
+            "totalRequired": role["size"],
+            "totalMatched": matched_count,
+        }
+
+    def warm(self) -> None:
+        """Build the role x skill matrix ahead of the first ranking"""
+        self._role_matrix()
+
+    def _role_matrix(self):
+        import numpy as np
+
+        if self._matrix is None:
+            matrix = np.zeros((len(self.roles), len(self.skill_names)), dtype=np.float32)
+            for row, role in enumerate(self.roles.values()):
+                for _, skill_id in role["requirements"]:
+                    matrix[row, skill_id] = 1.0
+            self._sizes = matrix.sum(axis=1)
+            self._matrix = matrix
+        return self._matrix, self._sizes
+
+    def score_all(
+        self,
+        user_skill_ids: List[int],
+        role_ids: Optional[Iterable[str]] = None,
+        top: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Match a user's skills against every role (or the given subset)
+
+        Scores for all roles come from one pass over the role x skill
+        matrix; matched/gap lists are only built for the roles returned.
+
+        Args:
+            user_skill_ids: Output of user_skill_ids
+            role_ids: Restrict ranking to these roles (unknown IDs are ignored)
+            top: Return only the best N roles
+
+        Returns:
+            Match results with "role" and "label" added, best score first
+        """
+        import numpy as np
+
+        matrix, sizes = self._role_matrix()
+        all_role_ids = list(self.roles)
+
+        matched_counts = matrix[:, user_skill_ids].sum(axis=1)
+        scores = np.divide(
+            matched_counts * 100, sizes, out=np.zeros_like(matched_counts), where=sizes > 0
+        )
+
+        if role_ids is not None:
+            wanted = set(role_ids)
+            rows = np.array([i for i, role_id in enumerate(all_role_ids) if role_id in wanted], dtype=np.intp)
+        else:
+            rows = np.arange(len(all_role_ids))
+        # Stable sort keeps taxonomy role order between equal scores
+        rows = rows[np.argsort(-scores[rows], kind="stable")]
+        if top is not None:
+            rows = rows[:top]
+
+        user_mask = 0
+        for skill_id in user_skill_ids:
+            user_mask |= 1 << skill_id
+
+        results = []
+        for row in rows:
+            role_id = all_role_ids[row]
+            result = self.match_role(role_id, user_mask)
+            result["role"] = role_id
+            result["label"] = self.roles[role_id]["label"]
+            results.append(result)
+        return results
@@ -0,0 +1,137 @@
+"""
+Semantic Skill Index
+Sentence-transformer embeddings for the skill taxonomy and role requirements
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticSkillIndex:
+    """
+    Unit-normalized embeddings for known skills plus an LRU for unseen ones
+
+    Taxonomy and role-requirement names are embedded once when the index is
+    built. Any other skill string is encoded on first use and kept in an LRU
+    cache, so repeated vocabulary is never re-encoded. Inference is CPU-only.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Iterable[str],
+        model_name: str = settings.SENTENCE_TRANSFORMER_MODEL,
+        cache_size: int = settings.SEMANTIC_CACHE_SIZE,
+    ):
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        self._np = np
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        names = sorted({name for name in vocabulary if name})
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._matrix = self._encode(names)
+        logger.info(f"Semantic index built: {len(names)} skills with {model_name}")
+
+    def _encode(self, names: List[str]):
+        """Encode names as float32 rows of unit length"""
+        if not names:
+            dimension = self.model.get_sentence_embedding_dimension()
+            return self._np.zeros((0, dimension), dtype=self._np.float32)
+        return self.model.encode(
+            names,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(self._np.float32)
+
+    def embed(self, names: List[str]):
+        """
+        Embedding matrix for names, one row per name in the given order
+
+        Known names are read from the precomputed matrix, cached ones from the
+        LRU, and the remaining misses are encoded in a single batch.
+        """
+        np = self._np
+        rows: List[Optional[object]] = [None] * len(names)
+        misses: List[Tuple[int, str]] = []
+
+        with self._lock:
+            for position, name in enumerate(names):
+                index = self._index.get(name)
+                if index is not None:
+                    rows[position] = self._matrix[index]
+                elif name in self._cache:
+                    self._cache.move_to_end(name)
+                    rows[position] = self._cache[name]
+                else:
+                    misses.append((position, name))
+
+        if misses:
+            unique = list(dict.fromkeys(name for _, name in misses))
+            encoded = dict(zip(unique, self._encode(unique)))
+            with self._lock:
+                for name, vector in encoded.items():
+                    self._cache[name] = vector
+                    self._cache.move_to_end(name)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            for position, name in misses:
+                rows[position] = encoded[name]
+
+        if not rows:
+            return np.zeros((0, self._matrix.shape[1]), dtype=np.float32)
+        return np.vstack(rows)
+
+    def similarities(self, required_skills: List[str], user_skills: List[str]):
+        """Cosine similarity of every (required, user) pair in one matrix multiply"""
+        return self.embed(required_skills) @ self.embed(user_skills).T
+
+    @staticmethod
+    def pick_best(
+        similarities,
+        required_skills: List[str],
+        user_skills: List[str],
+        threshold: float,
+    ) -> Dict[str, Tuple[str, float]]:
+        """Most similar user skill per required skill (rows) at or above the threshold"""
+        if not user_skills or not required_skills:
+            return {}
+        best = similarities.argmax(axis=1)
+        result = {}
+        for row, required in enumerate(required_skills):
+            score = float(similarities[row, best[row]])
+            if score >= threshold:
+                result[required] = (user_skills[best[row]], score)
+        return result
+
+    def best_matches(
+        self,
+        user_skills: List[str],
+        required_skills: List[str],
+        threshold: float,
+    ) -> Dict[str, Tuple[str, float]]:
+        """
+        Resolve required skills to the most similar user skill
+
+        One matrix multiply scores every (required, user) pair; pairs below
+        the cosine-similarity threshold are dropped.
+
+        Returns:
+            Mapping of required skill to (user skill, similarity)
+        """
+        if not user_skills or not required_skills:
+            return {}
+        return self.pick_best(
+            self.similarities(required_skills, user_skills), required_skills, user_skills, threshold
+        )
@@ -3,80 +3,81 @@ Skill Extractor
 Extracts skills from resume text using NLP
 """
 
-import re
 import logging
-from typing import List, Dict
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Optional, Tuple, Union
+
+from app.config import settings
+from app.nlp.fuzzy_index import FuzzySkillResolver, fuzzy_resolver
+from app.nlp.phrase_engine import SpacyPhraseEngine, resolve_engine
+from app.nlp.taxonomy import CompiledTaxonomy, TaxonomyStore, taxonomy_store
+from app.parsers.sections import SectionIndex, find_headings, segment
+from app.parsers.text_normalizer import NormalizedText
+from app.utils.metrics import metrics
+from app.utils.text import lower_preserving_offsets
 
 logger = logging.getLogger(__name__)
 
-# Comprehensive skill database (expandable)
-SKILL_PATTERNS = {
-    # Programming Languages
-    "programming": [
-        "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
-        "Ruby", "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB", "Perl",
-    ],
-    # Frontend
-    "frontend": [
-        "React", "React.js", "Vue", "Vue.js", "Angular", "Svelte", "Next.js",
-        "HTML", "HTML5", "CSS", "CSS3", "Sass", "SCSS", "Less", "Tailwind",
-        "Bootstrap", "Material UI", "Redux", "Zustand", "jQuery",
-    ],
-    # Backend
-    "backend": [
-        "Node.js", "Express", "Express.js", "Django", "Flask", "FastAPI",
-        "Spring", "Spring Boot", ".NET", "ASP.NET", "Rails", "Laravel",
-        "NestJS", "Koa", "Hapi",
-    ],
-    # Databases
-    "database": [
-        "MongoDB", "PostgreSQL", "MySQL", "SQLite", "Redis", "Elasticsearch",
-        "Cassandra", "DynamoDB", "Firebase", "Supabase", "Oracle", "SQL Server",
-        "Neo4j", "GraphQL", "Prisma",
-    ],
-    # Cloud & DevOps
-    "cloud_devops": [
-        "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "K8s",
-        "Terraform", "Ansible", "Jenkins", "GitHub Actions", "GitLab CI",
-        "CircleCI", "Travis CI", "Nginx", "Apache", "Linux", "Bash",
-    ],
-    # Data Science & ML
-    "data_ml": [
-        "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "Keras",
-        "Scikit-learn", "Pandas", "NumPy", "Matplotlib", "Seaborn", "Jupyter",
-        "NLP", "Computer Vision", "Neural Networks", "AI", "Data Science",
-    ],
-    # Tools & Practices
-    "tools": [
-        "Git", "GitHub", "GitLab", "Bitbucket", "Jira", "Confluence", "Trello",
-        "Agile", "Scrum", "CI/CD", "REST API", "GraphQL", "Microservices",
-        "Unit Testing", "Jest", "Pytest", "Mocha", "Cypress",
-    ],
+# Skill names, categories and level indicator phrases live in taxonomy/skills.json
+
+# Level reported when no indicator phrase appears near a mention
+DEFAULT_LEVEL = "intermediate"
+
+# Size of the context window around each skill mention
+LEVEL_WINDOW_TOKENS_BEFORE = 4
+LEVEL_WINDOW_TOKENS_AFTER = 1
+# Upper bound on characters inspected per token, keeps windows bounded
+LEVEL_WINDOW_CHARS_PER_TOKEN = 24
+
+# Confidence added per mention, scaled by the section it appears in; text
+# before the first heading (or without headings) counts 1.0
+SECTION_WEIGHTS = {
+    "experience": 1.5,
+    "projects": 1.25,
+    "skills": 1.0,
+    "summary": 1.0,
+    "certifications": 0.75,
+    "education": 0.5,
 }
+# Sections whose mentions are inspected for level indicators
+LEVEL_SECTIONS = frozenset({None, "summary", "skills", "experience", "projects"})
 
 
 class SkillExtractor:
     """Extracts skills from text using pattern matching and NLP"""
     
-    def __init__(self):
-        # Build flat skill list for matching
-        self.all_skills = {}
-        for category, skills in SKILL_PATTERNS.items():
-            for skill in skills:
-                self.all_skills[skill.lower()] = {
-                    "name": skill,
-                    "category": category
-                }
-        
-        # Compile regex patterns for each skill
-        self.patterns = []
-        for skill_lower, skill_data in self.all_skills.items():
-            # Create pattern that matches whole words
-            pattern = re.compile(
-                r'\b' + re.escape(skill_data["name"]) + r'\b',
-                re.IGNORECASE
-            )
-            self.patterns.append((pattern, skill_data))
+    def __init__(
+        self,
+        store: TaxonomyStore = taxonomy_store,
+        engine: Optional[str] = None,
+        fuzzy: Optional[bool] = None,
+        resolver: FuzzySkillResolver = fuzzy_resolver,
+    ):
+        # Compiled taxonomy (automaton, flat skill map, level indicators);
+        # each call reads it once so a reload never changes it mid-extraction
+        self.store = store
+        # "scanner" (Aho-Corasick automaton) or "spacy" (PhraseMatcher)
+        self.engine = resolve_engine(engine or settings.SKILL_ENGINE)
+        self.phrase_engine = SpacyPhraseEngine() if self.engine == "spacy" else None
+        # Optional trigram lookup for skill names the exact engines miss
+        self.fuzzy_enabled = settings.FUZZY_MATCHING if fuzzy is None else fuzzy
+        self.resolver = resolver
+    
+    @property
+    def taxonomy_version(self) -> str:
+        """Identifies the taxonomy so cached extraction results can be invalidated"""
+        return self.store.current.version
+    
+    @property
+    def cache_version(self) -> str:
+        """Taxonomy version, tagged with the engine and the stages that change results"""
+        version = self.store.current.version
+        if self.engine != "scanner":
+            version = f"{version}+{self.engine}"
+        if settings.SECTION_AWARE_EXTRACTION:
+            version = f"{version}+sections"
+        return f"{version}+fuzzy" if self.fuzzy_enabled else version
     
     def extract_skills(self, text: str) -> List[Dict]:
         """
@@ -88,22 +89,158 @@ class SkillExtractor:
         Returns:
             List of extracted skills with metadata
         """
+        taxonomy = self.store.current
+        text_lower = lower_preserving_offsets(text)
+        if self.phrase_engine is not None:
+            hits = self.phrase_engine.scan(taxonomy, text_lower)
+        else:
+            hits = taxonomy.scanner.scan_lower(text_lower)
+        return self._build_skills(taxonomy, text_lower, hits, sections=self._segment(text))
+    
+    def extract_skills_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[List[Dict]]:
+        """
+        Extract skills from many texts at once
+        
+        The spaCy engine tokenizes the texts through nlp.pipe in batches
+        (and n_process processes); the scanner handles them one by one.
+        
+        Returns:
+            Extracted skills per text, in input order
+        """
+        taxonomy = self.store.current
+        texts = list(texts)
+        lowers = [lower_preserving_offsets(text) for text in texts]
+        if self.phrase_engine is not None:
+            all_hits = self.phrase_engine.scan_many(taxonomy, lowers, batch_size, n_process)
+        else:
+            all_hits = (taxonomy.scanner.scan_lower(text_lower) for text_lower in lowers)
+        return [
+            self._build_skills(taxonomy, text_lower, hits, sections=self._segment(text))
+            for text, text_lower, hits in zip(texts, lowers, all_hits)
+        ]
+    
+    def extract_skills_from_pages(
+        self, pages: Iterable[Union[str, NormalizedText]]
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Extract skills while pages are still being produced
+        
+        Each page is scanned as soon as the iterator yields it, so a lazy
+        page parser overlaps extraction with parsing. The spaCy engine
+        matches the joined text once all pages are in.
+        
+        Args:
+            pages: Iterable of page texts, joined with single spaces. Pages
+                given as NormalizedText reuse their lowercase view, token
+                offsets and section headings instead of recomputing them.
+            
+        Returns:
+            Tuple of (full text, extracted skills)
+        """
+        taxonomy = self.store.current
+        session = taxonomy.scanner.session() if self.phrase_engine is None else None
+        parts = []
+        lower_parts = []
+        tokens: Optional[List[str]] = []
+        token_starts = array("I")
+        sections = SectionIndex() if settings.SECTION_AWARE_EXTRACTION else None
+        offset = 0
+        
+        for page in pages:
+            if isinstance(page, NormalizedText):
+                page_text, page_lower = page.text, page.lower
+                if tokens is not None:
+                    tokens.extend(page.tokens)
+                    token_starts.extend(start + offset for start in page.token_starts)
+            else:
+                page_text, page_lower = page, lower_preserving_offsets(page)
+                # Token offsets are only usable when every page provides them
+                tokens = None
+            if not page_text:
+                continue
+            if sections is not None:
+                # Sections run on across pages until the next heading
+                headings = page.sections if isinstance(page, NormalizedText) else find_headings(page_text)
+                for start, name in headings:
+                    sections.add(start + offset, name)
+            if session is not None:
+                if parts:
+                    session.feed(" ")
+                session.feed(page_lower)
+            parts.append(page_text)
+            lower_parts.append(page_lower)
+            offset += len(page_text) + 1
+        
+        text_lower = " ".join(lower_parts)
+        if session is not None:
+            hits = session.finish()
+        else:
+            hits = self.phrase_engine.scan(taxonomy, text_lower)
+        token_map = (tokens, token_starts) if tokens is not None else None
+        return " ".join(parts), self._build_skills(taxonomy, text_lower, hits, token_map, sections)
+    
+    def _segment(self, text: str) -> Optional[SectionIndex]:
+        """Section index of a text that still has its line breaks"""
+        return segment(text) if settings.SECTION_AWARE_EXTRACTION else None
+    
+    def _build_skills(
+        self,
+        taxonomy: CompiledTaxonomy,
+        text_lower: str,
+        hits: Dict[str, List[Tuple[int, int]]],
+        token_map: Optional[Tuple[List[str], array]] = None,
+        sections: Optional[SectionIndex] = None,
+    ) -> List[Dict]:
+        """
+        Turn scanner hits into skill records sorted by confidence
+        
+        With a non-empty section index, each mention is attributed to its
+        section by binary search: mentions are weighted by SECTION_WEIGHTS
+        for confidence, only those in LEVEL_SECTIONS are inspected for
+        level indicators, and the record lists the sections it appeared in.
+        """
+        if self.fuzzy_enabled:
+            hits = self._add_fuzzy_hits(taxonomy, text_lower, hits)
         found_skills = {}
         
-        for pattern, skill_data in self.patterns:
-            matches = pattern.findall(text)
+        for skill_lower, skill_data in taxonomy.all_skills.items():
+            matches = hits.get(skill_lower)
             if matches:
                 skill_name = skill_data["name"]
                 if skill_name not in found_skills:
-                    # Calculate confidence based on number of mentions
-                    confidence = min(0.5 + (len(matches) * 0.1), 1.0)
+                    if sections:
+                        mention_sections = [sections.section_at(start) for start, _ in matches]
+                        weight = sum(SECTION_WEIGHTS.get(name, 1.0) for name in mention_sections)
+                        level_spans = [
+                            span for span, name in zip(matches, mention_sections)
+                            if name in LEVEL_SECTIONS
+                        ]
+                    else:
+                        mention_sections = None
+                        weight = len(matches)
+                        level_spans = matches
+                    
+                    # Calculate confidence based on (weighted) number of mentions
+                    confidence = min(0.5 + (weight * 0.1), 1.0)
                     
                     found_skills[skill_name] = {
                         "name": skill_name,
                         "category": skill_data["category"],
-                        "level": self._estimate_level(text, skill_name),
+                        "level": (
+                            self._estimate_level(taxonomy, text_lower, level_spans, token_map)
+                            if level_spans else DEFAULT_LEVEL
+                        ),
                         "confidence": round(confidence, 2),
                     }
+                    if mention_sections:
+                        found_skills[skill_name]["sections"] = [
+                            name for name in dict.fromkeys(mention_sections) if name is not None
+                        ]
         
         # Sort by confidence
         skills_list = list(found_skills.values())
@@ -112,33 +249,69 @@ class SkillExtractor:
         logger.info(f"Extracted {len(skills_list)} skills from resume")
         return skills_list
     
-    def _estimate_level(self, text: str, skill: str) -> str:
-        """
-        Estimate skill level based on context clues
+    def _add_fuzzy_hits(
+        self,
+        taxonomy: CompiledTaxonomy,
+        text_lower: str,
+        hits: Dict[str, List[Tuple[int, int]]],
+    ) -> Dict[str, List[Tuple[int, int]]]:
+        """Merge in misspelled or respaced mentions found outside the exact hits"""
+        with metrics.stage("fuzzy"):
+            covered = [span for spans in hits.values() for span in spans]
+            fuzzy_hits = self.resolver.find(taxonomy, text_lower, covered)
+        if not fuzzy_hits:
+            return hits
+        merged = dict(hits)
+        for skill_lower, spans in fuzzy_hits.items():
+            merged[skill_lower] = sorted(merged.get(skill_lower, []) + spans)
+        return merged
+    
+    def _estimate_level(
+        self,
+        taxonomy: CompiledTaxonomy,
+        text_lower: str,
+        spans: List[Tuple[int, int]],
+        token_map: Optional[Tuple[List[str], array]] = None,
+    ) -> str:
         """
-        text_lower = text.lower()
-        skill_lower = skill.lower()
+        Estimate skill level based on context clues around each mention
         
-        # Check for expert/advanced indicators
-        expert_patterns = [
-            f"expert in {skill_lower}",
-            f"advanced {skill_lower}",
-            f"senior {skill_lower}",
-            f"lead {skill_lower}",
-            f"architect",
-        ]
-        for pattern in expert_patterns:
-            if pattern in text_lower:
-                return "advanced"
+        Args:
+            taxonomy: Compiled taxonomy providing the indicator phrases
+            text_lower: Lowercased resume text
+            spans: (start, end) offsets of the skill's mentions
+            token_map: Optional (tokens, token start offsets) of text_lower;
+                windows are then looked up by binary search instead of
+                re-splitting text around each mention
+            
+        Returns:
+            Strongest level indicated near any mention, or the default
+        """
+        best_rank = None
+        before_chars = LEVEL_WINDOW_TOKENS_BEFORE * LEVEL_WINDOW_CHARS_PER_TOKEN
+        after_chars = LEVEL_WINDOW_TOKENS_AFTER * LEVEL_WINDOW_CHARS_PER_TOKEN
         
-        # Check for intermediate indicators
-        intermediate_patterns = [
-            f"experience with {skill_lower}",
-            f"proficient in {skill_lower}",
-            f"worked with {skill_lower}",
-        ]
-        for pattern in intermediate_patterns:
-            if pattern in text_lower:
-                return "intermediate"
+        for start, end in spans:
+            if token_map is not None:
+                tokens, token_starts = token_map
+                first = bisect_right(token_starts, start) - 1
+                last = bisect_right(token_starts, end - 1) - 1
+                before = tokens[max(0, first - LEVEL_WINDOW_TOKENS_BEFORE):first]
+                after = tokens[last + 1:last + 1 + LEVEL_WINDOW_TOKENS_AFTER]
+            else:
+                before = text_lower[max(0, start - before_chars):start].split()
+                after = text_lower[end:end + after_chars].split()
+            window = " ".join(
+                before[-LEVEL_WINDOW_TOKENS_BEFORE:] + after[:LEVEL_WINDOW_TOKENS_AFTER]
+            )
+            
+            for phrase in taxonomy.level_scanner.scan_lower(window):
+                rank = taxonomy.level_rank[taxonomy.level_indicators[phrase]]
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+            if best_rank == 0:
+                break
         
-        return "intermediate"  # Default to intermediate
+        if best_rank is None:
+            return DEFAULT_LEVEL
+        return taxonomy.levels[best_rank]
@@ -4,7 +4,13 @@ Matches user skills against required skills using semantic similarity
 """
 
 import logging
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Set, Tuple
+
+from app.config import settings
+from app.nlp.fuzzy_index import FuzzySkillResolver, fuzzy_resolver
+from app.nlp.role_index import RoleIndex
+from app.nlp.taxonomy import CompiledTaxonomy, TaxonomyStore, taxonomy_store
 
 logger = logging.getLogger(__name__)
 
@@ -12,42 +18,85 @@ logger = logging.getLogger(__name__)
 class SkillMatcher:
     """Matches skills using exact and fuzzy matching"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        semantic: Optional[bool] = None,
+        store: TaxonomyStore = taxonomy_store,
+        fuzzy: Optional[bool] = None,
+        resolver: FuzzySkillResolver = fuzzy_resolver,
+    ):
         self.model = None
-        # Skill synonyms for fuzzy matching
-        self.synonyms = {
-            "javascript": ["js", "ecmascript", "es6", "es2015"],
-            "typescript": ["ts"],
-            "react": ["react.js", "reactjs"],
-            "vue": ["vue.js", "vuejs"],
-            "angular": ["angularjs", "angular.js"],
-            "node.js": ["nodejs", "node"],
-            "mongodb": ["mongo"],
-            "postgresql": ["postgres", "psql"],
-            "kubernetes": ["k8s"],
-            "amazon web services": ["aws"],
-            "google cloud platform": ["gcp", "google cloud"],
-            "machine learning": ["ml"],
-            "deep learning": ["dl"],
-            "natural language processing": ["nlp"],
-            "continuous integration": ["ci"],
-            "continuous deployment": ["cd"],
-            "ci/cd": ["cicd", "ci cd"],
-        }
-        
-        # Build reverse synonym map
-        self.reverse_synonyms = {}
-        for main_skill, alts in self.synonyms.items():
-            for alt in alts:
-                self.reverse_synonyms[alt] = main_skill
+        # Optional embedding-based matching for skills with no exact/synonym match
+        self.semantic_enabled = settings.SEMANTIC_MATCHING if semantic is None else semantic
+        self._semantic_index = None
+        self._semantic_version = None  # taxonomy version the semantic index was built for
+        self._semantic_lock = threading.Lock()
+        # Synonyms and role requirements come from the compiled taxonomy
+        self.store = store
+        # Optional trigram lookup for misspelled user skills ("Kubernets")
+        self.fuzzy_enabled = settings.FUZZY_MATCHING if fuzzy is None else fuzzy
+        self.resolver = resolver
+    
+    @property
+    def synonyms(self) -> Dict[str, List[str]]:
+        """Canonical skill -> alternative spellings"""
+        return self.store.current.synonyms
+    
+    @property
+    def reverse_synonyms(self) -> Dict[str, str]:
+        """Alternative spelling -> canonical skill"""
+        return self.store.current.reverse_synonyms
+    
+    @property
+    def role_index(self) -> RoleIndex:
+        """Precomputed role requirements of the active taxonomy"""
+        return self.store.current.role_index
+    
+    def _get_semantic_index(self, taxonomy: CompiledTaxonomy):
+        """Build the semantic index on first use (and per taxonomy version), disabling semantic mode if unavailable"""
+        if self._semantic_version != taxonomy.version and self.semantic_enabled:
+            with self._semantic_lock:
+                if self._semantic_version != taxonomy.version and self.semantic_enabled:
+                    try:
+                        from app.nlp.semantic_index import SemanticSkillIndex
+                        
+                        vocabulary = {
+                            taxonomy.normalize(skill)
+                            for skills in taxonomy.skill_patterns.values()
+                            for skill in skills
+                        }
+                        vocabulary.update(
+                            taxonomy.normalize(skill["name"])
+                            for role in taxonomy.roles.values()
+                            for skill in role["skills"]
+                        )
+                        self._semantic_index = SemanticSkillIndex(vocabulary)
+                        self._semantic_version = taxonomy.version
+                        self.model = self._semantic_index.model
+                    except ImportError:
+                        logger.warning("sentence-transformers not installed, semantic matching disabled")
+                        self.semantic_enabled = False
+                    except Exception as e:
+                        logger.error(f"Semantic index error: {e}")
+                        self.semantic_enabled = False
+        return self._semantic_index
+    
+    def _resolve_fuzzy(self, taxonomy: CompiledTaxonomy, user_skills: List[str]) -> List[str]:
+        """Replace user skills unknown to the taxonomy with their closest known spelling"""
+        if not self.fuzzy_enabled:
+            return user_skills
+        known = taxonomy.role_index.skill_ids
+        resolved = []
+        for skill in user_skills:
+            normalized = taxonomy.normalize(skill)
+            if normalized not in known and normalized not in taxonomy.all_skills:
+                skill = self.resolver.resolve(taxonomy, normalized) or skill
+            resolved.append(skill)
+        return resolved
     
     def _normalize_skill(self, skill: str) -> str:
         """Normalize skill name for comparison"""
-        normalized = skill.lower().strip()
-        # Check if it's a synonym
-        if normalized in self.reverse_synonyms:
-            return self.reverse_synonyms[normalized]
-        return normalized
+        return self.store.current.normalize(skill)
     
     def match_skills(
         self, 
@@ -64,9 +113,14 @@ class SkillMatcher:
         Returns:
             Dictionary with matched skills, gaps, and match score
         """
-        # Normalize all skills
-        user_normalized = {self._normalize_skill(s) for s in user_skills}
-        required_normalized = {self._normalize_skill(s) for s in required_skills}
+        taxonomy = self.store.current
+        normalize = taxonomy.normalize
+        user_skills = self._resolve_fuzzy(taxonomy, user_skills)
+        
+        # Normalize all skills (required ones once, keeping their original names)
+        user_normalized = {normalize(s) for s in user_skills}
+        required_pairs = [(s, normalize(s)) for s in required_skills]
+        required_normalized = {normalized for _, normalized in required_pairs}
         
         # Find exact and synonym matches
         matched = set()
@@ -77,6 +131,38 @@ class SkillMatcher:
         # Find gaps (required but not in user skills)
         gaps = required_normalized - matched
         
+        # Resolve remaining gaps by embedding similarity when enabled
+        semantic_matches = {}
+        if gaps and self.semantic_enabled:
+            index = self._get_semantic_index(taxonomy)
+            if index is not None:
+                semantic_matches = index.best_matches(
+                    sorted(user_normalized - matched),
+                    sorted(gaps),
+                    settings.SEMANTIC_THRESHOLD,
+                )
+                matched |= semantic_matches.keys()
+                gaps -= semantic_matches.keys()
+        
+        result = self._build_result(
+            taxonomy, user_skills, required_pairs, matched, gaps, semantic_matches
+        )
+        logger.info(f"Skill match: {result['totalMatched']}/{result['totalRequired']} = {result['score']:.1f}%")
+        return result
+    
+    def _build_result(
+        self,
+        taxonomy: CompiledTaxonomy,
+        user_skills: List[str],
+        required_pairs: List[Tuple[str, str]],
+        matched: Set[str],
+        gaps: Set[str],
+        semantic_matches: Dict[str, Tuple[str, float]],
+    ) -> Dict:
+        """Match result in original required-skill names from normalized matches and gaps"""
+        normalize = taxonomy.normalize
+        required_normalized = {normalized for _, normalized in required_pairs}
+        
         # Calculate match score
         if len(required_normalized) > 0:
             score = (len(matched) / len(required_normalized)) * 100
@@ -84,23 +170,126 @@ class SkillMatcher:
             score = 0
         
         # Find original skill names for matched and gaps
-        matched_original = self._get_original_names(matched, required_skills)
-        gaps_original = self._get_original_names(gaps, required_skills)
+        matched_original = [s for s, normalized in required_pairs if normalized in matched]
+        gaps_original = [s for s, normalized in required_pairs if normalized in gaps]
         
-        logger.info(f"Skill match: {len(matched)}/{len(required_normalized)} = {score:.1f}%")
-        
-        return {
+        result = {
             "matched": matched_original,
             "gaps": gaps_original,
             "score": round(score, 1),
             "totalRequired": len(required_normalized),
             "totalMatched": len(matched),
         }
+        if self.semantic_enabled:
+            user_originals = {normalize(s): s for s in user_skills}
+            result["semanticMatches"] = [
+                {
+                    "skill": original,
+                    "matchedBy": user_originals[semantic_matches[normalized][0]],
+                    "similarity": round(semantic_matches[normalized][1], 3),
+                }
+                for original, normalized in required_pairs
+                if normalized in semantic_matches
+            ]
+        return result
     
-    def _get_original_names(self, normalized_set: set, original_list: List[str]) -> List[str]:
-        """Get original skill names from normalized set"""
-        result = []
-        for original in original_list:
-            if self._normalize_skill(original) in normalized_set:
-                result.append(original)
+    def match_role(self, user_skills: List[str], role_id: str) -> Dict:
+        """
+        Match user skills against a known job role using the role index
+        
+        Args:
+            user_skills: List of user's skills
+            role_id: Job role identifier
+            
+        Returns:
+            Same result as match_skills; unknown roles score 0 with no gaps
+        """
+        taxonomy = self.store.current
+        role_index = taxonomy.role_index
+        role = role_index.roles.get(role_id)
+        if role is None:
+            return self.match_skills(user_skills, [])
+        if self.semantic_enabled:
+            return self.match_skills(user_skills, [name for name, _ in role["requirements"]])
+        
+        user_skills = self._resolve_fuzzy(taxonomy, user_skills)
+        result = role_index.match_role(role_id, role_index.user_mask(user_skills))
+        logger.info(f"Skill match ({role_id}): {result['totalMatched']}/{result['totalRequired']} = {result['score']:.1f}%")
         return result
+    
+    def match_all_roles(
+        self,
+        user_skills: List[str],
+        role_ids: Optional[List[str]] = None,
+        top: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Score user skills against every job role (or a subset) in one call
+        
+        Args:
+            user_skills: List of user's skills
+            role_ids: Restrict ranking to these roles
+            top: Return only the best N roles
+            
+        Returns:
+            Match results with "role" and "label", best score first
+        """
+        taxonomy = self.store.current
+        role_index = taxonomy.role_index
+        user_skills = self._resolve_fuzzy(taxonomy, user_skills)
+        index = self._get_semantic_index(taxonomy) if self.semantic_enabled else None
+        if index is None:
+            return role_index.score_all(role_index.user_skill_ids(user_skills), role_ids, top)
+        
+        # Exact matches per role first, then every remaining gap of every
+        # role is scored against the user's skills in one matrix multiply
+        wanted = set(role_ids) if role_ids is not None else None
+        user_normalized = sorted({taxonomy.normalize(s) for s in user_skills})
+        user_columns = {skill: column for column, skill in enumerate(user_normalized)}
+        selected = []
+        all_gaps: Dict[str, int] = {}
+        for role_id, role in role_index.roles.items():
+            if wanted is not None and role_id not in wanted:
+                continue
+            required_pairs = [
+                (name, role_index.skill_names[skill_id]) for name, skill_id in role["requirements"]
+            ]
+            required = {normalized for _, normalized in required_pairs}
+            matched = required & user_columns.keys()
+            gaps = required - matched
+            for gap in sorted(gaps):
+                all_gaps.setdefault(gap, len(all_gaps))
+            selected.append((role_id, role, required_pairs, matched, gaps))
+        
+        gap_names = list(all_gaps)
+        similarities = (
+            index.similarities(gap_names, user_normalized) if gap_names and user_normalized else None
+        )
+        
+        results = []
+        for role_id, role, required_pairs, matched, gaps in selected:
+            semantic_matches = {}
+            candidates = [skill for skill in user_normalized if skill not in matched]
+            if similarities is not None and gaps and candidates:
+                gap_list = sorted(gaps)
+                rows = similarities[[all_gaps[gap] for gap in gap_list]]
+                semantic_matches = index.pick_best(
+                    rows[:, [user_columns[skill] for skill in candidates]],
+                    gap_list,
+                    candidates,
+                    settings.SEMANTIC_THRESHOLD,
+                )
+            result = self._build_result(
+                taxonomy,
+                user_skills,
+                required_pairs,
+                matched | semantic_matches.keys(),
+                gaps - semantic_matches.keys(),
+                semantic_matches,
+            )
+            result["role"] = role_id
+            result["label"] = role["label"]
+            results.append(result)
+        # Stable sort keeps taxonomy role order between equal scores, like score_all
+        results.sort(key=lambda r: r["score"], reverse=True)
+        return results[:top] if top is not None else results
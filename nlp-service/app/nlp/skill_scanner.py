@@ -0,0 +1,177 @@
+"""
+Skill Scanner
+Single-pass multi-pattern matcher (Aho-Corasick) for skill names
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from app.utils.text import is_word_char, lower_preserving_offsets
+
+
+class SkillScanner:
+    """
+    Finds every occurrence of a set of keywords in one traversal of the text
+
+    Keywords are matched case-insensitively. A keyword edge that is a word
+    character must sit on a word boundary (like ``\\b`` in a regex), while
+    edges made of symbols do not, so "C++", "C#", ".NET" and "CI/CD" are
+    matched as written (the text normalizer keeps those symbols).
+    Overlapping hits are all reported, e.g. both "Spring" and "Spring Boot"
+    inside "Spring Boot".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._needs_start_boundary: List[bool] = []
+        self._needs_end_boundary: List[bool] = []
+
+        # Trie: per-state transitions, failure links and matched keyword ids
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for keyword in keywords:
+            key = keyword.lower()
+            if not key or key in self.keywords:
+                continue
+            keyword_id = len(self.keywords)
+            self.keywords.append(key)
+            self._needs_start_boundary.append(is_word_char(key[0]))
+            self._needs_end_boundary.append(is_word_char(key[-1]))
+
+            state = 0
+            for ch in key:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword_id)
+
+        # Breadth-first pass to compute failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(ids) for ids in outputs]
+
+    def scan(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Scan text once and collect keyword hits
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of lowercased keyword to ``(start, end)`` offsets of
+            every hit, in order of appearance
+        """
+        return self.scan_lower(lower_preserving_offsets(text))
+
+    def scan_lower(self, text_lower: str) -> Dict[str, List[Tuple[int, int]]]:
+        """Scan text that the caller has already lowercased"""
+        session = ScanSession(self)
+        session.feed(text_lower)
+        return session.finish()
+
+    def session(self) -> "ScanSession":
+        """Start an incremental scan that is fed one chunk at a time"""
+        return ScanSession(self)
+
+
+class ScanSession:
+    """
+    Incremental scan over text that arrives in chunks (e.g. PDF pages)
+
+    The automaton state carries over between chunks, so keywords spanning
+    a chunk boundary are still found and offsets are relative to the
+    concatenation of every chunk fed so far.
+    """
+
+    def __init__(self, scanner: SkillScanner):
+        self.scanner = scanner
+        self.hits: Dict[str, List[Tuple[int, int]]] = {}
+        self._state = 0
+        self._offset = 0
+        # Enough trailing text to check the boundary before any keyword
+        self._tail_size = max((len(k) for k in scanner.keywords), default=0) + 1
+        self._tail = ""
+        # Hits ending at a chunk edge wait for the next character
+        self._pending: List[Tuple[str, int, int]] = []
+
+    def feed(self, chunk_lower: str) -> None:
+        """Scan the next lowercased chunk"""
+        if not chunk_lower:
+            return
+
+        scanner = self.scanner
+        goto = scanner._goto
+        fail = scanner._fail
+        output = scanner._output
+        keywords = scanner.keywords
+        needs_start = scanner._needs_start_boundary
+        needs_end = scanner._needs_end_boundary
+        hits = self.hits
+        base = self._offset
+        tail = self._tail
+        length = len(chunk_lower)
+
+        if self._pending:
+            first_is_word = is_word_char(chunk_lower[0])
+            for keyword, start, end in self._pending:
+                if not first_is_word:
+                    hits.setdefault(keyword, []).append((start, end))
+            self._pending = []
+
+        state = self._state
+        for index, ch in enumerate(chunk_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+
+            end = index + 1
+            for keyword_id in output[state]:
+                keyword = keywords[keyword_id]
+                start = end - len(keyword)
+                if needs_start[keyword_id]:
+                    if start > 0:
+                        before = chunk_lower[start - 1]
+                    elif base + start > 0:
+                        before = tail[start - 1]
+                    else:
+                        before = ""
+                    if before and is_word_char(before):
+                        continue
+                if needs_end[keyword_id]:
+                    if end == length:
+                        self._pending.append((keyword, base + start, base + end))
+                        continue
+                    if is_word_char(chunk_lower[end]):
+                        continue
+                hits.setdefault(keyword, []).append((base + start, base + end))
+
+        self._state = state
+        self._offset = base + length
+        self._tail = (tail + chunk_lower)[-self._tail_size:]
+
+    def finish(self) -> Dict[str, List[Tuple[int, int]]]:
+        """End the scan and return every hit, in order of appearance"""
+        for keyword, start, end in self._pending:
+            self.hits.setdefault(keyword, []).append((start, end))
+        self._pending = []
+        return self.hits
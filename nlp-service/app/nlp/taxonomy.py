@@ -0,0 +1,287 @@
+"""
+Skill Taxonomy
+Compiles the skill, synonym and role data files into a hot-swappable artifact
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.nlp.fuzzy_index import MIN_FREE_TEXT_SYNONYM_LENGTH, FuzzySkillIndex
+from app.nlp.role_index import RoleIndex
+from app.nlp.skill_scanner import SkillScanner
+
+logger = logging.getLogger(__name__)
+
+# Data files bundled with the service, used when TAXONOMY_DIR is not set
+DEFAULT_TAXONOMY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "taxonomy"
+)
+TAXONOMY_FILES = ("skills.json", "synonyms.json", "roles.json")
+
+# Bump when the artifact file layout (header, pickling) changes; changes to
+# the compiled classes are caught by code_fingerprint()
+ARTIFACT_FORMAT = 2
+
+# Modules whose classes are pickled into the artifact or shape its contents
+ARTIFACT_CODE_MODULES = (
+    __name__,
+    SkillScanner.__module__,
+    FuzzySkillIndex.__module__,
+    RoleIndex.__module__,
+    "app.utils.text",
+)
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """Hash of the source of ARTIFACT_CODE_MODULES, stored in the artifact header"""
+    digest = hashlib.sha1()
+    for module_name in ARTIFACT_CODE_MODULES:
+        with open(sys.modules[module_name].__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class CompiledTaxonomy:
+    """
+    Everything derived from one version of the taxonomy data files
+
+    Built once (or unpickled from the artifact) and never mutated, so a
+    request that grabbed a reference keeps a consistent view even if a
+    reload swaps in a newer taxonomy meanwhile.
+    """
+
+    def __init__(self, version: str, sources: Dict[str, Dict]):
+        self.version = version
+        self.compiled_at = time.time()
+        self.source_versions = {
+            name: data.get("version") for name, data in sources.items()
+        }
+
+        skills = sources["skills.json"]
+        self.skill_patterns: Dict[str, List[str]] = skills["categories"]
+        self.synonyms: Dict[str, List[str]] = sources["synonyms.json"]["synonyms"]
+        self.roles: Dict[str, Dict] = sources["roles.json"]["roles"]
+
+        # Flat skill list for matching
+        self.all_skills: Dict[str, Dict] = {}
+        for category, names in self.skill_patterns.items():
+            for skill in names:
+                self.all_skills[skill.lower()] = {
+                    "name": skill,
+                    "category": category,
+                }
+
+        # One automaton over all skill names so the text is scanned once
+        self.scanner = SkillScanner(self.all_skills.keys())
+
+        # Indicator phrases, checked in order of precedence
+        self.levels: List[str] = list(skills["level_indicators"])
+        self.level_rank = {level: rank for rank, level in enumerate(self.levels)}
+        self.level_indicators: Dict[str, str] = {}
+        for level, phrases in skills["level_indicators"].items():
+            for phrase in phrases:
+                self.level_indicators.setdefault(phrase, level)
+        self.level_scanner = SkillScanner(self.level_indicators.keys())
+
+        self.reverse_synonyms: Dict[str, str] = {}
+        for main_skill, alts in self.synonyms.items():
+            for alt in alts:
+                self.reverse_synonyms[alt] = main_skill
+
+        # Trigram index for misspelled or respaced names (skill names win over
+        # synonyms). A synonym group points at its member that is a skill
+        # ("amazon web services" -> "aws"); groups without one are left out,
+        # as their hits would have no skill to report.
+        fuzzy_names = {name: name for name in self.all_skills}
+        named_only = set()
+        for main_skill, alts in self.synonyms.items():
+            group = [main_skill, *alts]
+            target = next((name for name in group if name in self.all_skills), None)
+            if target is None:
+                continue
+            for name in group:
+                fuzzy_names.setdefault(name, target)
+                # Short plain-word synonyms ("node", "mongo") are too common in prose
+                if name not in self.all_skills and name.isalpha() and len(name) < MIN_FREE_TEXT_SYNONYM_LENGTH:
+                    named_only.add(name)
+        self.fuzzy_index = FuzzySkillIndex(fuzzy_names, named_only)
+
+        self.role_index = RoleIndex(self.roles, self.normalize)
+
+    def normalize(self, skill: str) -> str:
+        """Normalize a skill name for comparison, resolving synonyms"""
+        normalized = skill.lower().strip()
+        return self.reverse_synonyms.get(normalized, normalized)
+
+    def describe(self) -> Dict:
+        """Summary for the health endpoint"""
+        return {
+            "version": self.version,
+            "sources": self.source_versions,
+            "compiled_at": self.compiled_at,
+            "skills": len(self.all_skills),
+            "synonyms": len(self.reverse_synonyms),
+            "roles": len(self.roles),
+        }
+
+
+class TaxonomyStore:
+    """
+    Holds the current CompiledTaxonomy and swaps it on reload
+
+    The compiled taxonomy is cached as a pickle next to the other runtime
+    data, keyed by a hash of the source files, so workers starting against
+    unchanged data load it instead of rebuilding every automaton. A reload
+    compiles the new taxonomy fully before replacing the single reference
+    readers use; in-flight requests finish on the taxonomy they started with.
+    """
+
+    def __init__(self, source_dir: str, artifact_path: Optional[str] = None):
+        self.source_dir = source_dir
+        self.artifact_path = artifact_path
+        self._current: Optional[CompiledTaxonomy] = None
+        self._stamp: Optional[Tuple] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[CompiledTaxonomy], None]] = []
+
+    @property
+    def current(self) -> CompiledTaxonomy:
+        """The active taxonomy, loaded on first use"""
+        taxonomy = self._current
+        if taxonomy is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = self._load()
+                taxonomy = self._current
+        return taxonomy
+
+    @property
+    def version(self) -> str:
+        """Version of the active taxonomy (content hash of its data files)"""
+        return self.current.version
+
+    def add_listener(self, listener: Callable[[CompiledTaxonomy], None]) -> None:
+        """Call listener with the new taxonomy whenever a reload changes it"""
+        self._listeners.append(listener)
+
+    def reload(self) -> bool:
+        """
+        Re-read the data files and swap in the result
+
+        Returns:
+            True if the taxonomy version changed
+        """
+        with self._lock:
+            previous = self._current
+            taxonomy = self._load()
+            self._current = taxonomy
+
+        changed = previous is None or previous.version != taxonomy.version
+        if changed:
+            logger.info(f"Taxonomy reloaded: version {taxonomy.version}")
+            for listener in self._listeners:
+                try:
+                    listener(taxonomy)
+                except Exception as e:
+                    logger.error(f"Taxonomy reload listener error: {e}")
+        return changed
+
+    def reload_if_changed(self) -> bool:
+        """Reload only when a data file's size or mtime changed since the last load"""
+        if self._current is not None and self._source_stamp() == self._stamp:
+            return False
+        return self.reload()
+
+    def _source_stamp(self) -> Tuple:
+        stamp = []
+        for name in TAXONOMY_FILES:
+            try:
+                stat = os.stat(os.path.join(self.source_dir, name))
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _load(self) -> CompiledTaxonomy:
+        """Read the sources and return the matching artifact, compiling it if needed"""
+        stamp = self._source_stamp()
+        raw = {}
+        for name in TAXONOMY_FILES:
+            with open(os.path.join(self.source_dir, name), "rb") as f:
+                raw[name] = f.read()
+
+        digest = hashlib.sha1()
+        for name in TAXONOMY_FILES:
+            digest.update(name.encode())
+            digest.update(raw[name])
+        version = digest.hexdigest()[:12]
+
+        taxonomy = self._read_artifact(version)
+        if taxonomy is None:
+            sources = {name: json.loads(data) for name, data in raw.items()}
+            taxonomy = CompiledTaxonomy(version, sources)
+            self._write_artifact(taxonomy)
+            logger.info(f"Taxonomy compiled: version {version}")
+
+        self._stamp = stamp
+        return taxonomy
+
+    def _read_artifact(self, version: str) -> Optional[CompiledTaxonomy]:
+        if not self.artifact_path or not os.path.exists(self.artifact_path):
+            return None
+        try:
+            with open(self.artifact_path, "rb") as f:
+                # Header line lets a stale artifact be skipped without unpickling it
+                header = json.loads(f.readline())
+                if (
+                    header.get("format") != ARTIFACT_FORMAT
+                    or header.get("version") != version
+                    or header.get("code") != code_fingerprint()
+                ):
+                    return None
+                taxonomy = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable taxonomy artifact: {e}")
+            return None
+        logger.info(f"Taxonomy loaded from artifact: version {version}")
+        return taxonomy
+
+    def _write_artifact(self, taxonomy: CompiledTaxonomy) -> None:
+        if not self.artifact_path:
+            return
+        directory = os.path.dirname(self.artifact_path) or "."
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Written aside and renamed so concurrent workers never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".taxonomy-")
+            with os.fdopen(fd, "wb") as f:
+                header = {
+                    "format": ARTIFACT_FORMAT,
+                    "version": taxonomy.version,
+                    "code": code_fingerprint(),
+                }
+                f.write(json.dumps(header).encode() + b"\n")
+                pickle.dump(taxonomy, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.artifact_path)
+        except OSError as e:
+            logger.error(f"Taxonomy artifact write error: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+taxonomy_store = TaxonomyStore(
+    settings.TAXONOMY_DIR or DEFAULT_TAXONOMY_DIR,
+    settings.TAXONOMY_ARTIFACT_PATH,
+)
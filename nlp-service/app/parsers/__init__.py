@@ -3,5 +3,27 @@ Parsers package initialization
 """
 
 from app.parsers.resume_parser import ResumeParser
+from app.parsers.buffers import buffer_stream, map_file
+from app.parsers.archive_parser import is_archive, extract_archive
+from app.parsers.pdf_backends import (
+    PdfBackend,
+    register_backend,
+    available_backends,
+    select_backends,
+)
+from app.parsers.text_normalizer import TextNormalizer, NormalizedText, text_normalizer
 
-__all__ = ["ResumeParser"]
+__all__ = [
+    "ResumeParser",
+    "is_archive",
+    "extract_archive",
+    "buffer_stream",
+    "map_file",
+    "PdfBackend",
+    "register_backend",
+    "available_backends",
+    "select_backends",
+    "TextNormalizer",
+    "NormalizedText",
+    "text_normalizer",
+]
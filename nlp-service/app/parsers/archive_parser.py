@@ -0,0 +1,128 @@
+"""
+Archive Parser
+Expands zip/tar uploads into individual resume files
+"""
+
+import io
+import logging
+import tarfile
+import zipfile
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ZIP_EXTENSIONS = (".zip",)
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+def is_archive(filename: str) -> bool:
+    """Check whether an uploaded file name refers to a supported archive"""
+    name = (filename or "").lower()
+    return name.endswith(ZIP_EXTENSIONS) or name.endswith(TAR_EXTENSIONS)
+
+
+def _is_hidden(path: str) -> bool:
+    """Skip OS metadata such as __MACOSX/ folders and dotfiles"""
+    return any(part.startswith((".", "__MACOSX")) for part in path.split("/"))
+
+
+class ArchiveTooLargeError(ValueError):
+    """Raised when an archive's members add up to more than the allowed size"""
+
+    def __init__(self, max_total_size: int):
+        super().__init__(f"Archive contents exceed {max_total_size} bytes uncompressed")
+        self.max_total_size = max_total_size
+
+
+def iter_archive_members(
+    filename: str,
+    file_bytes: Union[bytes, BinaryIO],
+    max_files: int,
+    max_member_size: int,
+    max_total_size: Optional[int] = None,
+) -> Iterator[Tuple[str, int, BinaryIO]]:
+    """
+    Yield the regular files of a zip or tar archive as streams
+
+    Each stream is only valid until the next member is requested, so
+    callers copy it (to a temp file) rather than collect the streams.
+
+    Args:
+        filename: Uploaded archive name, used to pick the format
+        file_bytes: Raw archive bytes, or a seekable binary stream
+        max_files: Maximum number of members to yield
+        max_member_size: Members larger than this (uncompressed) are skipped
+        max_total_size: Limit on the members' combined uncompressed size
+
+    Yields:
+        (member name, uncompressed size, member stream)
+
+    Raises:
+        ArchiveTooLargeError: The members yielded so far plus the next one
+            exceed max_total_size
+    """
+    name = filename.lower()
+    source = io.BytesIO(file_bytes) if isinstance(file_bytes, bytes) else file_bytes
+    count = 0
+    total = 0
+
+    def admit(member_name: str, size: int) -> bool:
+        nonlocal total
+        if size > max_member_size:
+            logger.warning(f"Skipping oversized archive member: {member_name}")
+            return False
+        total += size
+        if max_total_size is not None and total > max_total_size:
+            raise ArchiveTooLargeError(max_total_size)
+        return True
+
+    if name.endswith(ZIP_EXTENSIONS):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or _is_hidden(info.filename):
+                    continue
+                if not admit(info.filename, info.file_size):
+                    continue
+                # zipfile stops reading at the declared size and checks the CRC
+                with archive.open(info) as member:
+                    yield info.filename, info.file_size, member
+                count += 1
+                if count >= max_files:
+                    break
+    else:
+        with tarfile.open(fileobj=source, mode="r:*") as archive:
+            for info in archive:
+                if not info.isfile() or _is_hidden(info.name):
+                    continue
+                if not admit(info.name, info.size):
+                    continue
+                member = archive.extractfile(info)
+                if member is None:
+                    continue
+                yield info.name, info.size, member
+                count += 1
+                if count >= max_files:
+                    break
+
+
+def extract_archive(
+    filename: str,
+    file_bytes: Union[bytes, BinaryIO],
+    max_files: int,
+    max_member_size: int,
+    max_total_size: Optional[int] = None,
+) -> List[Tuple[str, bytes]]:
+    """
+    Read the regular files contained in a zip or tar archive into memory
+
+    Prefer iter_archive_members for uploads; this holds every member at once.
+
+    Returns:
+        List of (member name, member bytes)
+    """
+    return [
+        (member_name, member.read())
+        for member_name, _, member in iter_archive_members(
+            filename, file_bytes, max_files, max_member_size, max_total_size
+        )
+    ]
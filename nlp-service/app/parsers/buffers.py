@@ -0,0 +1,79 @@
+"""
+Document Buffers
+Read-only streams over in-memory or memory-mapped documents
+"""
+
+import io
+import logging
+import mmap
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+# Raw bytes, or an mmap of a spooled upload; both support len(), slicing and re
+DocumentBuffer = Union[bytes, mmap.mmap]
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable stream over a buffer with its own read position
+
+    Parsers that open the same document twice (primary and fallback PDF
+    backends) each get an independent position, and reads copy only the
+    requested range instead of the whole buffer.
+    """
+
+    def __init__(self, buffer: DocumentBuffer):
+        self._buffer = buffer
+        self._size = len(buffer)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        end = min(self._pos + len(b), self._size)
+        n = max(end - self._pos, 0)
+        b[:n] = self._buffer[self._pos:end]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def buffer_stream(buffer: DocumentBuffer) -> BinaryIO:
+    """Open a document buffer as a binary stream without copying it"""
+    if isinstance(buffer, bytes):
+        # BytesIO shares an immutable bytes object until it is written to
+        return io.BytesIO(buffer)
+    return io.BufferedReader(BufferReader(buffer))
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[mmap.mmap]:
+    """Memory-map a spooled upload read-only for the duration of a parse"""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield buffer
+    finally:
+        try:
+            buffer.close()
+        except BufferError:
+            # A parser still holds a view; the mapping goes away with it
+            logger.debug(f"Deferred unmapping of {path}")
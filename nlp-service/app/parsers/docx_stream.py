@@ -0,0 +1,125 @@
+"""
+DOCX Stream Parser
+Reads DOCX text straight from the zip with an incremental XML parser
+"""
+
+import re
+import zipfile
+from typing import IO, Iterator, List
+from xml.etree.ElementTree import iterparse
+
+from app.parsers.buffers import DocumentBuffer, buffer_stream
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+DOCUMENT_PART = "word/document.xml"
+HEADER_PART = re.compile(r"word/header\d*\.xml")
+FOOTER_PART = re.compile(r"word/footer\d*\.xml")
+
+PARAGRAPH = W + "p"
+TEXT = W + "t"
+# Elements containing a part's top-level blocks; their finished children are dropped
+CONTAINERS = {W + "body", W + "hdr", W + "ftr"}
+# Run content that stands for a character
+RUN_CHARACTERS = {
+    W + "tab": "\t",
+    W + "br": "\n",
+    W + "cr": "\n",
+    W + "noBreakHyphen": "-",
+}
+
+
+def _part_number(name: str) -> int:
+    digits = re.sub(r"\D", "", name)
+    return int(digits) if digits else 0
+
+
+def iter_part_paragraphs(stream: IO[bytes]) -> Iterator[str]:
+    """
+    Yield the non-empty paragraphs of one WordprocessingML part in order
+
+    Table cells are paragraphs like any other, so tables come out where
+    they are in the document, each cell once (merged cells are a single
+    element). Paragraphs in text boxes are yielded before the paragraph
+    anchoring them; the legacy copy of a text box (mc:Fallback) is
+    skipped. Finished elements are cleared so memory does not grow with
+    the document.
+    """
+    # Open paragraphs; text boxes nest paragraphs inside paragraphs
+    paragraphs: List[List[str]] = []
+    fallback_depth = 0
+    depth = 0
+    container_depth = None
+    container = None
+
+    for event, element in iterparse(stream, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            depth += 1
+            if tag == MC_FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == PARAGRAPH:
+                paragraphs.append([])
+            elif container is None and tag in CONTAINERS:
+                container, container_depth = element, depth
+            continue
+
+        depth -= 1
+        if tag == MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            continue
+        elif tag == TEXT:
+            if paragraphs and element.text:
+                paragraphs[-1].append(element.text)
+        elif tag in RUN_CHARACTERS:
+            if paragraphs:
+                paragraphs[-1].append(RUN_CHARACTERS[tag])
+        elif tag == PARAGRAPH:
+            text = "".join(paragraphs.pop())
+            element.clear()
+            if text.strip():
+                yield text
+
+        if container is not None and depth == container_depth:
+            # A top-level block (paragraph, table) is done
+            container.clear()
+
+
+def iter_docx_paragraphs(file_bytes: DocumentBuffer) -> Iterator[str]:
+    """
+    Yield the paragraphs of the headers, the body and then the footers
+
+    Parts are decompressed and parsed incrementally. Header and footer
+    parts whose text repeats an earlier one (first-page or even-page
+    variants) are skipped.
+
+    Raises:
+        zipfile.BadZipFile, KeyError, xml.etree.ElementTree.ParseError:
+            The file is not a readable DOCX
+    """
+    with zipfile.ZipFile(buffer_stream(file_bytes)) as archive:
+        names = archive.namelist()
+        if DOCUMENT_PART not in names:
+            raise KeyError(f"{DOCUMENT_PART} not found in the archive")
+        headers = sorted((n for n in names if HEADER_PART.fullmatch(n)), key=_part_number)
+        footers = sorted((n for n in names if FOOTER_PART.fullmatch(n)), key=_part_number)
+
+        seen = set()
+        for name in headers + [DOCUMENT_PART] + footers:
+            with archive.open(name) as part:
+                if name == DOCUMENT_PART:
+                    yield from iter_part_paragraphs(part)
+                    continue
+                lines = tuple(iter_part_paragraphs(part))
+            if lines and lines not in seen:
+                seen.add(lines)
+                yield from lines
+
+
+def extract_docx_text(file_bytes: DocumentBuffer) -> str:
+    """DOCX text, one paragraph per line, in document order"""
+    return "\n".join(iter_docx_paragraphs(file_bytes))
@@ -0,0 +1,238 @@
+"""
+PDF Backends
+Registry of interchangeable PDF text extraction backends
+"""
+
+import importlib.util
+import io
+import logging
+import re
+from typing import Dict, List, Optional, Tuple, Type
+
+from app.config import settings
+from app.parsers.buffers import DocumentBuffer, buffer_stream
+
+logger = logging.getLogger(__name__)
+
+# Backend preference when speed matters (plain text-layer documents)
+FAST_ORDER = ["pymupdf", "pypdf", "pdfminer", "pdfplumber"]
+# Backend preference when layout handling matters (unusual or image-heavy documents)
+LAYOUT_ORDER = ["pymupdf", "pdfplumber", "pdfminer", "pypdf"]
+
+PAGE_MARKER = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+# Fonts, or object streams that may hide them; searched with re so mmaps work too
+TEXT_LAYER_MARKER = re.compile(rb"/Font|/ObjStm")
+
+
+class PdfDocument:
+    """An opened PDF that extracts text one page at a time"""
+
+    page_count: int = 0
+
+    def extract_page(self, index: int) -> Optional[str]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PdfBackend:
+    """Base class for PDF backends; subclasses register themselves by name"""
+
+    name = ""
+    modules: Tuple[str, ...] = ()
+    _available: Optional[bool] = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check (once) whether any of the backend's modules can be imported"""
+        if cls._available is None:
+            cls._available = any(importlib.util.find_spec(module) for module in cls.modules)
+        return cls._available
+
+    def open(self, file_bytes: DocumentBuffer) -> PdfDocument:
+        raise NotImplementedError
+
+
+PDF_BACKENDS: Dict[str, Type[PdfBackend]] = {}
+
+
+def register_backend(backend: Type[PdfBackend]) -> Type[PdfBackend]:
+    """Class decorator adding a backend to the registry"""
+    PDF_BACKENDS[backend.name] = backend
+    return backend
+
+
+@register_backend
+class PdfplumberBackend(PdfBackend):
+    """pdfplumber: slowest, but keeps layout of complex pages"""
+
+    name = "pdfplumber"
+    modules = ("pdfplumber",)
+
+    class Document(PdfDocument):
+        def __init__(self, file_bytes: DocumentBuffer):
+            import pdfplumber
+            self.pdf = pdfplumber.open(buffer_stream(file_bytes))
+            self.page_count = len(self.pdf.pages)
+
+        def extract_page(self, index: int) -> Optional[str]:
+            page = self.pdf.pages[index]
+            text = page.extract_text()
+            # Release per-page layout objects before moving on
+            page.flush_cache()
+            return text
+
+        def close(self) -> None:
+            self.pdf.close()
+
+    def open(self, file_bytes: DocumentBuffer) -> PdfDocument:
+        return self.Document(file_bytes)
+
+
+@register_backend
+class PypdfBackend(PdfBackend):
+    """pypdf (or its predecessor PyPDF2): fast pure-Python text extraction"""
+
+    name = "pypdf"
+    modules = ("pypdf", "PyPDF2")
+
+    class Document(PdfDocument):
+        def __init__(self, file_bytes: DocumentBuffer):
+            try:
+                from pypdf import PdfReader
+            except ImportError:
+                from PyPDF2 import PdfReader
+            self.reader = PdfReader(buffer_stream(file_bytes))
+            self.page_count = len(self.reader.pages)
+
+        def extract_page(self, index: int) -> Optional[str]:
+            return self.reader.pages[index].extract_text()
+
+    def open(self, file_bytes: DocumentBuffer) -> PdfDocument:
+        return self.Document(file_bytes)
+
+
+@register_backend
+class PdfminerBackend(PdfBackend):
+    """pdfminer.six low-level API, skipping pdfplumber's object model"""
+
+    name = "pdfminer"
+    modules = ("pdfminer",)
+
+    class Document(PdfDocument):
+        def __init__(self, file_bytes: DocumentBuffer):
+            from pdfminer.pdfdocument import PDFDocument
+            from pdfminer.pdfinterp import PDFResourceManager
+            from pdfminer.pdfpage import PDFPage
+            from pdfminer.pdfparser import PDFParser
+
+            parser = PDFParser(buffer_stream(file_bytes))
+            self.pages = list(PDFPage.create_pages(PDFDocument(parser)))
+            self.page_count = len(self.pages)
+            self.resources = PDFResourceManager(caching=True)
+
+        def extract_page(self, index: int) -> Optional[str]:
+            from pdfminer.converter import TextConverter
+            from pdfminer.layout import LAParams
+            from pdfminer.pdfinterp import PDFPageInterpreter
+
+            output = io.StringIO()
+            device = TextConverter(self.resources, output, laparams=LAParams())
+            try:
+                PDFPageInterpreter(self.resources, device).process_page(self.pages[index])
+            finally:
+                device.close()
+            return output.getvalue()
+
+    def open(self, file_bytes: DocumentBuffer) -> PdfDocument:
+        return self.Document(file_bytes)
+
+
+@register_backend
+class PymupdfBackend(PdfBackend):
+    """PyMuPDF (MuPDF bindings): fastest option when installed"""
+
+    name = "pymupdf"
+    modules = ("fitz",)
+
+    class Document(PdfDocument):
+        def __init__(self, file_bytes: DocumentBuffer):
+            import fitz
+            # MuPDF wants a bytes-like stream it can keep; mmaps are copied once
+            stream = file_bytes if isinstance(file_bytes, bytes) else file_bytes[:]
+            self.doc = fitz.open(stream=stream, filetype="pdf")
+            self.page_count = self.doc.page_count
+
+        def extract_page(self, index: int) -> Optional[str]:
+            return self.doc.load_page(index).get_text()
+
+        def close(self) -> None:
+            self.doc.close()
+
+    def open(self, file_bytes: DocumentBuffer) -> PdfDocument:
+        return self.Document(file_bytes)
+
+
+def available_backends() -> List[str]:
+    """Names of registered backends whose libraries are installed"""
+    return [name for name, backend in PDF_BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name: str) -> PdfBackend:
+    """Instantiate a registered backend by name"""
+    backend = PDF_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown PDF backend: {name}")
+    return backend()
+
+
+def inspect_pdf(file_bytes: DocumentBuffer) -> Dict:
+    """
+    Cheap document traits read from the raw bytes, without parsing
+
+    Page objects and fonts stored in compressed object streams are not
+    visible here, so such documents count as having a text layer and at
+    least one page.
+    """
+    return {
+        "size": len(file_bytes),
+        "page_estimate": max(len(PAGE_MARKER.findall(file_bytes)), 1),
+        "has_text_layer": TEXT_LAYER_MARKER.search(file_bytes) is not None,
+    }
+
+
+def _first_available(order: List[str], exclude: Optional[str] = None) -> Optional[str]:
+    available = set(available_backends())
+    for name in order:
+        if name in available and name != exclude:
+            return name
+    return None
+
+
+def select_backends(file_bytes: DocumentBuffer) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Pick the primary and per-page fallback backends for a document
+
+    PDF_BACKEND / PDF_FALLBACK_BACKEND name a backend explicitly; "auto"
+    picks by document traits. Text-layer documents, and anything large,
+    use the fastest backend. Documents without a detectable text layer
+    start with the layout-aware order.
+    """
+    traits = inspect_pdf(file_bytes)
+    large = (
+        traits["page_estimate"] > settings.PDF_AUTO_FAST_MIN_PAGES
+        or traits["size"] > settings.PDF_AUTO_FAST_MIN_BYTES
+    )
+    order = FAST_ORDER if traits["has_text_layer"] or large else LAYOUT_ORDER
+
+    primary = settings.PDF_BACKEND
+    if primary == "auto":
+        primary = _first_available(order)
+
+    fallback = settings.PDF_FALLBACK_BACKEND
+    if fallback == "auto":
+        fallback_order = LAYOUT_ORDER if order is FAST_ORDER else FAST_ORDER
+        fallback = _first_available(fallback_order, exclude=primary)
+
+    return primary, fallback
@@ -3,90 +3,214 @@ Resume Parser
 Extracts text from various resume file formats
 """
 
-import io
 import logging
-from typing import Optional
+import time
+from typing import Iterator, List, Optional, Union
+
+from app.config import settings
+from app.parsers.buffers import DocumentBuffer, buffer_stream
+from app.parsers.docx_stream import extract_docx_text
+from app.parsers.pdf_backends import PdfDocument, get_backend, select_backends
+from app.parsers.text_normalizer import NormalizedText, text_normalizer
+from app.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
 
+# Switch a whole document to the fallback backend after this many failed pages
+PDF_MAX_CONSECUTIVE_FAILURES = 2
+
+_END = object()
+
+
+def detect_file_type(file_bytes: DocumentBuffer) -> str:
+    """Classify a file by its signature as pdf, docx or text"""
+    if file_bytes[:4] == b'%PDF':
+        return "pdf"
+    if file_bytes[:4] == b'PK\x03\x04':
+        return "docx"
+    return "text"
+
+
 class ResumeParser:
     """Parses resume files and extracts text content"""
     
-    def parse(self, file_bytes: bytes) -> str:
+    def parse(self, file_bytes: DocumentBuffer) -> str:
         """
         Parse resume file and extract text
         
         Args:
-            file_bytes: Raw file bytes
+            file_bytes: Raw file bytes, or a memory-mapped spooled upload
             
         Returns:
             Extracted text content
         """
-        # Try different parsers based on file signature
-        text = None
+        return " ".join(self.iter_pages(file_bytes))
+    
+    def iter_pages(
+        self,
+        file_bytes: DocumentBuffer,
+        with_views: bool = False,
+        issues: Optional[List[str]] = None,
+    ) -> Iterator[Union[str, NormalizedText]]:
+        """
+        Parse resume file and yield cleaned text one page at a time
         
-        # Try PDF first
-        if file_bytes[:4] == b'%PDF':
-            text = self._parse_pdf(file_bytes)
+        PDFs are extracted lazily so callers can process each page while
+        the next one is being read. Other formats yield a single page.
+        
+        Args:
+            file_bytes: Raw file bytes, or a memory-mapped spooled upload
+            with_views: Yield NormalizedText (text, lowercase view and token
+                offsets) instead of plain strings
+            issues: Receives a reason for every shortcut that may have left
+                text out (page or time budget hit, page read by the
+                fallback backend, DOCX fallback), so callers can tell a
+                complete parse from a degraded one
+            
+        Yields:
+            Cleaned, non-empty page text
+        """
+        # Try different parsers based on file signature
+        issues = [] if issues is None else issues
+        file_type = detect_file_type(file_bytes)
+        if file_type == "pdf":
+            pages = self._iter_pdf_pages(file_bytes, issues)
         
         # Try DOCX
-        elif file_bytes[:4] == b'PK\x03\x04':
-            text = self._parse_docx(file_bytes)
+        elif file_type == "docx":
+            with metrics.stage("parse"):
+                pages = iter([self._parse_docx(file_bytes, issues)])
         
         # Try plain text
         else:
-            text = self._parse_text(file_bytes)
+            with metrics.stage("parse"):
+                pages = iter([self._parse_text(file_bytes)])
         
-        if text:
+        while True:
+            # PDF pages are produced lazily, so parsing is timed per page
+            with metrics.stage("parse"):
+                page_text = next(pages, _END)
+            if page_text is _END:
+                break
+            if not page_text:
+                continue
             # Clean up text
-            text = self._clean_text(text)
-            
-        return text or ""
+            with metrics.stage("clean"):
+                if with_views:
+                    page = text_normalizer.normalize_with_views(page_text)
+                    page = page if page.text else None
+                else:
+                    page = self._clean_text(page_text)
+            if page:
+                yield page
     
-    def _parse_pdf(self, file_bytes: bytes) -> Optional[str]:
-        """Parse PDF file"""
+    def _iter_pdf_pages(self, file_bytes: DocumentBuffer, issues: List[str]) -> Iterator[str]:
+        """
+        Yield raw PDF text per page within the configured page and time budgets
+        
+        The primary backend is chosen from the registry in pdf_backends. A
+        page it fails on is read with the fallback backend instead, and
+        after several consecutive failures the rest of the document
+        switches to the fallback.
+        """
+        deadline = time.monotonic() + settings.PDF_TIME_BUDGET_SECONDS
+        max_pages = settings.PDF_MAX_PAGES
+        primary_name, fallback_name = select_backends(file_bytes)
+        
+        primary = self._open_pdf(primary_name, file_bytes)
+        fallback = None
+        if primary is None:
+            # The primary backend could not open the file at all
+            metrics.fallback("pdf_open", primary_name)
+            issues.append("pdf_open")
+            fallback = self._open_pdf(fallback_name, file_bytes)
+            fallback_name = None
+        
+        def fallback_page(index: int) -> Optional[str]:
+            nonlocal fallback, fallback_name
+            if fallback is None and fallback_name:
+                fallback = self._open_pdf(fallback_name, file_bytes)
+                fallback_name = None
+            if fallback is None:
+                return None
+            try:
+                return fallback.extract_page(index)
+            except Exception as e:
+                logger.error(f"PDF fallback page {index + 1} parsing error: {e}")
+                return None
+        
+        document = primary or fallback
+        total_pages = document.page_count if document is not None else 0
+        
+        if total_pages > max_pages:
+            logger.warning(f"PDF has {total_pages} pages, reading first {max_pages}")
+            issues.append("pdf_page_limit")
+        
+        consecutive_failures = 0
         try:
-            import pdfplumber
-            
-            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+            for index in range(min(total_pages, max_pages)):
+                if time.monotonic() > deadline:
+                    logger.warning(f"PDF time budget exceeded after {index} pages")
+                    issues.append("pdf_time_budget")
+                    break
                 
-                return "\n".join(text_parts)
-        except ImportError:
-            logger.warning("pdfplumber not installed, trying PyPDF2")
-            return self._parse_pdf_fallback(file_bytes)
-        except Exception as e:
-            logger.error(f"PDF parsing error: {e}")
-            return self._parse_pdf_fallback(file_bytes)
+                page_text = None
+                if primary is not None and consecutive_failures < PDF_MAX_CONSECUTIVE_FAILURES:
+                    try:
+                        page_text = primary.extract_page(index)
+                        consecutive_failures = 0
+                    except Exception as e:
+                        consecutive_failures += 1
+                        logger.error(f"PDF page {index + 1} parsing error ({primary_name}): {e}")
+                        metrics.fallback("pdf_page", primary_name)
+                        issues.append("pdf_page")
+                        if consecutive_failures == PDF_MAX_CONSECUTIVE_FAILURES:
+                            metrics.fallback("pdf_document", primary_name)
+                        page_text = fallback_page(index)
+                else:
+                    page_text = fallback_page(index)
+                
+                if page_text:
+                    yield page_text
+        finally:
+            for document in (primary, fallback):
+                if document is not None:
+                    document.close()
     
-    def _parse_pdf_fallback(self, file_bytes: bytes) -> Optional[str]:
-        """Fallback PDF parser using PyPDF2"""
+    def _open_pdf(self, backend_name: Optional[str], file_bytes: DocumentBuffer) -> Optional[PdfDocument]:
+        """Open a PDF with the named backend, or return None if that fails"""
+        if not backend_name:
+            return None
         try:
-            from PyPDF2 import PdfReader
-            
-            reader = PdfReader(io.BytesIO(file_bytes))
-            text_parts = []
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
-            
-            return "\n".join(text_parts)
+            return get_backend(backend_name).open(file_bytes)
         except Exception as e:
-            logger.error(f"PDF fallback parsing error: {e}")
+            logger.error(f"PDF parsing error ({backend_name}): {e}")
             return None
     
-    def _parse_docx(self, file_bytes: bytes) -> Optional[str]:
-        """Parse DOCX file"""
+    def _parse_docx(self, file_bytes: DocumentBuffer, issues: List[str]) -> Optional[str]:
+        """
+        Parse DOCX file
+        
+        The XML is streamed straight from the zip (headers, body with its
+        tables, footers, in document order); python-docx is only used when
+        that fails or DOCX_STREAMING is off.
+        """
+        if settings.DOCX_STREAMING:
+            try:
+                return extract_docx_text(file_bytes)
+            except Exception as e:
+                logger.warning(f"DOCX stream parsing error, using python-docx: {e}")
+                metrics.fallback("docx", "python-docx")
+                issues.append("docx")
+        return self._parse_docx_document(file_bytes)
+    
+    def _parse_docx_document(self, file_bytes: DocumentBuffer) -> Optional[str]:
+        """Parse DOCX file with the python-docx object model"""
         try:
             from docx import Document
             
-            doc = Document(io.BytesIO(file_bytes))
+            doc = Document(buffer_stream(file_bytes))
             text_parts = []
             
             for paragraph in doc.paragraphs:
@@ -105,17 +229,17 @@ class ResumeParser:
             logger.error(f"DOCX parsing error: {e}")
             return None
     
-    def _parse_text(self, file_bytes: bytes) -> Optional[str]:
+    def _parse_text(self, file_bytes: DocumentBuffer) -> Optional[str]:
         """Parse plain text file"""
         try:
             # Try UTF-8 first
             try:
-                return file_bytes.decode('utf-8')
+                return str(file_bytes, 'utf-8')
             except UnicodeDecodeError:
                 # Try other encodings
                 for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
                     try:
-                        return file_bytes.decode(encoding)
+                        return str(file_bytes, encoding)
                     except UnicodeDecodeError:
                         continue
             return None
@@ -125,15 +249,4 @@ class ResumeParser:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
-        import re
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s\.\,\-\+\#\@\(\)]', ' ', text)
-        
-        # Normalize whitespace again
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return text_normalizer.normalize(text)
@@ -0,0 +1,111 @@
+"""
+Resume Sections
+Detects section headings and indexes the offsets where each section starts
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Canonical section -> heading wordings (matched case-insensitively)
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "professional summary", "profile", "professional profile",
+        "objective", "career objective", "about me",
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "core competencies",
+        "competencies", "technologies", "tech stack", "tools", "tools and technologies",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history", "internships",
+    ],
+    "projects": ["projects", "personal projects", "key projects", "selected projects"],
+    "education": ["education", "academic background", "education and training"],
+    "certifications": [
+        "certifications", "certificates", "licenses and certifications",
+        "licenses & certifications", "courses", "coursework", "relevant coursework",
+        "training",
+    ],
+}
+
+_SECTION_OF = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# A heading alone on its line ("EXPERIENCE", "## Projects") or followed by a
+# colon and inline content ("Skills: Python, Docker"); "Experience with X"
+# is body text, not a heading
+HEADING_LINE = re.compile(
+    r"^[ \t#*•\-]*(?P<heading>"
+    + "|".join(
+        re.escape(heading).replace(r"\ ", r"[ \t]+")
+        for heading in sorted(_SECTION_OF, key=len, reverse=True)
+    )
+    + r")[ \t]*(?::|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def find_headings(text: str) -> List[Tuple[int, str]]:
+    """
+    Section headings in text that still has its line breaks
+
+    Returns:
+        (offset of the heading line, canonical section) pairs in order
+    """
+    return [
+        (match.start(), _SECTION_OF[" ".join(match.group("heading").lower().split())])
+        for match in HEADING_LINE.finditer(text)
+    ]
+
+
+class SectionIndex:
+    """
+    Start offsets of the sections of one text, searched by bisection
+
+    Text before the first heading belongs to no section (None). Built once
+    per document; attributing an offset costs one binary search.
+    """
+
+    __slots__ = ("starts", "names")
+
+    def __init__(self, headings: Iterable[Tuple[int, str]] = ()):
+        self.starts = array("I")
+        self.names: List[str] = []
+        for start, name in headings:
+            self.add(start, name)
+
+    def add(self, start: int, name: str) -> None:
+        """Append a section starting at or after the last one"""
+        if self.starts and start < self.starts[-1]:
+            raise ValueError("Sections must be added in offset order")
+        self.starts.append(start)
+        self.names.append(name)
+
+    def section_at(self, offset: int) -> Optional[str]:
+        """Section containing offset, None before the first heading"""
+        index = bisect_right(self.starts, offset) - 1
+        return self.names[index] if index >= 0 else None
+
+    def spans(self, length: int) -> Iterator[Tuple[Optional[str], int, int]]:
+        """(section, start, end) intervals covering a text of this length"""
+        previous_start, previous_name = 0, None
+        for start, name in zip(self.starts, self.names):
+            if start > previous_start:
+                yield previous_name, previous_start, start
+            previous_start, previous_name = start, name
+        if length > previous_start:
+            yield previous_name, previous_start, length
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+def segment(text: str) -> SectionIndex:
+    """Index the sections of text that still has its line breaks"""
+    return SectionIndex(find_headings(text))
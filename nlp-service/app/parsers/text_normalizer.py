@@ -0,0 +1,108 @@
+"""
+Text Normalizer
+Precompiled, single-pass cleanup of extracted resume text
+"""
+
+import re
+from array import array
+from typing import Iterable, List, Tuple
+
+from app.parsers.sections import find_headings
+from app.utils.text import lower_preserving_offsets
+
+# Characters kept besides word characters; any run of other characters
+# (whitespace included) becomes a single space.
+# "/" keeps names like "CI/CD" and "TCP/IP" whole for the scanner.
+KEPT_PUNCTUATION = ".,-+#@()/"
+
+# Typographic variants folded to their ASCII form before filtering, so
+# e.g. "C＃" or "Node–JS" survive cleanup the same way "C#" and "Node-JS" do
+TRANSLATION = str.maketrans({
+    "‐": "-", "‑": "-", "‒": "-", "–": "-", "—": "-",
+    "＋": "+", "＃": "#", "♯": "#", "．": ".", "，": ",",
+    "（": "(", "）": ")", "＠": "@", "／": "/",
+})
+
+
+class NormalizedText:
+    """
+    Normalized text plus views that downstream steps can reuse
+
+    Attributes:
+        text: Cleaned text, tokens separated by single spaces
+        lower: Lowercased ``text`` with identical offsets
+        tokens: ``lower`` split on spaces
+        token_starts: Start offset of each token in ``text``
+        sections: (offset in ``text``, section) of each heading found
+            before line breaks were collapsed
+    """
+
+    __slots__ = ("text", "lower", "tokens", "token_starts", "sections")
+
+    def __init__(
+        self,
+        text: str,
+        lower: str,
+        tokens: List[str],
+        token_starts: array,
+        sections: Iterable[Tuple[int, str]] = (),
+    ):
+        self.text = text
+        self.lower = lower
+        self.tokens = tokens
+        self.token_starts = token_starts
+        self.sections = list(sections)
+
+
+class TextNormalizer:
+    """Collapses whitespace and drops unsupported characters in one regex pass"""
+
+    def __init__(self):
+        self._junk = re.compile(r"[^\w" + re.escape(KEPT_PUNCTUATION) + r"]+")
+
+    def normalize(self, text: str) -> str:
+        """Return cleaned text with single spaces between tokens"""
+        return self._junk.sub(" ", text.translate(TRANSLATION)).strip()
+
+    def normalize_with_views(self, text: str) -> NormalizedText:
+        """
+        Normalize text and also build its lowercase view, token-offset map
+        and section headings
+
+        Headings are found on the raw lines. The text is split at each
+        heading line and the pieces normalized separately, which gives the
+        same result as normalizing it whole (line breaks collapse to one
+        space either way) while yielding each heading's cleaned offset.
+        """
+        headings = find_headings(text)
+        sections = []
+        if headings:
+            pieces = []
+            position = 0
+            bounds = [start for start, _ in headings] + [len(text)]
+            head = self.normalize(text[:bounds[0]])
+            if head:
+                pieces.append(head)
+                position = len(head) + 1
+            for (_, name), start, end in zip(headings, bounds, bounds[1:]):
+                piece = self.normalize(text[start:end])
+                if piece:
+                    sections.append((position, name))
+                    pieces.append(piece)
+                    position += len(piece) + 1
+            cleaned = " ".join(pieces)
+        else:
+            cleaned = self.normalize(text)
+        lower = lower_preserving_offsets(cleaned)
+
+        tokens = lower.split(" ") if lower else []
+        token_starts = array("I")
+        position = 0
+        for token in tokens:
+            token_starts.append(position)
+            position += len(token) + 1
+
+        return NormalizedText(cleaned, lower, tokens, token_starts, sections)
+
+
+text_normalizer = TextNormalizer()
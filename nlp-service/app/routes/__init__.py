@@ -2,6 +2,6 @@
 Routes package initialization
 """
 
-from app.routes import analysis, skills, health
+from app.routes import analysis, skills, health, admin, jobs
 
-__all__ = ["analysis", "skills", "health"]
+__all__ = ["analysis", "skills", "health", "admin", "jobs"]
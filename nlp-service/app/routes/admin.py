@@ -0,0 +1,91 @@
+"""
+Admin Routes
+Operational endpoints guarded by the admin token
+"""
+
+import logging
+import os
+import signal
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from app.config import SUPERVISOR_PID_ENV, settings
+from app.nlp.taxonomy import taxonomy_store
+from app.utils.auth import is_admin_token
+from app.utils.profiling import profile_store
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject requests without the configured admin token"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def broadcast_reload() -> bool:
+    """Under serve.py, have the supervisor reload the taxonomy in every worker"""
+    supervisor = os.environ.get(SUPERVISOR_PID_ENV)
+    if not supervisor:
+        return False
+    try:
+        os.kill(int(supervisor), signal.SIGHUP)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not signal the server supervisor: {e}")
+        return False
+    return True
+
+
+@router.post("/admin/taxonomy/reload", dependencies=[Depends(require_admin)])
+def reload_taxonomy():
+    """
+    Recompile the skill taxonomy from its data files and swap it in
+
+    Requests already running keep the taxonomy they started with. Under
+    serve.py the other workers (and the parent that forks replacements)
+    reload too, asynchronously; "broadcast" says whether they were told.
+    """
+    previous = taxonomy_store.version
+    try:
+        changed = taxonomy_store.reload()
+    except Exception as e:
+        logger.error(f"Taxonomy reload failed: {e}")
+        raise HTTPException(status_code=400, detail=f"Taxonomy reload failed: {e}")
+
+    return {
+        "changed": changed,
+        "broadcast": broadcast_reload(),
+        "previous_version": previous,
+        **taxonomy_store.current.describe(),
+    }
+
+
+@router.get("/admin/profiles", dependencies=[Depends(require_admin)])
+def list_profiles():
+    """Stored request profiles, newest first"""
+    return {"enabled": settings.PROFILING_ENABLED, "profiles": profile_store.list()}
+
+
+@router.get("/admin/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def download_profile(
+    profile_id: str,
+    format: str = Query("prof", pattern="^(prof|text)$"),
+    sort: str = Query("cumulative", pattern="^(cumulative|tottime|calls)$"),
+    limit: int = Query(40, ge=1, le=500),
+):
+    """
+    Download a profile as a pstats file (for snakeviz, pstats, ...) or view
+    its top functions as text with ``format=text``
+    """
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "text":
+        return PlainTextResponse(profile_store.summary(profile_id, limit, sort))
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
@@ -3,24 +3,34 @@ Analysis Routes
 Resume analysis and skill extraction endpoints
 """
 
+import asyncio
+import importlib.util
+import json
 import logging
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from pydantic import BaseModel
-from typing import List, Optional
+import tarfile
+import time
+import zipfile
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, model_serializer
+from starlette.background import BackgroundTask
+from typing import List, Optional, Dict, Set, Tuple, Union
 
-from app.nlp.skill_extractor import SkillExtractor
-from app.nlp.skill_matcher import SkillMatcher
-from app.parsers.resume_parser import ResumeParser
+from app.parsers.buffers import map_file
+from app.parsers.archive_parser import ArchiveTooLargeError, is_archive
 from app.utils.job_roles import get_required_skills
+from app.utils.executor import worker_pools, ExecutorSaturatedError
+from app.utils.cache import analysis_cache, content_key
+from app.utils.candidate_index import candidate_index
+from app.utils.metrics import metrics, size_bucket
+from app.utils.profiling import current_profile, run_profiled
+from app.utils.services import services
+from app.utils.uploads import UploadedDocument, UploadTooLargeError, receive_upload, spool_archive
+from app.config import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Initialize services
-skill_extractor = SkillExtractor()
-skill_matcher = SkillMatcher()
-resume_parser = ResumeParser()
-
 
 class SkillItem(BaseModel):
     """Model for a skill item"""
@@ -28,6 +38,15 @@ class SkillItem(BaseModel):
     level: Optional[str] = "intermediate"
     category: Optional[str] = None
     confidence: Optional[float] = None
+    sections: Optional[List[str]] = None  # only with section-aware extraction
+    
+    @model_serializer(mode="wrap")
+    def _omit_missing_sections(self, handler):
+        # Left out rather than null, so responses keep their shape without sections
+        data = handler(self)
+        if data.get("sections") is None:
+            data.pop("sections", None)
+        return data
 
 
 class Recommendation(BaseModel):
@@ -48,10 +67,329 @@ class AnalyzeResponse(BaseModel):
     recommendations: List[Recommendation]
 
 
+ANALYZE_FIELDS = tuple(AnalyzeResponse.model_fields)
+
+# Characters of resume text echoed back in analysis responses
+EXTRACTED_TEXT_LIMIT = 5000
+
+# Selected or compact responses skip the Pydantic models; orjson encodes the
+# plain dicts several times faster than the standard library encoder
+FastJSONResponse = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+
+
+class SkillTable:
+    """Shared table of skills that compact responses reference by ID"""
+    
+    def __init__(self):
+        self.rows: List[Dict] = []
+        self._ids: Dict[str, int] = {}
+    
+    def id(self, name: str, category: Optional[str] = None) -> int:
+        """ID of a skill, adding it to the table on first use"""
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            skill_id = self._ids[name] = len(self.rows)
+            self.rows.append({"name": name, "category": category})
+        elif category and self.rows[skill_id]["category"] is None:
+            self.rows[skill_id]["category"] = category
+        return skill_id
+
+
+def parse_fields(fields: Optional[str], compact: bool) -> Optional[Set[str]]:
+    """
+    Resolve the ``fields`` and ``compact`` query parameters of /analyze
+    
+    Returns:
+        Response fields to build, or None for the full AnalyzeResponse.
+        Compact responses leave out extracted_text unless it is asked for.
+    """
+    if fields is None:
+        if not compact:
+            return None
+        return set(ANALYZE_FIELDS) - {"extracted_text"}
+    
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = selected - set(ANALYZE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(ANALYZE_FIELDS)}"
+        )
+    return selected
+
+
+def _skill_item(skill: Dict) -> Dict:
+    """Plain-dict equivalent of SkillItem(**skill)"""
+    item = {
+        "name": skill["name"],
+        "level": skill.get("level", "intermediate"),
+        "category": skill.get("category"),
+        "confidence": skill.get("confidence"),
+    }
+    if skill.get("sections") is not None:
+        item["sections"] = skill["sections"]
+    return item
+
+
+def build_analysis_content(
+    extracted_text: str,
+    extracted_skills: List[Dict],
+    required_skills: List[Dict],
+    match_result: Dict,
+    fields: Set[str],
+    compact: bool,
+) -> Dict:
+    """
+    Build only the selected fields of an analysis response as plain dicts
+    
+    Full mode matches the AnalyzeResponse layout. Compact mode lists every
+    skill once in a shared ``skills`` table ({name, category}) and the
+    other fields refer to it by ID: extracted_skills as {id, level,
+    confidence}, required_skills as {id, level}, matched_skills and
+    gap_skills as plain IDs and recommendations as {id, priority, reason}.
+    """
+    content = {}
+    table = SkillTable() if compact else None
+    
+    if "extracted_text" in fields:
+        content["extracted_text"] = extracted_text[:EXTRACTED_TEXT_LIMIT]
+    if "extracted_skills" in fields:
+        if compact:
+            content["extracted_skills"] = [
+                {
+                    "id": table.id(s["name"], s.get("category")),
+                    "level": s.get("level", "intermediate"),
+                    "confidence": s.get("confidence"),
+                }
+                for s in extracted_skills
+            ]
+        else:
+            content["extracted_skills"] = [_skill_item(s) for s in extracted_skills]
+    if "required_skills" in fields:
+        if compact:
+            content["required_skills"] = [
+                {"id": table.id(s["name"], s.get("category")), "level": s.get("level", "intermediate")}
+                for s in required_skills
+            ]
+        else:
+            content["required_skills"] = [_skill_item(s) for s in required_skills]
+    if "matched_skills" in fields:
+        if compact:
+            content["matched_skills"] = [table.id(name) for name in match_result["matched"]]
+        else:
+            content["matched_skills"] = [_skill_item({"name": name}) for name in match_result["matched"]]
+    if "gap_skills" in fields:
+        if compact:
+            content["gap_skills"] = [table.id(name) for name in match_result["gaps"]]
+        else:
+            content["gap_skills"] = [
+                _skill_item({"name": name, "level": "beginner"}) for name in match_result["gaps"]
+            ]
+    if "match_score" in fields:
+        content["match_score"] = float(match_result["score"])
+    if "recommendations" in fields:
+        recommendations = build_recommendations(match_result["gaps"])
+        if compact:
+            for recommendation in recommendations:
+                recommendation["id"] = table.id(recommendation.pop("skill"))
+        content["recommendations"] = recommendations
+    
+    if compact:
+        content["skills"] = table.rows
+    return content
+
+
+def parse_and_extract_sync(
+    source: Union[bytes, str], profile: bool = False
+) -> Tuple[str, List[Dict], Dict]:
+    """
+    Parse resume pages and scan each one as it is extracted (runs in a worker)
+    
+    Args:
+        source: Raw file bytes, or the path of a spooled upload, which is
+            memory-mapped here rather than copied into the worker
+        profile: Run under cProfile and return the stats
+    
+    Returns:
+        Tuple of (text, skills, diagnostics). Diagnostics hold stage
+        "timings" when metrics are on, "profile" stats when requested and
+        the "degraded" reasons of a parse that may have left text out;
+        they travel back with the result since the worker may be another process.
+    """
+    if profile:
+        (text, skills, diagnostics), stats = run_profiled(parse_and_extract_sync, source)
+        diagnostics["profile"] = stats
+        return text, skills, diagnostics
+    
+    if isinstance(source, str):
+        with map_file(source) as buffer:
+            return parse_and_extract_sync(buffer)
+    
+    diagnostics = {}
+    issues: List[str] = []
+    with metrics.document() as timer:
+        started = time.perf_counter()
+        text, skills = services.skill_extractor.extract_skills_from_pages(
+            services.resume_parser.iter_pages(source, with_views=True, issues=issues)
+        )
+        if timer is not None:
+            # Parsing and cleaning run inside the page loop and fuzzy matching after it;
+            # the remainder is extraction
+            elapsed = time.perf_counter() - started
+            extract = elapsed - sum(timer.stages.get(stage, 0.0) for stage in ("parse", "clean", "fuzzy"))
+            timer.add("extract", extract)
+            diagnostics["timings"] = timer.export()
+    if issues:
+        diagnostics["degraded"] = sorted(set(issues))
+    return text, skills, diagnostics
+
+
+async def _cached_analysis(key: str) -> Optional[Dict]:
+    """Cache lookup with the disk tier (SQLite) read in the thread pool"""
+    cached = analysis_cache.get_memory(key)
+    if cached is not None:
+        return cached
+    if not analysis_cache.disk_enabled:
+        analysis_cache.record_miss()
+        return None
+    try:
+        return await worker_pools.run_io(analysis_cache.get_disk, key)
+    except ExecutorSaturatedError:
+        analysis_cache.record_miss()
+        return None
+
+
+async def _cache_analysis(key: str, value: Dict) -> None:
+    """Store a result in memory now and on disk in the thread pool (best effort)"""
+    analysis_cache.put_memory(key, value)
+    if analysis_cache.disk_enabled:
+        try:
+            await worker_pools.run_io(analysis_cache.put_disk, key, value)
+        except ExecutorSaturatedError:
+            logger.warning("Thread pool saturated, result not written to the disk cache")
+
+
+async def parse_and_extract(document: UploadedDocument) -> Tuple[str, List[Dict]]:
+    """
+    Parse a resume and extract skills without blocking the event loop
+    
+    Returns:
+        Tuple of (extracted text, extracted skills)
+    """
+    # Only matching depends on the role, so identical files reuse earlier work
+    cache_key = None
+    if settings.CACHE_ENABLED:
+        cache_key = content_key(document.sha256, services.skill_extractor.cache_version)
+        cached = await _cached_analysis(cache_key)
+        if cached is not None:
+            return cached["text"], cached["skills"]
+    
+    # Parse and extract page by page (PDFs are CPU-heavy and go to a worker process)
+    file_type = document.file_type
+    size = size_bucket(document.size)
+    profile = current_profile.get() if settings.PROFILING_ENABLED else None
+    # Results of a parse that may have left text out are not cached, so a
+    # transient failure or timeout is not served until the TTL expires
+    degraded = False
+    try:
+        if file_type == "pdf":
+            extracted_text, extracted_skills, diagnostics = await worker_pools.run_cpu(
+                parse_and_extract_sync, document.source, profile is not None
+            )
+        else:
+            extracted_text, extracted_skills, diagnostics = await worker_pools.run_io(
+                parse_and_extract_sync, document.source, profile is not None
+            )
+        metrics.record_document(diagnostics.get("timings"), file_type, size)
+        if profile is not None:
+            profile.add_worker_stats(diagnostics.get("profile"))
+        if diagnostics.get("degraded"):
+            degraded = True
+            logger.info(f"Degraded parse ({', '.join(diagnostics['degraded'])}), not caching")
+    except ExecutorSaturatedError:
+        raise
+    except Exception as e:
+        logger.error(f"Resume parsing error: {str(e)}")
+        extracted_text, extracted_skills = "", []
+        degraded = True
+    
+    if not extracted_text or len(extracted_text.strip()) < 20:
+        # Fallback: try to decode as plain text
+        metrics.fallback("raw_decode", file_type)
+        try:
+            extracted_text = document.read_bytes().decode('utf-8', errors='ignore')
+        except:
+            raise HTTPException(
+                status_code=400, 
+                detail="Could not extract text from resume. Please upload a text-based PDF or TXT file."
+            )
+        started = time.perf_counter()
+        if profile is not None:
+            extracted_skills, stats = await worker_pools.run_io(
+                run_profiled, services.skill_extractor.extract_skills, extracted_text
+            )
+            profile.add_worker_stats(stats)
+        else:
+            extracted_skills = await worker_pools.run_io(
+                services.skill_extractor.extract_skills, extracted_text
+            )
+        metrics.observe("extract_raw", time.perf_counter() - started, file_type, size)
+    
+    logger.info(f"Extracted {len(extracted_text)} characters from resume")
+    
+    if cache_key is not None and not degraded:
+        await _cache_analysis(cache_key, {"text": extracted_text, "skills": extracted_skills})
+    return extracted_text, extracted_skills
+
+
+async def index_candidate(
+    document: UploadedDocument,
+    extracted_skills: List[Dict],
+    resume_id: Optional[str] = None,
+    label: Optional[str] = None
+) -> None:
+    """
+    Add an analyzed resume to the candidate index (keyed by content hash by default)
+    
+    The SQLite write runs in the thread pool. Indexing is best effort: when
+    the pool is saturated the resume is not indexed, the analysis still
+    succeeds.
+    """
+    if candidate_index is None:
+        return
+    taxonomy = services.skill_matcher.store.current
+    try:
+        await worker_pools.run_io(
+            candidate_index.add,
+            resume_id or document.sha256[:32],
+            [taxonomy.normalize(s["name"]) for s in extracted_skills],
+            label=label,
+        )
+    except ExecutorSaturatedError:
+        logger.warning(f"Thread pool saturated, not indexing resume {label or document.sha256[:12]}")
+
+
+async def receive_resume(file: UploadFile) -> UploadedDocument:
+    """Read an uploaded resume in chunks, within MAX_FILE_SIZE"""
+    try:
+        document = await receive_upload(file, settings.MAX_FILE_SIZE)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if not document.size:
+        raise HTTPException(
+            status_code=400,
+            detail="Empty file uploaded"
+        )
+    return document
+
+
 @router.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_resume(
     file: UploadFile = File(...),
-    target_role: str = Form(...)
+    target_role: str = Form(...),
+    resume_id: Optional[str] = Form(None),
+    fields: Optional[str] = Query(None, description="Comma-separated response fields to return"),
+    compact: bool = Query(False, description="Reference skills by ID into one shared skills table"),
 ):
     """
     Analyze a resume file and extract skills
@@ -62,68 +400,367 @@ async def analyze_resume(
     - Compares with required skills for target role
     - Identifies skill gaps
     - Generates recommendations
+    - Adds the resume to the candidate index (as `resume_id` when given)
+    
+    `fields` and `compact=true` return a lighter response, see
+    build_analysis_content; compact mode leaves out extracted_text unless
+    it is listed in `fields`.
     """
+    selected_fields = parse_fields(fields, compact)
+    document = None
     try:
         logger.info(f"Received file: {file.filename}, target_role: {target_role}")
+        started = time.perf_counter()
         
-        # Read file bytes
-        file_bytes = await file.read()
+        # Stream the upload in chunks; large files are spooled to a temp file
+        document = await receive_resume(file)
         
-        if not file_bytes:
-            raise HTTPException(
-                status_code=400,
-                detail="Empty file uploaded"
-            )
+        # Stage timings are labelled by file type and size bucket
+        labels = (document.file_type, size_bucket(document.size))
+        stage_start = time.perf_counter()
+        metrics.observe("read", stage_start - started, *labels)
         
-        # Parse resume text
-        try:
-            extracted_text = resume_parser.parse(file_bytes)
-        except Exception as e:
-            logger.error(f"Resume parsing error: {str(e)}")
-            extracted_text = ""
-        
-        if not extracted_text or len(extracted_text.strip()) < 20:
-            # Fallback: try to decode as plain text
-            try:
-                extracted_text = file_bytes.decode('utf-8', errors='ignore')
-            except:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Could not extract text from resume. Please upload a text-based PDF or TXT file."
-                )
-        
-        logger.info(f"Extracted {len(extracted_text)} characters from resume")
-        
-        # Extract skills from resume
-        extracted_skills = skill_extractor.extract_skills(extracted_text)
+        extracted_text, extracted_skills = await parse_and_extract(document)
         logger.info(f"Extracted {len(extracted_skills)} skills")
+        await index_candidate(document, extracted_skills, resume_id, file.filename)
         
         # Get required skills for target role
         required_skills = get_required_skills(target_role)
         logger.info(f"Required skills for {target_role}: {len(required_skills)}")
         
         # Match skills and find gaps
-        match_result = skill_matcher.match_skills(
+        stage_start = time.perf_counter()
+        match_result = services.skill_matcher.match_role(
             user_skills=[s["name"] for s in extracted_skills],
-            required_skills=[s["name"] for s in required_skills]
+            role_id=target_role
         )
+        metrics.observe("match", time.perf_counter() - stage_start, *labels)
         
         # Build response
-        return AnalyzeResponse(
-            extracted_text=extracted_text[:5000],  # Limit text size
-            extracted_skills=[SkillItem(**s) for s in extracted_skills],
-            required_skills=[SkillItem(**s) for s in required_skills],
-            matched_skills=[SkillItem(name=s) for s in match_result["matched"]],
-            gap_skills=[SkillItem(name=s, level="beginner") for s in match_result["gaps"]],
-            match_score=match_result["score"],
-            recommendations=generate_recommendations(match_result["gaps"])
-        )
+        stage_start = time.perf_counter()
+        if selected_fields is not None:
+            response = FastJSONResponse(build_analysis_content(
+                extracted_text, extracted_skills, required_skills, match_result,
+                selected_fields, compact
+            ))
+        else:
+            response = AnalyzeResponse(
+                extracted_text=extracted_text[:EXTRACTED_TEXT_LIMIT],  # Limit text size
+                extracted_skills=[SkillItem(**s) for s in extracted_skills],
+                required_skills=[SkillItem(**s) for s in required_skills],
+                matched_skills=[SkillItem(name=s) for s in match_result["matched"]],
+                gap_skills=[SkillItem(name=s, level="beginner") for s in match_result["gaps"]],
+                match_score=match_result["score"],
+                recommendations=generate_recommendations(match_result["gaps"])
+            )
+        finished = time.perf_counter()
+        metrics.observe("response", finished - stage_start, *labels)
+        metrics.observe("total", finished - started, *labels)
+        return response
         
     except HTTPException:
         raise
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting analysis: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service is busy, please retry shortly",
+            headers={"Retry-After": str(settings.EXECUTOR_RETRY_AFTER)},
+        )
     except Exception as e:
         logger.error(f"Analysis error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    finally:
+        if document is not None:
+            document.close()
+
+
+async def _analyze_batch_item(
+    filename: str,
+    document: Optional[UploadedDocument],
+    roles: List[str],
+    semaphore: asyncio.Semaphore,
+) -> Dict:
+    """Analyze one file of a batch and score it against every requested role"""
+    if document is None:
+        return {"filename": filename, "status": "error", "error": "File too large"}
+    if not document.size:
+        return {"filename": filename, "status": "error", "error": "Empty file"}
+    
+    async with semaphore:
+        for attempt in range(settings.BATCH_SATURATED_RETRIES + 1):
+            try:
+                extracted_text, extracted_skills = await parse_and_extract(document)
+                break
+            except ExecutorSaturatedError:
+                # Shared pools are busy with other traffic, back off and retry
+                if attempt == settings.BATCH_SATURATED_RETRIES:
+                    return {"filename": filename, "status": "error", "error": "Service is busy"}
+                await asyncio.sleep(settings.EXECUTOR_RETRY_AFTER)
+            except HTTPException as e:
+                return {"filename": filename, "status": "error", "error": e.detail}
+            except Exception as e:
+                logger.error(f"Batch analysis error for {filename}: {str(e)}")
+                return {"filename": filename, "status": "error", "error": str(e)}
+    
+    await index_candidate(document, extracted_skills, label=filename)
+    
+    user_skills = [s["name"] for s in extracted_skills]
+    results = []
+    for role in roles:
+        match_result = services.skill_matcher.match_role(user_skills, role)
+        results.append({
+            "role": role,
+            "match_score": match_result["score"],
+            "matched_skills": match_result["matched"],
+            "gap_skills": match_result["gaps"],
+        })
+    
+    return {
+        "filename": filename,
+        "status": "ok",
+        "extracted_skills": extracted_skills,
+        "results": results,
+    }
+
+
+@router.post("/analyze/batch")
+async def analyze_batch(
+    files: List[UploadFile] = File(...),
+    target_roles: List[str] = Form(...)
+):
+    """
+    Analyze many resumes against one or more target roles
+    
+    - Accepts multiple files and/or zip/tar archives of resumes
+    - Parses and extracts files concurrently on the worker pools
+    - Streams one NDJSON line per file as soon as it completes
+    """
+    unknown_roles = [role for role in target_roles if not get_required_skills(role)]
+    if unknown_roles:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown target roles: {', '.join(unknown_roles)}"
+        )
+    
+    # Oversized files stay in the batch as None and are reported per file
+    items: List[Tuple[str, Optional[UploadedDocument]]] = []
+    
+    def close_documents():
+        for _, document in items:
+            if document is not None:
+                document.close()
+    
+    # Uncompressed bytes all archives of the batch may still expand to
+    extract_budget = settings.MAX_BATCH_EXTRACTED_SIZE
+    
+    try:
+        for upload in files:
+            filename = upload.filename or "upload"
+            if is_archive(filename):
+                archive = await receive_upload(upload, settings.MAX_BATCH_UPLOAD_SIZE)
+                try:
+                    # Members are spooled to temp files in the thread pool
+                    members = await worker_pools.run_io(
+                        spool_archive,
+                        filename,
+                        archive,
+                        max_files=settings.BATCH_MAX_FILES - len(items),
+                        max_total_size=extract_budget,
+                    )
+                except (zipfile.BadZipFile, tarfile.TarError) as e:
+                    raise HTTPException(status_code=400, detail=f"Invalid archive {filename}: {str(e)}")
+                except ArchiveTooLargeError as e:
+                    raise HTTPException(status_code=413, detail=str(e))
+                finally:
+                    archive.close()
+                extract_budget -= sum(document.size for _, document in members)
+                items.extend(members)
+            else:
+                try:
+                    items.append((filename, await receive_upload(upload, settings.MAX_FILE_SIZE)))
+                except UploadTooLargeError:
+                    items.append((filename, None))
+            if len(items) >= settings.BATCH_MAX_FILES:
+                break
+    except UploadTooLargeError as e:
+        close_documents()
+        raise HTTPException(status_code=413, detail=str(e))
+    except ExecutorSaturatedError as e:
+        close_documents()
+        logger.warning(f"Rejecting batch: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service is busy, please retry shortly",
+            headers={"Retry-After": str(settings.EXECUTOR_RETRY_AFTER)},
+        )
+    except BaseException:
+        close_documents()
+        raise
+    
+    if not items:
+        raise HTTPException(status_code=400, detail="No files uploaded")
+    
+    for _, document in items[settings.BATCH_MAX_FILES:]:
+        if document is not None:
+            document.close()
+    items = items[:settings.BATCH_MAX_FILES]
+    logger.info(f"Batch analysis: {len(items)} files, roles: {', '.join(target_roles)}")
+    
+    # Keep the batch within the pools' capacity so single requests still get served
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    
+    async def stream_results():
+        tasks = [
+            asyncio.create_task(_analyze_batch_item(name, document, target_roles, semaphore))
+            for name, document in items
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                yield json.dumps(result) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    # Spooled uploads are removed once the response is done, even if the client left
+    return StreamingResponse(
+        stream_results(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(close_documents),
+    )
+
+
+class RoleMatch(BaseModel):
+    """Model for one role in a ranking"""
+    role: str
+    label: str
+    match_score: float
+    matched_skills: List[str]
+    gap_skills: List[str]
+    total_required: int
+    total_matched: int
+
+
+class RankRolesResponse(BaseModel):
+    """Response model for ranking a resume against job roles"""
+    extracted_skills: List[SkillItem]
+    roles: List[RoleMatch]
+
+
+@router.post("/analyze/roles", response_model=RankRolesResponse)
+async def rank_roles(
+    file: UploadFile = File(...),
+    roles: List[str] = Form([]),
+    top: Optional[int] = Form(None, ge=1)
+):
+    """
+    Score one resume against every job role
+    
+    - Parses and extracts the resume once
+    - Scores all roles, or only those given in `roles`
+    - Returns roles ranked by match score with per-role gaps
+    """
+    document = None
+    try:
+        logger.info(f"Received file for role ranking: {file.filename}")
+        
+        document = await receive_resume(file)
+        extracted_text, extracted_skills = await parse_and_extract(document)
+        ranking = services.skill_matcher.match_all_roles(
+            user_skills=[s["name"] for s in extracted_skills],
+            role_ids=roles or None,
+            top=top
+        )
+        
+        return RankRolesResponse(
+            extracted_skills=[SkillItem(**s) for s in extracted_skills],
+            roles=[
+                RoleMatch(
+                    role=r["role"],
+                    label=r["label"],
+                    match_score=r["score"],
+                    matched_skills=r["matched"],
+                    gap_skills=r["gaps"],
+                    total_required=r["totalRequired"],
+                    total_matched=r["totalMatched"],
+                )
+                for r in ranking
+            ]
+        )
+        
+    except HTTPException:
+        raise
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting role ranking: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service is busy, please retry shortly",
+            headers={"Retry-After": str(settings.EXECUTOR_RETRY_AFTER)},
+        )
+    except Exception as e:
+        logger.error(f"Role ranking error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Role ranking failed: {str(e)}")
+    finally:
+        if document is not None:
+            document.close()
+
+
+class Candidate(BaseModel):
+    """Model for an indexed resume matching a role"""
+    resume_id: str
+    label: Optional[str] = None
+    match_score: float
+    matched_skills: List[str]
+
+
+class CandidatesResponse(BaseModel):
+    """Response model for best-matching resumes of a role"""
+    role: str
+    total_required: int
+    indexed_resumes: int
+    candidates: List[Candidate]
+
+
+@router.get("/roles/{role_id}/candidates", response_model=CandidatesResponse)
+async def role_candidates(role_id: str, top: int = Query(10, ge=1, le=1000)):
+    """
+    Find the analyzed resumes that best match a job role
+    
+    Uses the skill -> resume inverted index, so only the posting lists of
+    the role's required skills are read.
+    """
+    if candidate_index is None:
+        raise HTTPException(status_code=503, detail="Candidate index is disabled")
+    
+    role = services.skill_matcher.role_index.roles.get(role_id)
+    if role is None:
+        raise HTTPException(status_code=404, detail="Role not found")
+    
+    # Postings are keyed by normalized name; report the role's own spelling
+    originals = {
+        services.skill_matcher.role_index.skill_names[skill_id]: name
+        for name, skill_id in role["requirements"]
+    }
+    try:
+        candidates = await worker_pools.run_io(candidate_index.top_candidates, list(originals), top)
+        indexed_resumes = await worker_pools.run_io(candidate_index.count)
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting candidate search: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service is busy, please retry shortly",
+            headers={"Retry-After": str(settings.EXECUTOR_RETRY_AFTER)},
+        )
+    for candidate in candidates:
+        candidate["matched_skills"] = [originals[s] for s in candidate["matched_skills"]]
+    
+    return CandidatesResponse(
+        role=role_id,
+        total_required=role["size"],
+        indexed_resumes=indexed_resumes,
+        candidates=[Candidate(**c) for c in candidates]
+    )
 
 
 class MatchRequest(BaseModel):
@@ -139,7 +776,7 @@ async def match_skills(request: MatchRequest):
     Uses semantic similarity for fuzzy matching
     """
     try:
-        result = skill_matcher.match_skills(
+        result = services.skill_matcher.match_skills(
             user_skills=request.userSkills,
             required_skills=request.requiredSkills
         )
@@ -151,6 +788,11 @@ async def match_skills(request: MatchRequest):
 
 def generate_recommendations(gap_skills: List[str]) -> List[Recommendation]:
     """Generate learning recommendations based on skill gaps"""
+    return [Recommendation(**r) for r in build_recommendations(gap_skills)]
+
+
+def build_recommendations(gap_skills: List[str]) -> List[Dict]:
+    """Learning recommendations for skill gaps as plain dicts"""
     recommendations = []
     
     for i, skill in enumerate(gap_skills):
@@ -165,10 +807,10 @@ def generate_recommendations(gap_skills: List[str]) -> List[Recommendation]:
             priority = "low"
             reason = f"{skill} is a nice-to-have skill"
             
-        recommendations.append(Recommendation(
-            skill=skill,
-            priority=priority,
-            reason=reason
-        ))
+        recommendations.append({
+            "skill": skill,
+            "priority": priority,
+            "reason": reason
+        })
     
     return recommendations
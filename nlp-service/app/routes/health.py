@@ -3,14 +3,22 @@ Health Check Routes
 """
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
 from datetime import datetime
 
+from app.nlp.taxonomy import taxonomy_store
+from app.utils.cache import analysis_cache
+from app.utils.executor import ExecutorSaturatedError, worker_pools
+from app.utils.job_queue import job_queue
+from app.utils.metrics import metrics
+from app.utils.warmup import warmup_state
+
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness check, answers as soon as the app is up"""
     return {
         "status": "ok",
         "service": "nlp-service",
@@ -18,6 +26,59 @@ async def health_check():
     }
 
 
+@router.get("/health/ready")
+async def readiness_check():
+    """Readiness check, 503 until warm-up has finished"""
+    state = warmup_state.get_state()
+    return JSONResponse(state, status_code=200 if warmup_state.ready else 503)
+
+
+@router.get("/health/cache")
+async def cache_stats():
+    """Analysis cache hit/miss counters"""
+    return analysis_cache.get_stats()
+
+
+@router.get("/health/taxonomy")
+async def taxonomy_info():
+    """Active skill taxonomy version (also part of analysis cache keys)"""
+    return taxonomy_store.current.describe()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Stage latency histograms, parser fallbacks, cache and pool gauges (Prometheus text format)"""
+    cache = analysis_cache.get_stats()
+    extra = [
+        "# HELP nlp_analysis_cache_lookups_total Analysis cache lookups by outcome",
+        "# TYPE nlp_analysis_cache_lookups_total counter",
+    ]
+    for outcome in ("memory_hits", "disk_hits", "misses"):
+        extra.append(f'nlp_analysis_cache_lookups_total{{outcome="{outcome}"}} {cache[outcome]}')
+    extra += [
+        "# HELP nlp_executor_pending_tasks Running plus queued tasks per worker pool",
+        "# TYPE nlp_executor_pending_tasks gauge",
+        f'nlp_executor_pending_tasks{{pool="thread"}} {worker_pools.threads.pending}',
+    ]
+    if worker_pools.processes is not worker_pools.threads:
+        extra.append(f'nlp_executor_pending_tasks{{pool="process"}} {worker_pools.processes.pending}')
+    try:
+        job_counts = await worker_pools.run_io(job_queue.get_stats)
+    except ExecutorSaturatedError:
+        # Scrapes keep working under load, just without the queue gauge
+        job_counts = None
+    if job_counts is not None:
+        extra += [
+            "# HELP nlp_jobs Async analysis jobs per status (shared by all processes)",
+            "# TYPE nlp_jobs gauge",
+        ]
+        for status, count in job_counts.items():
+            extra.append(f'nlp_jobs{{status="{status}"}} {count}')
+    return PlainTextResponse(
+        metrics.render(extra), media_type="text/plain; version=0.0.4"
+    )
+
+
 @router.get("/")
 async def root():
     """Root endpoint"""
@@ -0,0 +1,309 @@
+"""
+Job Routes
+Asynchronous analysis jobs: submit, poll for status and results, cancel
+"""
+
+import asyncio
+import logging
+import os
+import tarfile
+import zipfile
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+from app.parsers.archive_parser import is_archive
+from app.routes.analysis import (
+    ANALYZE_FIELDS,
+    _analyze_batch_item,
+    build_analysis_content,
+    index_candidate,
+    parse_and_extract,
+    parse_fields,
+)
+from app.utils.job_queue import (
+    FINAL_STATUSES,
+    JOB_STATUSES,
+    callback_url_error,
+    job_queue,
+    job_status,
+    register_job_handler,
+)
+from app.utils.job_roles import get_required_skills
+from app.utils.executor import ExecutorSaturatedError, worker_pools
+from app.utils.services import services
+from app.utils.uploads import UploadedDocument, UploadTooLargeError, receive_upload, spool_archive
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+async def _queue_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking job queue call in the thread pool, 503 when it is saturated"""
+    try:
+        return await worker_pools.run_io(func, *args, **kwargs)
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting job request: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service is busy, please retry shortly",
+            headers={"Retry-After": str(settings.EXECUTOR_RETRY_AFTER)},
+        )
+
+
+async def _discard_files(job_id: str) -> None:
+    """Remove a rejected submission's files, inline if the thread pool is saturated"""
+    try:
+        await worker_pools.run_io(job_queue.remove_files, job_id)
+    except ExecutorSaturatedError:
+        job_queue.remove_files(job_id)
+
+
+async def _validate_callback(callback_url: Optional[str]) -> Optional[str]:
+    if not callback_url:
+        return None
+    # Resolving the host blocks
+    error = await _queue_io(callback_url_error, callback_url)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    return callback_url
+
+
+async def _store_upload(upload: UploadFile, job_id: str, max_size: int) -> Dict:
+    """Stream an upload into the job's directory and describe it for the payload"""
+    directory = job_queue.files_dir(job_id)
+    os.makedirs(directory, exist_ok=True)
+    # Threshold 0: every non-empty upload lands on disk, where the job runner finds it
+    document = await receive_upload(upload, max_size, spool_threshold=0, spool_dir=directory)
+    return {
+        "filename": upload.filename or "upload",
+        "path": os.path.basename(document.path) if document.path else None,
+        "size": document.size,
+        "sha256": document.sha256,
+        "file_type": document.file_type,
+    }
+
+
+def _stored_document(stored: Dict, files_dir: str) -> UploadedDocument:
+    return UploadedDocument(
+        path=os.path.join(files_dir, stored["path"]) if stored["path"] else None,
+        data=None if stored["path"] else b"",
+        size=stored["size"],
+        sha256=stored["sha256"],
+        file_type=stored["file_type"],
+    )
+
+
+def _accepted(job: Dict) -> JSONResponse:
+    return JSONResponse(
+        job_status(job),
+        status_code=202,
+        headers={"Location": f"/api/jobs/{job['id']}"},
+    )
+
+
+@router.post("/jobs", status_code=202)
+async def submit_analysis_job(
+    file: UploadFile = File(...),
+    target_role: str = Form(...),
+    resume_id: Optional[str] = Form(None),
+    priority: int = Form(0, ge=-100, le=100),
+    callback_url: Optional[str] = Form(None),
+    fields: Optional[str] = Query(None, description="Comma-separated response fields to return"),
+    compact: bool = Query(False, description="Reference skills by ID into one shared skills table"),
+):
+    """
+    Queue a resume analysis instead of holding the connection open
+
+    - Takes the same input as `/api/analyze`, plus `priority` (higher runs
+      first) and an optional `callback_url`
+    - Answers 202 with the job ID; poll `GET /api/jobs/{id}` for the
+      result, or receive the same body as a POST to `callback_url`
+    """
+    selected_fields = parse_fields(fields, compact)
+    if not get_required_skills(target_role):
+        raise HTTPException(status_code=400, detail=f"Unknown target role: {target_role}")
+    callback_url = await _validate_callback(callback_url)
+
+    job_id = job_queue.new_id()
+    try:
+        stored = await _store_upload(file, job_id, settings.MAX_FILE_SIZE)
+        if not stored["size"]:
+            raise HTTPException(status_code=400, detail="Empty file uploaded")
+        job = await _queue_io(
+            job_queue.enqueue,
+            job_id,
+            "analyze",
+            {
+                "file": stored,
+                "target_role": target_role,
+                "resume_id": resume_id,
+                "fields": sorted(selected_fields) if selected_fields is not None else None,
+                "compact": compact,
+            },
+            priority=priority,
+            callback_url=callback_url,
+        )
+    except UploadTooLargeError as e:
+        await _discard_files(job_id)
+        raise HTTPException(status_code=413, detail=str(e))
+    except BaseException:
+        await _discard_files(job_id)
+        raise
+    return _accepted(job)
+
+
+@router.post("/jobs/batch", status_code=202)
+async def submit_batch_job(
+    files: List[UploadFile] = File(...),
+    target_roles: List[str] = Form(...),
+    priority: int = Form(0, ge=-100, le=100),
+    callback_url: Optional[str] = Form(None),
+):
+    """
+    Queue a batch analysis (files and/or zip/tar archives) as one job
+
+    The result holds one entry per file, in the format of the
+    `/api/analyze/batch` NDJSON lines.
+    """
+    unknown_roles = [role for role in target_roles if not get_required_skills(role)]
+    if unknown_roles:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown target roles: {', '.join(unknown_roles)}"
+        )
+    callback_url = await _validate_callback(callback_url)
+
+    job_id = job_queue.new_id()
+    stored_files = []
+    try:
+        for upload in files[:settings.BATCH_MAX_FILES]:
+            archive = is_archive(upload.filename or "")
+            try:
+                stored = await _store_upload(
+                    upload,
+                    job_id,
+                    settings.MAX_BATCH_UPLOAD_SIZE if archive else settings.MAX_FILE_SIZE,
+                )
+            except UploadTooLargeError:
+                if archive:
+                    raise
+                # Reported as an error entry for this file, like /analyze/batch
+                stored = {"filename": upload.filename or "upload", "path": None, "too_large": True}
+            stored["archive"] = archive
+            stored_files.append(stored)
+        job = await _queue_io(
+            job_queue.enqueue,
+            job_id,
+            "batch",
+            {"files": stored_files, "target_roles": target_roles},
+            priority=priority,
+            callback_url=callback_url,
+        )
+    except UploadTooLargeError as e:
+        await _discard_files(job_id)
+        raise HTTPException(status_code=413, detail=str(e))
+    except BaseException:
+        await _discard_files(job_id)
+        raise
+    return _accepted(job)
+
+
+@router.get("/jobs")
+async def list_jobs(
+    status: Optional[str] = Query(None, pattern=f"^({'|'.join(JOB_STATUSES)})$"),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """Most recent jobs (without results) and the number of jobs per status"""
+    return {
+        "counts": await _queue_io(job_queue.get_stats),
+        "jobs": await _queue_io(job_queue.list, status, limit),
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Job status; succeeded jobs include the result, failed jobs the error"""
+    job = await _queue_io(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status(job)
+
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job"""
+    job = await _queue_io(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] in FINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {job['status']}")
+
+    cancelled = await _queue_io(job_queue.cancel, job_id)
+    # A running job's files are removed by its runner once it notices
+    if job["status"] == "queued":
+        await _queue_io(job_queue.remove_files, job_id)
+    return job_status(cancelled)
+
+
+@register_job_handler("analyze")
+async def run_analysis_job(payload: Dict, files_dir: str) -> Dict:
+    """Analyze one stored resume, returning the /api/analyze response body"""
+    stored = payload["file"]
+    document = _stored_document(stored, files_dir)
+    extracted_text, extracted_skills = await parse_and_extract(document)
+    await index_candidate(document, extracted_skills, payload.get("resume_id"), stored["filename"])
+
+    target_role = payload["target_role"]
+    match_result = services.skill_matcher.match_role(
+        user_skills=[s["name"] for s in extracted_skills],
+        role_id=target_role
+    )
+    fields = payload.get("fields")
+    return build_analysis_content(
+        extracted_text,
+        extracted_skills,
+        get_required_skills(target_role),
+        match_result,
+        set(fields) if fields is not None else set(ANALYZE_FIELDS),
+        payload.get("compact", False),
+    )
+
+
+@register_job_handler("batch")
+async def run_batch_job(payload: Dict, files_dir: str) -> Dict:
+    """Analyze every stored file (and archive member) of a batch"""
+    items = []
+    extract_budget = settings.MAX_BATCH_EXTRACTED_SIZE
+    for stored in payload["files"]:
+        if stored.get("too_large"):
+            items.append((stored["filename"], None))
+        elif stored["archive"]:
+            try:
+                # Members are spooled next to the job's uploads, removed with them
+                members = await worker_pools.run_io(
+                    spool_archive,
+                    stored["filename"],
+                    _stored_document(stored, files_dir),
+                    max_files=settings.BATCH_MAX_FILES - len(items),
+                    max_total_size=extract_budget,
+                    spool_dir=files_dir,
+                )
+            except (zipfile.BadZipFile, tarfile.TarError) as e:
+                raise ValueError(f"Invalid archive {stored['filename']}: {str(e)}")
+            extract_budget -= sum(document.size for _, document in members)
+            items.extend(members)
+        else:
+            items.append((stored["filename"], _stored_document(stored, files_dir)))
+        if len(items) >= settings.BATCH_MAX_FILES:
+            break
+
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _analyze_batch_item(name, document, payload["target_roles"], semaphore)
+        for name, document in items[:settings.BATCH_MAX_FILES]
+    ))
+    return {"files": len(results), "results": results}
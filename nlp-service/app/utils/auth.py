@@ -0,0 +1,16 @@
+"""
+Auth Utility
+Admin token checks shared by admin routes and middleware
+"""
+
+import hmac
+from typing import Optional
+
+from app.config import settings
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """True if admin access is configured and token matches it"""
+    if not settings.ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token, settings.ADMIN_TOKEN)
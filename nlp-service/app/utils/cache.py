@@ -0,0 +1,221 @@
+"""
+Analysis Cache
+Content-addressed cache of parsed resume text and extracted skills
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(sha256: str, taxonomy_version: str) -> str:
+    """
+    Build a cache key from the file's SHA-256 hex digest and the taxonomy
+    that produced the skills (uploads are hashed as their chunks arrive)
+    """
+    return f"{sha256}:{taxonomy_version}"
+
+
+class AnalysisCache:
+    """
+    Two-tier cache for parse + extraction results
+
+    The memory tier is a per-process LRU with size and TTL eviction. The
+    optional disk tier is a SQLite database that every uvicorn worker on
+    the host can share. Disk access blocks (up to the SQLite busy timeout
+    when another process holds the database), so async callers use
+    get_memory/put_memory on the event loop and run get_disk/put_disk in
+    the thread pool; get/put do both, for synchronous callers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        db_path: Optional[str] = None,
+        db_max_entries: int = 10000,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.db_max_entries = db_max_entries
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Separate lock so a slow disk operation never holds up the memory tier
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_writes = 0
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the disk tier on first use"""
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    @property
+    def disk_enabled(self) -> bool:
+        return bool(self.db_path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached value, checking memory first and then disk (blocking)"""
+        value = self.get_memory(key)
+        if value is not None:
+            return value
+        if self.disk_enabled:
+            return self.get_disk(key)
+        self.record_miss()
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value in both tiers (blocking)"""
+        self.put_memory(key, value)
+        if self.disk_enabled:
+            self.put_disk(key, value)
+
+    def get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up the memory tier only; a miss is not counted, the disk may still hit"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if now - created_at <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return value
+            del self._entries[key]
+            self.stats["evictions"] += 1
+            return None
+
+    def get_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up the disk tier, promoting a hit to memory (blocking)"""
+        now = time.time()
+        with self._db_lock:
+            value = self._get_disk(key, now)
+        if value is None:
+            self.record_miss()
+            return None
+        with self._lock:
+            self._put_memory(key, value, now)
+            self.stats["disk_hits"] += 1
+        return value
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.stats["misses"] += 1
+
+    def put_memory(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._put_memory(key, value, time.time())
+
+    def put_disk(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value in the disk tier (blocking)"""
+        with self._db_lock:
+            self._put_disk(key, value, time.time())
+
+    def _put_memory(self, key: str, value: Dict[str, Any], now: float) -> None:
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _get_disk(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        try:
+            db = self._connect()
+            row = db.execute(
+                "SELECT value, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                db.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                db.commit()
+                return None
+            return json.loads(row[0])
+        except sqlite3.Error as e:
+            logger.error(f"Cache read error: {e}")
+            return None
+
+    def _put_disk(self, key: str, value: Dict[str, Any], now: float) -> None:
+        try:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now),
+            )
+            self._db_writes += 1
+            # Prune periodically rather than on every write
+            if self._db_writes % 100 == 0:
+                db.execute(
+                    "DELETE FROM analysis_cache WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                db.execute(
+                    "DELETE FROM analysis_cache WHERE key NOT IN ("
+                    "SELECT key FROM analysis_cache ORDER BY created_at DESC LIMIT ?)",
+                    (self.db_max_entries,),
+                )
+            db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Cache write error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current memory tier size"""
+        with self._lock:
+            lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            hits = lookups - self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "memory_entries": len(self._entries),
+                "disk_enabled": bool(self.db_path),
+            }
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+        if self.db_path:
+            with self._db_lock:
+                try:
+                    db = self._connect()
+                    db.execute("DELETE FROM analysis_cache")
+                    db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Cache clear error: {e}")
+
+
+analysis_cache = AnalysisCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+    db_path=settings.CACHE_DB_PATH,
+    db_max_entries=settings.CACHE_DB_MAX_ENTRIES,
+)
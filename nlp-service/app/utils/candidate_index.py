@@ -0,0 +1,145 @@
+"""
+Candidate Index
+Persistent inverted index from skills to analyzed resumes
+"""
+
+import heapq
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateIndex:
+    """
+    Maps each normalized skill to the posting list of resumes that have it
+
+    Postings live in SQLite so every worker on the host shares one index
+    and it survives restarts. Resumes are inserted incrementally as they
+    are analyzed; re-analyzing a resume replaces its postings.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS resumes ("
+                "resume_id TEXT PRIMARY KEY, label TEXT, skill_count INTEGER, added_at REAL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "skill TEXT NOT NULL, resume_id TEXT NOT NULL, "
+                "PRIMARY KEY (skill, resume_id)) WITHOUT ROWID"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS postings_by_resume ON postings (resume_id)"
+            )
+            self._db.commit()
+        return self._db
+
+    def add(self, resume_id: str, skills: List[str], label: Optional[str] = None) -> None:
+        """
+        Insert (or replace) a resume's postings
+
+        Args:
+            resume_id: Stable identifier of the resume
+            skills: Normalized skill names found in the resume
+            label: Human-readable name such as the uploaded file name
+        """
+        unique_skills = sorted(set(skills))
+        with self._lock:
+            try:
+                db = self._connect()
+                with db:
+                    db.execute("DELETE FROM postings WHERE resume_id = ?", (resume_id,))
+                    db.execute(
+                        "INSERT OR REPLACE INTO resumes (resume_id, label, skill_count, added_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (resume_id, label, len(unique_skills), time.time()),
+                    )
+                    db.executemany(
+                        "INSERT INTO postings (skill, resume_id) VALUES (?, ?)",
+                        [(skill, resume_id) for skill in unique_skills],
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Candidate index write error: {e}")
+
+    def top_candidates(self, required_skills: List[str], top: int) -> List[Dict]:
+        """
+        Find the resumes covering the most required skills
+
+        Only the posting lists of the required skills are read and merged,
+        then a heap keeps the best ``top`` resumes. Resumes matching the
+        same number of skills rank by recency, most recently analyzed first.
+
+        Args:
+            required_skills: Normalized required skill names
+            top: Number of candidates to return
+
+        Returns:
+            Candidates with resume_id, label, matched skills and match score
+        """
+        required = sorted(set(required_skills))
+        if not required or top <= 0:
+            return []
+
+        with self._lock:
+            try:
+                placeholders = ",".join("?" * len(required))
+                rows = self._connect().execute(
+                    "SELECT p.skill, p.resume_id, r.label, r.added_at "
+                    "FROM postings p JOIN resumes r ON r.resume_id = p.resume_id "
+                    f"WHERE p.skill IN ({placeholders})",
+                    required,
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Candidate index read error: {e}")
+                return []
+
+        matched: Dict[str, List[str]] = {}
+        resumes: Dict[str, tuple] = {}
+        for skill, resume_id, label, added_at in rows:
+            matched.setdefault(resume_id, []).append(skill)
+            resumes[resume_id] = (label, added_at)
+
+        # Ties on the number of matched skills go to the most recent resume
+        best = heapq.nlargest(
+            top, matched.items(), key=lambda item: (len(item[1]), resumes[item[0]][1], item[0])
+        )
+        return [
+            {
+                "resume_id": resume_id,
+                "label": resumes[resume_id][0],
+                "matched_skills": sorted(skills),
+                "match_score": round(len(skills) / len(required) * 100, 1),
+            }
+            for resume_id, skills in best
+        ]
+
+    def count(self) -> int:
+        """Number of indexed resumes"""
+        with self._lock:
+            try:
+                return self._connect().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.error(f"Candidate index read error: {e}")
+                return 0
+
+
+candidate_index = CandidateIndex(settings.CANDIDATE_INDEX_PATH) if settings.CANDIDATE_INDEX_PATH else None
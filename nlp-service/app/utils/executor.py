@@ -0,0 +1,132 @@
+"""
+Executor Utility
+Runs blocking parsing and extraction work off the asyncio event loop
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a pool already has its maximum number of pending tasks"""
+
+    def __init__(self, pool_name: str, limit: int):
+        super().__init__(f"{pool_name} pool is saturated ({limit} pending tasks)")
+        self.pool_name = pool_name
+        self.limit = limit
+
+
+class BoundedPool:
+    """
+    Wraps a concurrent.futures executor with a cap on pending work
+
+    The cap counts running plus queued tasks, so a burst of uploads is
+    rejected up front instead of piling up behind slow ones.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Executor], max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.limit = max_workers + max_queue
+        self.pending = 0
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Create the underlying executor on first use"""
+        if self._executor is None:
+            self._executor = self._factory()
+            logger.info(f"Started {self.name} pool with {self.max_workers} workers")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run func in the pool, raising ExecutorSaturatedError when full"""
+        if self.pending >= self.limit:
+            raise ExecutorSaturatedError(self.name, self.limit)
+
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        finally:
+            self.pending -= 1
+
+    def prestart(self) -> None:
+        """Start the executor and all its workers ahead of the first task"""
+        executor = self.executor
+        for future in [executor.submit(int) for _ in range(self.max_workers)]:
+            future.result()
+
+    def recycle(self) -> None:
+        """Start fresh workers for new tasks; tasks already submitted finish on the old ones"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=False)
+            logger.info(f"Recycled {self.name} pool")
+
+    def shutdown(self) -> None:
+        """Stop the underlying executor if it was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class WorkerPools:
+    """Thread pool for light blocking work, process pool for CPU-heavy parsing"""
+
+    def __init__(self, thread_workers: int, process_workers: int, max_queue: int):
+        self.threads = BoundedPool(
+            "thread",
+            partial(ThreadPoolExecutor, max_workers=thread_workers, thread_name_prefix="nlp-worker"),
+            thread_workers,
+            max_queue,
+        )
+        # Without process workers, CPU-heavy work shares the thread pool
+        if process_workers > 0:
+            self.processes = BoundedPool(
+                "process",
+                partial(ProcessPoolExecutor, max_workers=process_workers),
+                process_workers,
+                max_queue,
+            )
+        else:
+            self.processes = self.threads
+
+    async def run_io(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run light blocking work (DOCX/text parsing, extraction) in a thread"""
+        return await self.threads.run(func, *args, **kwargs)
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run CPU-heavy work (PDF extraction) in a worker process; func must be picklable"""
+        return await self.processes.run(func, *args, **kwargs)
+
+    def prestart(self) -> None:
+        """Start all workers ahead of the first request"""
+        self.threads.prestart()
+        if self.processes is not self.threads:
+            self.processes.prestart()
+
+    def recycle_processes(self) -> None:
+        """Replace worker processes so they pick up state changed in this process"""
+        if self.processes is not self.threads:
+            self.processes.recycle()
+
+    def shutdown(self) -> None:
+        """Stop all pools"""
+        self.threads.shutdown()
+        self.processes.shutdown()
+
+
+worker_pools = WorkerPools(
+    thread_workers=settings.EXECUTOR_THREAD_WORKERS,
+    process_workers=settings.EXECUTOR_PROCESS_WORKERS,
+    max_queue=settings.EXECUTOR_MAX_QUEUE,
+)
@@ -0,0 +1,456 @@
+"""
+Job Queue
+Durable SQLite queue of long-running analyses, drained by job runners
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import urllib.request
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.config import settings
+from app.utils.executor import ExecutorSaturatedError, worker_pools
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+# kind -> coroutine taking the job's payload and file directory, returning the result
+JobHandler = Callable[[Dict, str], Awaitable[Any]]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Decorator adding the coroutine that runs jobs of one kind"""
+    def decorator(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return decorator
+
+
+class JobQueue:
+    """
+    Analysis jobs stored in SQLite, with their uploads in a per-job directory
+
+    Every process on the host (uvicorn workers and standalone job workers)
+    opens the same database, so jobs survive restarts and any runner can
+    claim them. Claiming happens in an immediate transaction, so a job is
+    handed to exactly one runner. Runners heartbeat while a job runs; a
+    job whose runner stopped heartbeating is queued again, up to
+    max_attempts runs.
+    """
+
+    def __init__(self, db_path: str, job_dir: str, lease_seconds: int, max_attempts: int):
+        self.db_path = db_path
+        self.job_dir = job_dir
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit mode: claims open their own BEGIN IMMEDIATE transaction
+            self._db = sqlite3.connect(
+                self.db_path, check_same_thread=False, timeout=5, isolation_level=None
+            )
+            self._db.row_factory = sqlite3.Row
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, "
+                "priority INTEGER NOT NULL DEFAULT 0, payload TEXT NOT NULL, "
+                "callback_url TEXT, result TEXT, error TEXT, "
+                "attempts INTEGER NOT NULL DEFAULT 0, worker TEXT, "
+                "created_at REAL NOT NULL, started_at REAL, heartbeat_at REAL, finished_at REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_by_queue ON jobs (status, priority DESC, created_at)"
+            )
+        return self._db
+
+    def files_dir(self, job_id: str) -> str:
+        """Directory holding a job's uploaded files"""
+        return os.path.join(self.job_dir, job_id)
+
+    def new_id(self) -> str:
+        return uuid.uuid4().hex
+
+    def enqueue(
+        self,
+        job_id: str,
+        kind: str,
+        payload: Dict,
+        priority: int = 0,
+        callback_url: Optional[str] = None,
+    ) -> Dict:
+        """Queue a job whose files are already in files_dir(job_id)"""
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO jobs (id, kind, status, priority, payload, callback_url, created_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, kind, priority, json.dumps(payload), callback_url, time.time()),
+            )
+        logger.info(f"Queued {kind} job {job_id} (priority {priority})")
+        return self.get(job_id)
+
+    def claim(self, worker: str) -> Optional[Dict]:
+        """Mark the highest-priority, oldest queued job as running and return it"""
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' "
+                    "ORDER BY priority DESC, created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    db.execute(
+                        "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, "
+                        "started_at = ?, heartbeat_at = ? WHERE id = ?",
+                        (worker, now, now, row["id"]),
+                    )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return self.get(row["id"]) if row is not None else None
+
+    def heartbeat(self, job_id: str) -> str:
+        """Extend a running job's lease; returns its status (cancelled jobs stop)"""
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = 'running'",
+                (time.time(), job_id),
+            )
+            row = db.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row["status"] if row is not None else "cancelled"
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> bool:
+        """Move a running job to a final status; False if it was cancelled meanwhile"""
+        with self._lock:
+            cursor = self._connect().execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE id = ? AND status = 'running'",
+                (status, None if result is None else json.dumps(result), error, time.time(), job_id),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, result: Any) -> bool:
+        return self._finish(job_id, "succeeded", result=result)
+
+    def fail(self, job_id: str, error: str) -> bool:
+        return self._finish(job_id, "failed", error=error)
+
+    def release(self, job_id: str) -> None:
+        """Put a running job back in the queue without counting the attempt"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, attempts = attempts - 1 "
+                "WHERE id = ? AND status = 'running'",
+                (job_id,),
+            )
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """Cancel a queued or running job; finished jobs are left as they are"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id),
+            )
+        return self.get(job_id)
+
+    def requeue_stale(self) -> int:
+        """Queue again (or fail) running jobs whose runner stopped heartbeating"""
+        cutoff = time.time() - self.lease_seconds
+        with self._lock:
+            db = self._connect()
+            failed = db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Worker stopped responding', "
+                "finished_at = ? WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?",
+                (time.time(), cutoff, self.max_attempts),
+            ).rowcount
+            requeued = db.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL "
+                "WHERE status = 'running' AND heartbeat_at < ?",
+                (cutoff,),
+            ).rowcount
+        if failed or requeued:
+            logger.warning(f"Stale jobs: {requeued} queued again, {failed} failed")
+        return requeued
+
+    def prune(self, retention_seconds: int) -> int:
+        """Delete finished jobs older than the retention period"""
+        cutoff = time.time() - retention_seconds
+        with self._lock:
+            db = self._connect()
+            ids = [
+                row["id"] for row in db.execute(
+                    "SELECT id FROM jobs WHERE status IN ('succeeded', 'failed', 'cancelled') "
+                    "AND finished_at < ?",
+                    (cutoff,),
+                )
+            ]
+            db.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in ids])
+        for job_id in ids:
+            self.remove_files(job_id)
+        return len(ids)
+
+    def remove_files(self, job_id: str) -> None:
+        shutil.rmtree(self.files_dir(job_id), ignore_errors=True)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """A job with its payload and result decoded, or None"""
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Most recent jobs, without results"""
+        query = (
+            "SELECT id, kind, status, priority, attempts, error, created_at, started_at, finished_at "
+            "FROM jobs"
+        )
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._connect().execute(query, params + (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+
+job_queue = JobQueue(
+    db_path=settings.JOB_DB_PATH,
+    job_dir=settings.JOB_DIR,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+)
+
+
+def job_status(job: Dict) -> Dict:
+    """Public view of a job (what polling and callbacks return)"""
+    status = {
+        "id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "priority": job["priority"],
+        "attempts": job["attempts"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+    }
+    if job["status"] == "failed":
+        status["error"] = job["error"]
+    if job["status"] == "succeeded":
+        status["result"] = job["result"]
+    return status
+
+
+def callback_url_error(url: str) -> Optional[str]:
+    """
+    Why a callback URL is refused, or None if it may be called
+
+    Hosts in JOB_CALLBACK_ALLOWED_HOSTS are trusted as they are. Without
+    an allowlist, every address the host resolves to must be public, so
+    callbacks cannot reach loopback, private networks or cloud metadata
+    endpoints. Resolves the host, so call it off the event loop.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        return "callback_url must be an http(s) URL"
+    host = parsed.hostname.lower()
+    allowed_hosts = [allowed.lower() for allowed in settings.JOB_CALLBACK_ALLOWED_HOSTS]
+    if allowed_hosts:
+        return None if host in allowed_hosts else "callback_url host is not allowed"
+
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parsed.port or None)}
+    except (OSError, ValueError):
+        return "callback_url host does not resolve"
+    for address in addresses:
+        # Scoped IPv6 addresses carry a %interface suffix
+        ip = ipaddress.ip_address(address.split("%")[0])
+        if not ip.is_global or ip.is_multicast:
+            return "callback_url must resolve to a public address"
+    return None
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Refuse redirects, which could lead a checked callback to an internal host"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_callback_opener = urllib.request.build_opener(_NoRedirectHandler)
+
+
+def post_callback(url: str, body: Dict) -> bool:
+    """POST a finished job's status to its callback URL, retrying a few times"""
+    # Checked again: the host may resolve elsewhere by the time the job finishes
+    error = callback_url_error(url)
+    if error:
+        logger.warning(f"Job callback to {url} skipped: {error}")
+        return False
+
+    data = json.dumps(body).encode()
+    for attempt in range(settings.JOB_CALLBACK_RETRIES + 1):
+        request = urllib.request.Request(
+            url, data=data, method="POST", headers={"Content-Type": "application/json"}
+        )
+        try:
+            with _callback_opener.open(request, timeout=settings.JOB_CALLBACK_TIMEOUT) as response:
+                if response.status < 300:
+                    return True
+        except OSError as e:
+            logger.warning(f"Job callback to {url} failed (attempt {attempt + 1}): {e}")
+        time.sleep(2 ** attempt)
+    return False
+
+
+class JobRunner:
+    """
+    Async loop claiming jobs from the queue and running their handlers
+
+    Each app process (and each standalone job worker) runs a few of these.
+    Handlers do their CPU work on the shared worker pools, so a runner
+    only waits; when the pools are saturated by interactive requests the
+    job goes back to the queue and the runner backs off.
+    """
+
+    def __init__(self, queue: JobQueue, name: str):
+        self.queue = queue
+        self.name = name
+        self._stopping = False
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    async def _queue_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a queue method in the thread pool, waiting while the pool is saturated"""
+        while True:
+            try:
+                return await worker_pools.run_io(func, *args)
+            except ExecutorSaturatedError:
+                await asyncio.sleep(settings.EXECUTOR_RETRY_AFTER)
+
+    async def run(self) -> None:
+        last_maintenance = 0.0
+        while not self._stopping:
+            try:
+                # Stale leases and old jobs are checked now and then, not per claim
+                if time.monotonic() - last_maintenance > settings.JOB_LEASE_SECONDS / 4:
+                    last_maintenance = time.monotonic()
+                    await self._queue_call(self.queue.requeue_stale)
+                    await self._queue_call(self.queue.prune, settings.JOB_RETENTION_SECONDS)
+                job = await self._queue_call(self.queue.claim, self.name)
+            except sqlite3.Error as e:
+                logger.error(f"Job queue error: {e}")
+                job = None
+            if job is None:
+                await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+                continue
+            await self.run_job(job)
+
+    async def run_job(self, job: Dict) -> None:
+        """Run one claimed job, heartbeating and watching for cancellation"""
+        loop = asyncio.get_running_loop()
+        job_id = job["id"]
+        handler = JOB_HANDLERS.get(job["kind"])
+        if handler is None:
+            await self._queue_call(self.queue.fail, job_id, f"Unknown job kind: {job['kind']}")
+            return
+
+        logger.info(f"{self.name} running {job['kind']} job {job_id}")
+        task = asyncio.create_task(handler(job["payload"], self.queue.files_dir(job_id)))
+        heartbeat_every = max(settings.JOB_LEASE_SECONDS / 4, settings.JOB_POLL_INTERVAL)
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=heartbeat_every)
+                if done:
+                    break
+                try:
+                    status = await worker_pools.run_io(self.queue.heartbeat, job_id)
+                except ExecutorSaturatedError:
+                    # The lease outlasts several heartbeats; try again next round
+                    continue
+                if status == "cancelled":
+                    task.cancel()
+                    # The task only counts as cancelled once it has unwound
+                    await asyncio.gather(task, return_exceptions=True)
+                    logger.info(f"Cancelled running job {job_id}")
+                    break
+        except asyncio.CancelledError:
+            # Shutting down: another runner picks the job up again. Released
+            # inline, as the pools are about to be shut down too
+            task.cancel()
+            self.queue.release(job_id)
+            raise
+
+        finished = False
+        if task.cancelled():
+            pass
+        elif isinstance(task.exception(), ExecutorSaturatedError):
+            # Interactive traffic has the pools; leave the job for later
+            await self._queue_call(self.queue.release, job_id)
+            await asyncio.sleep(settings.EXECUTOR_RETRY_AFTER)
+            return
+        elif task.exception() is not None:
+            error = task.exception()
+            logger.error(f"Job {job_id} failed: {error}")
+            finished = await self._queue_call(self.queue.fail, job_id, str(getattr(error, "detail", error)))
+        else:
+            finished = await self._queue_call(self.queue.complete, job_id, task.result())
+
+        await self._queue_call(self.queue.remove_files, job_id)
+        job = await self._queue_call(self.queue.get, job_id)
+        if finished and job is not None and job["callback_url"]:
+            # Retries sleep between attempts, so not in the bounded thread pool
+            await loop.run_in_executor(None, post_callback, job["callback_url"], job_status(job))
+
+
+async def run_job_runners(count: int, prefix: str) -> None:
+    """Run count job runners until cancelled"""
+    runners = [JobRunner(job_queue, f"{prefix}-{i}") for i in range(count)]
+    try:
+        await asyncio.gather(*(runner.run() for runner in runners))
+    finally:
+        for runner in runners:
+            runner.stop()
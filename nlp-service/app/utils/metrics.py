@@ -0,0 +1,212 @@
+"""
+Metrics Utility
+Per-stage latency histograms and parser fallback counters in Prometheus text format
+"""
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.config import settings
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upload size buckets used as a label: (exclusive upper bound in bytes, label)
+SIZE_BUCKETS = (
+    (100 * 1024, "lt_100kb"),
+    (1024 * 1024, "lt_1mb"),
+    (5 * 1024 * 1024, "lt_5mb"),
+)
+SIZE_BUCKET_MAX = "ge_5mb"
+
+_NULL_CONTEXT = nullcontext()
+
+
+def size_bucket(size: int) -> str:
+    """Label for an upload size"""
+    for limit, label in SIZE_BUCKETS:
+        if size < limit:
+            return label
+    return SIZE_BUCKET_MAX
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                cumulative += count
+                bucket_labels = _format_labels(self.label_names, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            series_labels = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{series_labels} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{series_labels} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by label values"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value:g}")
+        return lines
+
+
+class DocumentTimer:
+    """
+    Stage durations and fallback events of one document
+
+    Filled by the worker that parses the document (possibly in another
+    process) and handed back as a plain dict, so the parent process can
+    record it with the right file type and size labels.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.fallbacks: List[Tuple[str, str]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def export(self) -> Dict:
+        return {"stages": self.stages, "fallbacks": self.fallbacks}
+
+
+class Metrics:
+    """
+    Process-wide metrics registry
+
+    When disabled every hook returns after a single attribute check, so
+    instrumented code pays next to nothing. Each process (uvicorn worker)
+    keeps its own registry.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.stage_seconds = Histogram(
+            "nlp_stage_duration_seconds",
+            "Time spent in each analysis pipeline stage",
+            ("stage", "file_type", "size"),
+        )
+        self.fallbacks = Counter(
+            "nlp_parser_fallbacks_total",
+            "Documents or pages handed to a fallback parser",
+            ("kind", "backend"),
+        )
+        self._local = threading.local()
+
+    @contextmanager
+    def document(self) -> Iterator[Optional[DocumentTimer]]:
+        """Collect stage timings for one document in this thread (None when disabled)"""
+        if not self.enabled:
+            yield None
+            return
+        timer = DocumentTimer()
+        previous = getattr(self._local, "timer", None)
+        self._local.timer = timer
+        try:
+            yield timer
+        finally:
+            self._local.timer = previous
+
+    def stage(self, name: str):
+        """Time a block as part of the current document; no-op outside document()"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        timer = getattr(self._local, "timer", None)
+        if timer is None:
+            return _NULL_CONTEXT
+        return timer.stage(name)
+
+    def fallback(self, kind: str, backend: str = "") -> None:
+        """Count a fallback (pdf_open, pdf_page, pdf_document, docx, raw_decode, fuzzy_budget)"""
+        if not self.enabled:
+            return
+        timer = getattr(self._local, "timer", None)
+        if timer is not None:
+            timer.fallbacks.append((kind, backend or ""))
+        else:
+            self.fallbacks.inc((kind, backend or ""))
+
+    def observe(self, stage: str, seconds: float, file_type: str, size: str) -> None:
+        """Record one stage duration directly"""
+        if self.enabled:
+            self.stage_seconds.observe((stage, file_type, size), seconds)
+
+    def record_document(self, timings: Optional[Dict], file_type: str, size: str) -> None:
+        """Record what a DocumentTimer exported, labelled by file type and size"""
+        if not self.enabled or not timings:
+            return
+        for stage, seconds in timings["stages"].items():
+            self.stage_seconds.observe((stage, file_type, size), seconds)
+        for kind, backend in timings["fallbacks"]:
+            self.fallbacks.inc((kind, backend))
+
+    def render(self, extra: Optional[List[str]] = None) -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = self.stage_seconds.render() + self.fallbacks.render()
+        if extra:
+            lines.extend(extra)
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics(settings.METRICS_ENABLED)
@@ -0,0 +1,241 @@
+"""
+Profiling Utility
+Opt-in cProfile capture of single requests or a sample of traffic
+"""
+
+import asyncio
+import contextvars
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from io import StringIO
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.utils.auth import is_admin_token
+
+logger = logging.getLogger(__name__)
+
+# Request header asking for a profile of that request (needs X-Admin-Token too)
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]+-[0-9a-f]{8}$")
+
+
+class _StatsHolder:
+    """Lets pstats.Stats load a stats dict returned by a worker"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfileSession:
+    """Profile data collected for one request"""
+
+    def __init__(self, method: str, path: str, reason: str):
+        self.id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        self.method = method
+        self.path = path
+        self.reason = reason
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.worker_stats: List[Dict] = []
+
+    def add_worker_stats(self, stats: Optional[Dict]) -> None:
+        """Merge stats profiled inside a worker thread or process"""
+        if stats:
+            self.worker_stats.append(stats)
+
+
+# Set while a profiled request is being handled, so code that hands work to
+# the executor pools can ask the worker to profile itself
+current_profile: contextvars.ContextVar[Optional[ProfileSession]] = contextvars.ContextVar(
+    "current_profile", default=None
+)
+
+
+def run_profiled(func, *args, **kwargs):
+    """
+    Run func under cProfile (inside a worker)
+
+    Returns:
+        Tuple of (func result, raw stats dict to pass to add_worker_stats)
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return result, profiler.stats
+
+
+class ProfileStore:
+    """Saves profiles as .prof files (pstats format) with a JSON sidecar"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def save(self, session: ProfileSession, loop_profiler: Optional[cProfile.Profile]) -> Optional[str]:
+        """
+        Merge event-loop and worker stats of a request and write them to disk
+
+        Blocks on disk I/O (including pruning old profiles), so async callers
+        run it in an executor.
+        """
+        sources = [_StatsHolder(stats) for stats in session.worker_stats]
+        if loop_profiler is not None:
+            sources.insert(0, loop_profiler)
+        if not sources:
+            return None
+
+        stats = pstats.Stats(*sources)
+        path = os.path.join(self.directory, f"{session.id}.prof")
+        meta = {
+            "id": session.id,
+            "method": session.method,
+            "path": session.path,
+            "reason": session.reason,
+            "seconds": round((session.finished or time.perf_counter()) - session.started, 4),
+            "created_at": time.time(),
+            "includes_event_loop": loop_profiler is not None,
+            "worker_profiles": len(session.worker_stats),
+        }
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(path)
+                with open(os.path.join(self.directory, f"{session.id}.json"), "w") as f:
+                    json.dump(meta, f)
+                self._prune()
+            except OSError as e:
+                logger.error(f"Profile write error: {e}")
+                return None
+        logger.info(f"Saved profile {session.id} for {session.method} {session.path}")
+        return path
+
+    def _prune(self) -> None:
+        for meta in self.list()[self.max_files:]:
+            for suffix in (".prof", ".json"):
+                try:
+                    os.remove(os.path.join(self.directory, meta["id"] + suffix))
+                except OSError:
+                    pass
+
+    def list(self) -> List[Dict]:
+        """Metadata of stored profiles, newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".json"):
+                try:
+                    with open(os.path.join(self.directory, filename)) as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        profiles.sort(key=lambda meta: meta.get("created_at", 0), reverse=True)
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """Path of a stored .prof file, or None for unknown/invalid IDs"""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = os.path.join(self.directory, f"{profile_id}.prof")
+        return path if os.path.exists(path) else None
+
+    def summary(self, profile_id: str, limit: int = 40, sort: str = "cumulative") -> Optional[str]:
+        """Top functions of a stored profile as pstats text"""
+        path = self.path(profile_id)
+        if path is None:
+            return None
+        output = StringIO()
+        pstats.Stats(path, stream=output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests on demand
+
+    A request is profiled when it sends ``X-Profile: 1`` with a valid
+    ``X-Admin-Token``, or when it falls into the ``sample_rate`` share of
+    traffic. The event-loop thread is profiled with cProfile for the whole
+    request (one request at a time, since other requests' coroutines run
+    on the same thread); work sent to the executor pools is profiled in
+    the worker and merged in. The response carries ``X-Profile-Id``.
+
+    Only installed when PROFILING_ENABLED is set, so it costs nothing
+    otherwise.
+    """
+
+    def __init__(self, app, store: ProfileStore = profile_store, sample_rate: float = 0.0):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self._loop_profiling = False
+
+    def _reason(self, scope) -> Optional[str]:
+        headers = dict(scope.get("headers") or [])
+        requested = headers.get(PROFILE_HEADER, b"").lower() in (b"1", b"true", b"yes")
+        if requested:
+            token = headers.get(ADMIN_TOKEN_HEADER, b"").decode("latin-1")
+            if is_admin_token(token):
+                return "requested"
+            logger.warning("Ignoring X-Profile header without a valid admin token")
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        reason = self._reason(scope)
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession(scope.get("method", ""), scope.get("path", ""), reason)
+        context_token = current_profile.set(session)
+
+        loop_profiler = None
+        if not self._loop_profiling:
+            self._loop_profiling = True
+            loop_profiler = cProfile.Profile()
+            loop_profiler.enable()
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", [])) + [(b"x-profile-id", session.id.encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            session.finished = time.perf_counter()
+            if loop_profiler is not None:
+                loop_profiler.disable()
+                self._loop_profiling = False
+            current_profile.reset(context_token)
+            # Dumping and pruning would otherwise stall the loop being measured
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.store.save, session, loop_profiler
+            )
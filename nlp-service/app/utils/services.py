@@ -0,0 +1,52 @@
+"""
+Services
+Shared pipeline objects, constructed on first use
+"""
+
+import threading
+from typing import Any, Callable, Dict
+
+
+class Services:
+    """
+    Lazily built SkillExtractor, SkillMatcher and ResumeParser
+
+    Importing the app (or a route module) constructs nothing; each object
+    is built by the first request or warm-up step that needs it, in
+    whichever process that is (worker processes build their own). The
+    taxonomy itself loads lazily through taxonomy_store.
+    """
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = self._instances[name] = factory()
+        return instance
+
+    @property
+    def skill_extractor(self):
+        from app.nlp.skill_extractor import SkillExtractor
+
+        return self._get("skill_extractor", SkillExtractor)
+
+    @property
+    def skill_matcher(self):
+        from app.nlp.skill_matcher import SkillMatcher
+
+        return self._get("skill_matcher", SkillMatcher)
+
+    @property
+    def resume_parser(self):
+        from app.parsers.resume_parser import ResumeParser
+
+        return self._get("resume_parser", ResumeParser)
+
+
+services = Services()
@@ -0,0 +1,23 @@
+"""
+Text Utilities
+Character helpers shared by the parsers and the skill scanner
+"""
+
+
+def is_word_char(ch: str) -> bool:
+    """Return True for characters that regex ``\\w`` treats as word characters"""
+    return ch.isalnum() or ch == "_"
+
+
+def lower_preserving_offsets(text: str) -> str:
+    """
+    Lowercase text without changing its length
+
+    ``str.lower`` expands a few characters (e.g. "İ" -> "i̇"), which would
+    shift every offset after them. Those characters are mapped to the first
+    character of their lowercase form instead.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch.lower()[:1] for ch in text)
@@ -0,0 +1,291 @@
+"""
+Uploads Utility
+Chunked upload reception with size limits and spooling to temp files
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.parsers.archive_parser import iter_archive_members
+from app.parsers.buffers import buffer_stream
+from app.parsers.resume_parser import detect_file_type
+
+logger = logging.getLogger(__name__)
+
+# Room for form fields and multipart headers around the file in a request body
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload grows past its size limit while being read"""
+
+    def __init__(self, max_size: int):
+        super().__init__(f"File exceeds the maximum size of {max_size} bytes")
+        self.max_size = max_size
+
+
+class RequestTooLargeError(HTTPException):
+    """
+    Raised from the receive channel when a request body passes its limit
+
+    An HTTPException so FastAPI's form parsing lets it through as a 413
+    instead of turning it into a generic body parsing error.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"Request body exceeds {limit} bytes")
+
+
+class UploadedDocument:
+    """
+    An upload held in memory when small, or spooled to a temp file
+
+    Parse workers get ``source``: the bytes, or the temp file path, which
+    they memory-map. Large uploads are therefore never pickled to a worker
+    process or gathered into one bytes object.
+    """
+
+    def __init__(
+        self,
+        data: Optional[bytes] = None,
+        path: Optional[str] = None,
+        size: int = 0,
+        sha256: str = "",
+        file_type: str = "text",
+    ):
+        self.data = data
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+        self.file_type = file_type
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "UploadedDocument":
+        """Wrap bytes that are already in memory (archive members, warm-up)"""
+        return cls(
+            data=data,
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            file_type=detect_file_type(data),
+        )
+
+    @property
+    def spooled(self) -> bool:
+        return self.path is not None
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        """Bytes, or the path of the spooled temp file"""
+        return self.path if self.path is not None else self.data
+
+    def open(self) -> BinaryIO:
+        """Binary stream over the contents"""
+        if self.path is not None:
+            return open(self.path, "rb")
+        return buffer_stream(self.data)
+
+    def read_bytes(self) -> bytes:
+        """Whole contents as bytes (reads spooled files back into memory)"""
+        if self.path is None:
+            return self.data
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def close(self) -> None:
+        """Delete the temp file of a spooled upload"""
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                logger.warning(f"Could not remove spooled upload {self.path}: {e}")
+            self.path = None
+
+
+async def receive_upload(
+    upload: UploadFile,
+    max_size: int,
+    spool_threshold: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    spool_dir: Optional[str] = None,
+) -> UploadedDocument:
+    """
+    Read an upload chunk by chunk into an UploadedDocument
+
+    The file type is detected from the first chunk and the content hash is
+    updated as chunks arrive. Once the upload passes spool_threshold it is
+    written to a temp file (in spool_dir, default UPLOAD_SPOOL_DIR) instead
+    of growing in memory.
+
+    Raises:
+        UploadTooLargeError: The upload is larger than max_size
+    """
+    spool_threshold = settings.UPLOAD_SPOOL_THRESHOLD if spool_threshold is None else spool_threshold
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+    file_type = None
+    spool = None
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                raise UploadTooLargeError(max_size)
+            if file_type is None:
+                file_type = detect_file_type(chunk)
+            digest.update(chunk)
+
+            if spool is None and size > spool_threshold:
+                spool = await run_in_threadpool(
+                    tempfile.NamedTemporaryFile,
+                    prefix="upload-",
+                    dir=spool_dir or settings.UPLOAD_SPOOL_DIR,
+                    delete=False,
+                )
+                chunks.append(chunk)
+                await run_in_threadpool(spool.writelines, chunks)
+                chunks = []
+            elif spool is not None:
+                await run_in_threadpool(spool.write, chunk)
+            else:
+                chunks.append(chunk)
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise
+
+    if spool is not None:
+        await run_in_threadpool(spool.close)
+        return UploadedDocument(
+            path=spool.name, size=size, sha256=digest.hexdigest(), file_type=file_type
+        )
+    return UploadedDocument(
+        data=b"".join(chunks), size=size, sha256=digest.hexdigest(), file_type=file_type or "text"
+    )
+
+
+def spool_stream(
+    stream: BinaryIO,
+    max_size: int,
+    chunk_size: Optional[int] = None,
+    spool_dir: Optional[str] = None,
+) -> UploadedDocument:
+    """
+    Copy a binary stream into a temp file, hashing it on the way (blocking)
+
+    Raises:
+        UploadTooLargeError: The stream holds more than max_size bytes
+    """
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    digest = hashlib.sha256()
+    size = 0
+    file_type = None
+    spool = tempfile.NamedTemporaryFile(
+        prefix="upload-", dir=spool_dir or settings.UPLOAD_SPOOL_DIR, delete=False
+    )
+    try:
+        with spool:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(max_size)
+                if file_type is None:
+                    file_type = detect_file_type(chunk)
+                digest.update(chunk)
+                spool.write(chunk)
+    except BaseException:
+        os.remove(spool.name)
+        raise
+    return UploadedDocument(
+        path=spool.name, size=size, sha256=digest.hexdigest(), file_type=file_type or "text"
+    )
+
+
+def spool_archive(
+    filename: str,
+    archive: UploadedDocument,
+    max_files: int,
+    max_total_size: int,
+    spool_dir: Optional[str] = None,
+) -> List[Tuple[str, UploadedDocument]]:
+    """
+    Expand an archive upload into one spooled document per member (blocking)
+
+    Members go straight from the decompressor to temp files, so a small
+    archive that expands to many large members never sits in memory.
+    Members over MAX_FILE_SIZE are skipped.
+
+    Raises:
+        ArchiveTooLargeError: The members add up to more than max_total_size
+        zipfile.BadZipFile, tarfile.TarError: The archive is unreadable
+    """
+    documents: List[Tuple[str, UploadedDocument]] = []
+    try:
+        with archive.open() as archive_file:
+            for name, size, member in iter_archive_members(
+                filename, archive_file, max_files, settings.MAX_FILE_SIZE, max_total_size
+            ):
+                documents.append((name, spool_stream(member, size, spool_dir=spool_dir)))
+    except BaseException:
+        for _, document in documents:
+            document.close()
+        raise
+    return documents
+
+
+class UploadLimitMiddleware:
+    """
+    ASGI middleware rejecting request bodies over a per-path limit
+
+    A declared Content-Length over the limit is refused before any of the
+    body is read; otherwise body bytes are counted as they arrive, so an
+    oversized chunked upload stops being received (and spooled by the
+    form parser) as soon as it passes the limit.
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope.get("path")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            error = RequestTooLargeError(limit)
+            response = JSONResponse({"detail": error.detail}, status_code=error.status_code)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise RequestTooLargeError(limit)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,146 @@
+"""
+Warm-up Utility
+Preloads parsers, the taxonomy and optional models after startup
+"""
+
+import importlib
+import importlib.util
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Short resume run through the full pipeline once, so first requests skip cold paths
+SAMPLE_RESUME = (
+    "Senior software engineer. Expert in Python and JavaScript, experience with "
+    "React, Node.js, Docker, Kubernetes, AWS and PostgreSQL. Worked with CI/CD and Git."
+)
+
+WARMUP_STEPS: Dict[str, Callable[[], None]] = {}
+
+
+def register_warmup_step(name: str) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Decorator adding a named step that WARMUP_STEPS settings can enable"""
+    def decorator(step: Callable[[], None]) -> Callable[[], None]:
+        WARMUP_STEPS[name] = step
+        return step
+    return decorator
+
+
+class WarmupState:
+    """
+    Readiness of the service, separate from liveness
+
+    Status moves from "pending" to "warming" to "ready". A failed step is
+    recorded but does not block readiness: whatever it was preloading is
+    still loaded lazily by the first request that needs it.
+    """
+
+    def __init__(self):
+        self.status = "pending"
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.steps: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def get_state(self) -> Dict:
+        """Status plus per-step timings"""
+        with self._lock:
+            return {
+                "status": self.status,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "steps": {name: dict(step) for name, step in self.steps.items()},
+            }
+
+
+warmup_state = WarmupState()
+
+
+def run_warmup(step_names: Iterable[str]) -> None:
+    """
+    Run the named warm-up steps in order, then mark the service ready
+
+    Args:
+        step_names: Keys of WARMUP_STEPS; unknown names are logged and skipped
+    """
+    with warmup_state._lock:
+        warmup_state.status = "warming"
+        warmup_state.started_at = time.time()
+
+    for name in step_names:
+        step = WARMUP_STEPS.get(name)
+        start = time.perf_counter()
+        try:
+            if step is None:
+                raise ValueError(f"Unknown warm-up step: {name}")
+            step()
+            result = {"ok": True}
+        except Exception as e:
+            logger.error(f"Warm-up step {name} failed: {e}")
+            result = {"ok": False, "error": str(e)}
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        with warmup_state._lock:
+            warmup_state.steps[name] = result
+        logger.info(f"Warm-up step {name}: {result['seconds']}s")
+
+    with warmup_state._lock:
+        warmup_state.status = "ready"
+        warmup_state.finished_at = time.time()
+    logger.info(f"Warm-up finished in {warmup_state.finished_at - warmup_state.started_at:.2f}s")
+
+
+@register_warmup_step("taxonomy")
+def warm_taxonomy() -> None:
+    """Load (or compile) the taxonomy artifact and the role score matrix"""
+    from app.nlp.taxonomy import taxonomy_store
+
+    taxonomy_store.current.role_index.warm()
+
+
+@register_warmup_step("parsers")
+def warm_parsers() -> None:
+    """Import the installed PDF backends and python-docx"""
+    from app.parsers.pdf_backends import PDF_BACKENDS, available_backends
+
+    for name in available_backends():
+        for module in PDF_BACKENDS[name].modules:
+            if importlib.util.find_spec(module):
+                importlib.import_module(module)
+    if importlib.util.find_spec("docx"):
+        importlib.import_module("docx")
+
+
+@register_warmup_step("pools")
+def warm_pools() -> None:
+    """Start worker threads and processes (forked after the steps before this one)"""
+    from app.utils.executor import worker_pools
+
+    worker_pools.prestart()
+
+
+@register_warmup_step("extraction")
+def warm_extraction() -> None:
+    """Run a sample resume through parsing, extraction and role matching"""
+    from app.routes.analysis import parse_and_extract_sync
+    from app.utils.services import services
+
+    _, skills, _ = parse_and_extract_sync(SAMPLE_RESUME.encode())
+    services.skill_matcher.match_all_roles([skill["name"] for skill in skills])
+
+
+@register_warmup_step("semantic")
+def warm_semantic() -> None:
+    """Load the sentence-transformer model when semantic matching is enabled"""
+    from app.nlp.taxonomy import taxonomy_store
+    from app.utils.services import services
+
+    skill_matcher = services.skill_matcher
+    if skill_matcher.semantic_enabled:
+        skill_matcher._get_semantic_index(taxonomy_store.current)
@@ -0,0 +1,134 @@
+"""
+DOCX Parser Benchmark
+Compares the streaming DOCX parser with the python-docx object model
+
+Usage (from nlp-service/):
+    python -m benchmarks.bench_docx [--words 600] [--documents 20] [--repeat 5] [--output results.json]
+
+Each synthetic resume has a page header, a footer and a skills table with
+merged cells in the middle of the body. Token F1 is measured against the
+full text; "in order" is the share of documents whose lines come out in
+document order (header, body, table, body, footer). Peak memory counts
+Python allocations only; tracemalloc does not see lxml's C allocations,
+so python-docx's true peak is higher.
+"""
+
+import argparse
+import logging
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from app.parsers.resume_parser import ResumeParser
+from app.parsers.docx_stream import extract_docx_text
+from benchmarks.bench_pdf_backends import token_f1
+from benchmarks.corpus import generate_resume, render_docx
+from benchmarks.report import summarize, time_calls, write_report
+
+HEADER = "Jane Doe\njane.doe@example.com | +1 555 0100"
+FOOTER = "References available on request"
+SKILLS_TABLE = [
+    ["Skills", None, "Level"],
+    ["Python", "Django", "Expert"],
+    ["Docker", "Kubernetes", "Advanced"],
+    ["Cloud", None, "AWS"],
+]
+
+
+def _document(words: int, seed: int) -> Dict:
+    body = generate_resume(words, seed=seed).splitlines()
+    middle = len(body) // 2
+    table_lines = [cell for row in SKILLS_TABLE for cell in row if cell is not None]
+    lines = HEADER.splitlines() + body[:middle] + table_lines + body[middle:] + [FOOTER]
+    return {
+        "truth": "\n".join(lines),
+        "lines": lines,
+        "bytes": render_docx("\n".join(body), header=HEADER, footer=FOOTER, table=SKILLS_TABLE),
+    }
+
+
+def _peak_kb(func: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(words: List[int], documents: int, repeat: int) -> Dict:
+    resume_parser = ResumeParser()
+    parsers: Dict[str, Callable[[bytes], Optional[str]]] = {
+        "stream": extract_docx_text,
+        "python-docx": resume_parser._parse_docx_document,
+    }
+
+    results = {}
+    for size in words:
+        corpus = [_document(size, seed) for seed in range(documents)]
+        per_parser = {}
+        for name, parse in parsers.items():
+            texts = [parse(doc["bytes"]) or "" for doc in corpus]
+            timings = []
+            for doc in corpus:
+                timings.append(time_calls(lambda d=doc: parse(d["bytes"]), repeat)["mean_ms"])
+            per_parser[name] = {
+                "per_document": summarize([ms / 1000 for ms in timings]),
+                "peak_kb": round(max(_peak_kb(lambda d=doc: parse(d["bytes"])) for doc in corpus[:3]), 1),
+                "token_f1": round(
+                    sum(token_f1(text, doc["truth"], resume_parser) for text, doc in zip(texts, corpus))
+                    / len(corpus), 4
+                ),
+                "in_order": round(
+                    sum(text.splitlines() == doc["lines"] for text, doc in zip(texts, corpus))
+                    / len(corpus), 4
+                ),
+            }
+        per_parser["speedup"] = round(
+            per_parser["python-docx"]["per_document"]["mean_ms"]
+            / per_parser["stream"]["per_document"]["mean_ms"], 2
+        )
+        results[str(size)] = per_parser
+
+    return {
+        "benchmark": "docx",
+        "documents": documents,
+        "repeat": repeat,
+        "sizes": results,
+    }
+
+
+def print_table(report: Dict) -> None:
+    header = (
+        f"{'words':>7} {'parser':<12} {'mean ms':>9} {'p95 ms':>9} "
+        f"{'peak KB':>9} {'token F1':>9} {'in order':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for size, parsers in report["sizes"].items():
+        for name in ("stream", "python-docx"):
+            r = parsers[name]
+            print(
+                f"{size:>7} {name:<12} {r['per_document']['mean_ms']:>9} {r['per_document']['p95_ms']:>9} "
+                f"{r['peak_kb']:>9} {r['token_f1']:>9} {r['in_order']:>9}"
+            )
+        print(f"{size:>7} {'speedup':<12} {parsers['speedup']:>9}x")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--words", type=int, action="append", help="resume size(s) in words (default 600, 6000)")
+    arg_parser.add_argument("--documents", type=int, default=20, help="resumes per size")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="timed parses per resume")
+    arg_parser.add_argument("--output", help="write the report as JSON to this path")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    report = run(args.words or [600, 6000], args.documents, args.repeat)
+    print_table(report)
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Skill Engine Benchmark
+Compares the Aho-Corasick scanner with the spaCy PhraseMatcher engine on the same resumes
+
+Usage (from nlp-service/):
+    python -m benchmarks.bench_engines [--documents 200] [--batch-size 64] [--n-process 1] [--fuzzy] [--output results.json]
+
+Per-document timings call extract_skills once per resume; batch timings
+run the whole corpus through extract_skills_batch (nlp.pipe for spaCy).
+Agreement is the mean Jaccard overlap of each engine's skill names with
+the scanner's. The spaCy engine is skipped when spaCy is not installed;
+--fuzzy adds the scanner followed by the fuzzy stage (no latency budget).
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict, List, Set
+
+from app.config import settings
+from app.nlp.phrase_engine import SKILL_ENGINES, spacy_available
+from app.nlp.skill_extractor import SkillExtractor
+from benchmarks.corpus import generate_resume
+from benchmarks.report import summarize, time_calls, write_report
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def run(
+    words: List[int], density: float, documents: int, repeat: int,
+    batch_size: int, n_process: int, fuzzy: bool = False,
+) -> Dict:
+    engines = [name for name in SKILL_ENGINES if name != "spacy" or spacy_available()]
+    extractors = {name: SkillExtractor(engine=name, fuzzy=False) for name in engines}
+    if fuzzy:
+        extractors["fuzzy"] = SkillExtractor(engine="scanner", fuzzy=True)
+
+    results = {}
+    for size in words:
+        texts = [generate_resume(size, density, seed) for seed in range(documents)]
+        reference = [
+            {s["name"] for s in skills}
+            for skills in extractors["scanner"].extract_skills_batch(texts)
+        ]
+
+        per_engine = {}
+        for name, extractor in extractors.items():
+            # Build the matcher before timing anything
+            extractor.extract_skills(texts[0])
+            found = [{s["name"] for s in skills} for skills in extractor.extract_skills_batch(texts)]
+
+            per_document = []
+            for _ in range(repeat):
+                for text in texts:
+                    start = time.perf_counter()
+                    extractor.extract_skills(text)
+                    per_document.append(time.perf_counter() - start)
+
+            batch = time_calls(
+                lambda e=extractor: e.extract_skills_batch(texts, batch_size, n_process), repeat
+            )
+            batch["ms_per_document"] = round(batch["mean_ms"] / len(texts), 4)
+
+            per_engine[name] = {
+                "per_document": summarize(per_document),
+                "batch": batch,
+                "skills_found": round(sum(len(s) for s in found) / len(found), 2),
+                "agreement": round(
+                    sum(_jaccard(a, b) for a, b in zip(found, reference)) / len(found), 4
+                ),
+            }
+        results[str(size)] = per_engine
+
+    return {
+        "benchmark": "engines",
+        "engines": list(extractors),
+        "spacy_available": spacy_available(),
+        "skill_density": density,
+        "documents": documents,
+        "repeat": repeat,
+        "batch_size": batch_size,
+        "n_process": n_process,
+        "sizes": results,
+    }
+
+
+def print_table(report: Dict) -> None:
+    header = (
+        f"{'words':>7} {'engine':<8} {'doc p50 ms':>11} {'doc p95 ms':>11} "
+        f"{'batch ms/doc':>13} {'skills':>7} {'agreement':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for size, engines in report["sizes"].items():
+        for name, r in engines.items():
+            print(
+                f"{size:>7} {name:<8} {r['per_document']['p50_ms']:>11} {r['per_document']['p95_ms']:>11} "
+                f"{r['batch']['ms_per_document']:>13} {r['skills_found']:>7} {r['agreement']:>10}"
+            )
+    if not report["spacy_available"]:
+        print("spaCy is not installed; only the scanner was measured")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--words", type=int, action="append", help="resume size(s) in words (default 300, 1500)")
+    arg_parser.add_argument("--density", type=float, default=0.05, help="share of words that are skills")
+    arg_parser.add_argument("--documents", type=int, default=200, help="resumes per size")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="passes over the corpus")
+    arg_parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size")
+    arg_parser.add_argument("--n-process", type=int, default=1, help="nlp.pipe processes")
+    arg_parser.add_argument("--fuzzy", action="store_true", help="also measure the scanner with fuzzy matching")
+    arg_parser.add_argument("--output", help="write the report as JSON to this path")
+    args = arg_parser.parse_args()
+
+    # Per-call INFO logs would dominate the timings
+    logging.disable(logging.INFO)
+    if args.fuzzy:
+        settings.FUZZY_BUDGET_MS = 0
+
+    report = run(
+        args.words or [300, 1500], args.density, args.documents, args.repeat,
+        args.batch_size, args.n_process, args.fuzzy,
+    )
+    print_table(report)
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+PDF Backend Benchmark
+Reports per-backend throughput and extraction fidelity on the sample corpus
+
+Usage (from nlp-service/):
+    python -m benchmarks.bench_pdf_backends [--repeat 5] [--pages 1] [--output results.json]
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.nlp.skill_extractor import SkillExtractor
+from app.parsers.pdf_backends import PDF_BACKENDS, available_backends, get_backend
+from app.parsers.resume_parser import ResumeParser
+from benchmarks.corpus import SAMPLES_DIR, load_samples, render_pdf
+from benchmarks.report import write_report
+
+
+def _tokens(text: str, parser: ResumeParser) -> Counter:
+    return Counter(parser._clean_text(text).lower().split())
+
+
+def token_f1(extracted: str, truth: str, parser: ResumeParser) -> float:
+    """Bag-of-tokens F1 between extracted and ground-truth text"""
+    got, expected = _tokens(extracted, parser), _tokens(truth, parser)
+    overlap = sum((got & expected).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(got.values())
+    recall = overlap / sum(expected.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def skill_recall(extracted: str, truth: str, extractor: SkillExtractor) -> float:
+    """Share of ground-truth skills still found in the extracted text"""
+    expected = {s["name"] for s in extractor.extract_skills(truth)}
+    if not expected:
+        return 1.0
+    got = {s["name"] for s in extractor.extract_skills(extracted)}
+    return len(expected & got) / len(expected)
+
+
+def extract_all(backend_name: str, file_bytes: bytes) -> Tuple[str, int]:
+    """Extract every page with one backend, returning (text, page count)"""
+    document = get_backend(backend_name).open(file_bytes)
+    try:
+        text = "\n".join(
+            document.extract_page(i) or "" for i in range(document.page_count)
+        )
+        return text, document.page_count
+    finally:
+        document.close()
+
+
+def run(corpus_dir: str, repeat: int, pages: int, backends: Optional[List[str]] = None) -> Dict:
+    parser = ResumeParser()
+    extractor = SkillExtractor()
+    samples = load_samples(corpus_dir)
+
+    # Repeat the text to produce multi-page documents when requested
+    documents = {}
+    for name, text in samples.items():
+        truth = "\n".join([text] * pages)
+        documents[name] = (truth, render_pdf(truth))
+
+    results = {}
+    for backend_name in backends or available_backends():
+        elapsed = 0.0
+        page_count = 0
+        total_bytes = 0
+        f1_scores = []
+        recalls = []
+        errors = 0
+
+        for truth, pdf_bytes in documents.values():
+            try:
+                text, doc_pages = extract_all(backend_name, pdf_bytes)
+            except Exception:
+                errors += 1
+                continue
+            f1_scores.append(token_f1(text, truth, parser))
+            recalls.append(skill_recall(text, truth, extractor))
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                extract_all(backend_name, pdf_bytes)
+            elapsed += time.perf_counter() - start
+            page_count += doc_pages * repeat
+            total_bytes += len(pdf_bytes) * repeat
+
+        results[backend_name] = {
+            "documents": len(documents) - errors,
+            "errors": errors,
+            "ms_per_document": round(elapsed * 1000 / max((len(documents) - errors) * repeat, 1), 2),
+            "pages_per_second": round(page_count / elapsed, 1) if elapsed else 0.0,
+            "mb_per_second": round(total_bytes / elapsed / 1e6, 2) if elapsed else 0.0,
+            "token_f1": round(sum(f1_scores) / len(f1_scores), 3) if f1_scores else 0.0,
+            "skill_recall": round(sum(recalls) / len(recalls), 3) if recalls else 0.0,
+        }
+
+    return {
+        "corpus": os.path.abspath(corpus_dir),
+        "samples": len(documents),
+        "pages_per_sample": pages,
+        "repeat": repeat,
+        "backends": results,
+    }
+
+
+def print_table(report: Dict) -> None:
+    header = f"{'backend':<12} {'ms/doc':>9} {'pages/s':>9} {'MB/s':>7} {'token F1':>9} {'skills':>7} {'errors':>7}"
+    print(header)
+    print("-" * len(header))
+    for name, r in report["backends"].items():
+        print(
+            f"{name:<12} {r['ms_per_document']:>9} {r['pages_per_second']:>9} "
+            f"{r['mb_per_second']:>7} {r['token_f1']:>9} {r['skill_recall']:>7} {r['errors']:>7}"
+        )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--corpus", default=SAMPLES_DIR, help="directory of ground-truth .txt resumes")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="timed extractions per document")
+    arg_parser.add_argument("--pages", type=int, default=1, help="repeat each sample to this many copies")
+    arg_parser.add_argument("--backend", action="append", choices=sorted(PDF_BACKENDS), help="limit to backend(s)")
+    arg_parser.add_argument("--output", help="write the report as JSON to this path")
+    args = arg_parser.parse_args()
+
+    report = run(args.corpus, args.repeat, args.pages, args.backend)
+    print_table(report)
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
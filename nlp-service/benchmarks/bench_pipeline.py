@@ -0,0 +1,93 @@
+"""
+Pipeline Micro-benchmarks
+Times parsing, text cleanup, skill extraction and matching on synthetic resumes
+
+Usage (from nlp-service/):
+    python -m benchmarks.bench_pipeline [--words 600] [--density 0.05] [--repeat 50] [--output results.json]
+"""
+
+import argparse
+import logging
+from typing import Dict, List
+
+from app.nlp.skill_extractor import SkillExtractor
+from app.nlp.skill_matcher import SkillMatcher
+from app.parsers.resume_parser import ResumeParser
+from app.utils.job_roles import get_required_skills
+from benchmarks.corpus import generate_resume, render
+from benchmarks.report import time_calls, write_report
+
+FILE_TYPES = ["txt", "docx", "pdf"]
+
+
+def run(words: List[int], density: float, repeat: int, role: str, seed: int) -> Dict:
+    parser = ResumeParser()
+    extractor = SkillExtractor()
+    matcher = SkillMatcher()
+    required = [s["name"] for s in get_required_skills(role)]
+
+    results = {}
+    for size in words:
+        text = generate_resume(size, density, seed)
+        files = {file_type: render(text, file_type) for file_type in FILE_TYPES}
+        cleaned = parser._clean_text(text)
+        skills = [s["name"] for s in extractor.extract_skills(cleaned)]
+
+        stages = {}
+        for file_type, file_bytes in files.items():
+            stages[f"parse_{file_type}"] = time_calls(lambda b=file_bytes: parser.parse(b), repeat)
+        stages["clean_text"] = time_calls(lambda: parser._clean_text(text), repeat)
+        stages["extract_skills"] = time_calls(lambda: extractor.extract_skills(cleaned), repeat)
+        stages["match_skills"] = time_calls(lambda: matcher.match_skills(skills, required), repeat)
+        stages["match_role"] = time_calls(lambda: matcher.match_role(skills, role), repeat)
+
+        results[str(size)] = {
+            "words": len(text.split()),
+            "skills_found": len(skills),
+            "file_bytes": {file_type: len(b) for file_type, b in files.items()},
+            "stages": stages,
+        }
+
+    return {
+        "benchmark": "pipeline",
+        "skill_density": density,
+        "repeat": repeat,
+        "role": role,
+        "seed": seed,
+        "sizes": results,
+    }
+
+
+def print_table(report: Dict) -> None:
+    header = f"{'words':>7} {'stage':<16} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for size, result in report["sizes"].items():
+        for stage, r in result["stages"].items():
+            print(
+                f"{size:>7} {stage:<16} {r['mean_ms']:>9} {r['p50_ms']:>9} "
+                f"{r['p95_ms']:>9} {r['p99_ms']:>9}"
+            )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--words", type=int, action="append", help="resume size(s) in words (default 300, 1500, 6000)")
+    arg_parser.add_argument("--density", type=float, default=0.05, help="share of words that are skills")
+    arg_parser.add_argument("--repeat", type=int, default=50, help="timed calls per stage")
+    arg_parser.add_argument("--role", default="fullstack-developer", help="role used for matching")
+    arg_parser.add_argument("--seed", type=int, default=0, help="random seed for the synthetic resumes")
+    arg_parser.add_argument("--output", help="write the report as JSON to this path")
+    args = arg_parser.parse_args()
+
+    # Per-call INFO logs would dominate the timings
+    logging.disable(logging.INFO)
+
+    report = run(args.words or [300, 1500, 6000], args.density, args.repeat, args.role, args.seed)
+    print_table(report)
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
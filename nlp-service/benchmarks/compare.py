@@ -0,0 +1,76 @@
+"""
+Benchmark Comparison
+Compares the timings of two JSON reports, e.g. from two commits
+
+Usage (from nlp-service/):
+    python -m benchmarks.compare base.json new.json [--threshold 0.10] [--fail-on-regression]
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+# Metrics where lower is better; everything else numeric is reported but not judged
+TIMING_SUFFIXES = ("_ms", "ms_per_document")
+
+
+def flatten(report: Dict, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.path, value) for every numeric leaf"""
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, float(value)
+
+
+def compare(base: Dict, new: Dict, threshold: float) -> Dict:
+    """
+    Relative change of every timing present in both reports
+
+    Returns:
+        Mapping of metric path to {base, new, change}, plus the list of
+        metrics that got slower by more than threshold
+    """
+    base_values = dict(flatten({k: v for k, v in base.items() if k != "environment"}))
+    new_values = dict(flatten({k: v for k, v in new.items() if k != "environment"}))
+
+    metrics = {}
+    regressions = []
+    for path, before in base_values.items():
+        if not path.endswith(TIMING_SUFFIXES) or path not in new_values:
+            continue
+        after = new_values[path]
+        change = (after - before) / before if before else 0.0
+        metrics[path] = {"base": before, "new": after, "change": round(change, 4)}
+        if change > threshold:
+            regressions.append(path)
+    return {"metrics": metrics, "regressions": regressions}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("base", help="report of the reference commit")
+    arg_parser.add_argument("new", help="report of the commit under test")
+    arg_parser.add_argument("--threshold", type=float, default=0.10, help="slowdown counted as a regression")
+    arg_parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if anything regressed")
+    args = arg_parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    result = compare(base, new, args.threshold)
+    print(f"base: {base.get('environment', {}).get('commit')}  new: {new.get('environment', {}).get('commit')}")
+    for path, m in result["metrics"].items():
+        flag = "  REGRESSION" if path in result["regressions"] else ""
+        print(f"{path:<60} {m['base']:>10.3f} {m['new']:>10.3f} {m['change']:>+8.1%}{flag}")
+
+    if result["regressions"] and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
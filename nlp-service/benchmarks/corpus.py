@@ -0,0 +1,244 @@
+"""
+Benchmark Corpus
+Sample and synthetic resumes, and helpers to render them as files
+"""
+
+import io
+import os
+import random
+import textwrap
+import zipfile
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "samples")
+
+PDF_LINES_PER_PAGE = 50
+PDF_LINE_WIDTH = 90
+
+# Filler vocabulary for synthetic resumes, chosen to contain no taxonomy skills
+FILLER_WORDS = (
+    "designed built delivered maintained improved reduced team project platform "
+    "customers reliability latency features release roadmap stakeholders quality "
+    "migration service pipeline internal ownership mentoring reviews documentation "
+    "performance launch budget partners analysis reporting metrics workflow support"
+).split()
+SECTION_TITLES = ["Summary", "Experience", "Projects", "Education", "Skills"]
+LEVEL_PHRASES = ["expert in", "experience with", "proficient in", "worked with", "senior"]
+
+
+def load_samples(directory: str = SAMPLES_DIR) -> Dict[str, str]:
+    """
+    Load ground-truth resume texts from a directory of .txt files
+
+    Returns:
+        Mapping of sample name (file name without extension) to text
+    """
+    samples = {}
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".txt"):
+            with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                samples[filename[:-4]] = f.read()
+    return samples
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def render_pdf(text: str) -> bytes:
+    """
+    Render plain text as a minimal text-layer PDF (Helvetica, one line per row)
+
+    Only the standard library is used, so benchmarks need no PDF writer.
+    """
+    lines: List[str] = []
+    for line in text.splitlines():
+        lines.extend(textwrap.wrap(line, PDF_LINE_WIDTH) or [""])
+    pages = [
+        lines[i:i + PDF_LINES_PER_PAGE]
+        for i in range(0, max(len(lines), 1), PDF_LINES_PER_PAGE)
+    ]
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects: List[bytes] = [b"", b"", b""]
+    page_refs = []
+    for page_lines in pages:
+        content = ["BT", "/F1 10 Tf", "14 TL", "72 770 Td"]
+        for line in page_lines:
+            content.append(f"({_pdf_escape(line)}) Tj T*")
+        content.append("ET")
+        stream = "\n".join(content).encode("latin-1", errors="replace")
+
+        page_number = len(objects) + 1
+        content_number = page_number + 1
+        page_refs.append(f"{page_number} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_number} 0 R >>".encode()
+        )
+        objects.append(
+            b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream"
+        )
+
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(pages)} >>".encode()
+    objects[2] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    return bytes(output)
+
+
+def generate_resume(
+    words: int = 600,
+    skill_density: float = 0.05,
+    seed: Optional[int] = 0,
+    skills: Optional[List[str]] = None,
+) -> str:
+    """
+    Build a synthetic resume of roughly the given size
+
+    Args:
+        words: Approximate number of words
+        skill_density: Share of words that are skill mentions (0-1)
+        seed: Random seed, so runs are comparable between commits
+        skills: Skill names to mention; defaults to the active taxonomy
+
+    Returns:
+        Resume text with section headings and one sentence per line
+    """
+    if skills is None:
+        from app.nlp.taxonomy import taxonomy_store
+        skills = [s["name"] for s in taxonomy_store.current.all_skills.values()]
+
+    rng = random.Random(seed)
+    lines = []
+    count = 0
+    while count < words:
+        if count == 0 or rng.random() < 0.08:
+            lines.append(SECTION_TITLES[len(lines) % len(SECTION_TITLES)])
+        sentence = []
+        for _ in range(rng.randint(8, 18)):
+            if rng.random() < skill_density:
+                if rng.random() < 0.3:
+                    sentence.append(rng.choice(LEVEL_PHRASES))
+                sentence.append(rng.choice(skills))
+            else:
+                sentence.append(rng.choice(FILLER_WORDS))
+        count += len(sentence)
+        line = " ".join(sentence)
+        lines.append(line[:1].upper() + line[1:] + ".")
+    return "\n".join(lines)
+
+
+def _docx_paragraph(line: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+
+
+def _docx_table(rows: List[List[Optional[str]]]) -> str:
+    """Table XML; a None cell widens the cell before it (a horizontal merge)"""
+    xml_rows = []
+    for row in rows:
+        cells = []
+        for cell in row:
+            if cell is None and cells:
+                span, text = cells[-1]
+                cells[-1] = (span + 1, text)
+            else:
+                cells.append((1, cell or ""))
+        xml_rows.append("<w:tr>" + "".join(
+            "<w:tc>"
+            + (f'<w:tcPr><w:gridSpan w:val="{span}"/></w:tcPr>' if span > 1 else "")
+            + _docx_paragraph(text)
+            + "</w:tc>"
+            for span, text in cells
+        ) + "</w:tr>")
+    grid = "<w:gridCol/>" * max((len(row) for row in rows), default=0)
+    return f"<w:tbl><w:tblGrid>{grid}</w:tblGrid>" + "".join(xml_rows) + "</w:tbl>"
+
+
+def render_docx(
+    text: str,
+    header: Optional[str] = None,
+    footer: Optional[str] = None,
+    table: Optional[List[List[Optional[str]]]] = None,
+) -> bytes:
+    """
+    Render plain text as a minimal DOCX, one paragraph per line
+
+    Only the standard library is used, so benchmarks need no DOCX writer.
+
+    Args:
+        text: Body text
+        header: Text of a page header part
+        footer: Text of a page footer part
+        table: Rows of cell texts placed in the middle of the body; a None
+            cell is merged into the cell before it
+    """
+    lines = [_docx_paragraph(line) for line in text.splitlines()]
+    if table:
+        lines.insert(len(lines) // 2, _docx_table(table))
+    namespace = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<w:document {namespace}>"
+        f"<w:body>{''.join(lines)}</w:body></w:document>"
+    )
+    parts = {}
+    for tag, name, part_text in (("hdr", "header1", header), ("ftr", "footer1", footer)):
+        if part_text:
+            paragraphs = "".join(_docx_paragraph(line) for line in part_text.splitlines())
+            parts[f"word/{name}.xml"] = (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f"<w:{tag} {namespace}>{paragraphs}</w:{tag}>"
+            )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    relationships = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/>'
+        "</Relationships>"
+    )
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", relationships)
+        archive.writestr("word/document.xml", document)
+        for name, part in parts.items():
+            archive.writestr(name, part)
+    return output.getvalue()
+
+
+def render(text: str, file_type: str) -> bytes:
+    """Render text as a "txt", "docx" or "pdf" file"""
+    if file_type == "txt":
+        return text.encode("utf-8")
+    if file_type == "docx":
+        return render_docx(text)
+    if file_type == "pdf":
+        return render_pdf(text)
+    raise ValueError(f"Unknown file type: {file_type}")
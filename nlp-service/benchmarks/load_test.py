@@ -0,0 +1,160 @@
+"""
+Load Test
+In-process ASGI load test of /api/analyze and /api/match
+
+Usage (from nlp-service/):
+    python -m benchmarks.load_test [--requests 200] [--concurrency 8] [--file-type pdf] [--output results.json]
+
+Requests go through httpx's ASGI transport, so no server or network is
+involved: the numbers cover routing, validation, parsing and matching.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+# The load test must not write to the candidate index of a local deployment
+os.environ.setdefault("CANDIDATE_INDEX_PATH", "")
+
+import httpx
+
+from benchmarks.corpus import generate_resume, render
+from benchmarks.report import summarize, write_report
+
+CONTENT_TYPES = {
+    "txt": "text/plain",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+
+
+async def _load(
+    client: httpx.AsyncClient,
+    send: Callable[[httpx.AsyncClient, int], "asyncio.Future"],
+    total: int,
+    concurrency: int,
+) -> Dict:
+    """Send total requests with at most concurrency in flight"""
+    durations: List[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(total))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await send(client, i)
+                statuses[str(response.status_code)] += 1
+                if response.status_code == 200:
+                    durations.append(time.perf_counter() - start)
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "statuses": dict(statuses),
+        "latency": summarize(durations),
+    }
+
+
+async def run_async(
+    total: int,
+    concurrency: int,
+    file_type: str,
+    words: int,
+    density: float,
+    unique_files: int,
+    role: str,
+) -> Dict:
+    from app.config import settings
+    from app.utils.services import services
+    from app.utils.executor import worker_pools
+    from app.utils.job_roles import get_required_skills
+    from app.utils.warmup import run_warmup
+    from main import app
+
+    # Request logging at INFO would dominate the timings
+    logging.disable(logging.INFO)
+    run_warmup(settings.WARMUP_STEPS)
+
+    # Distinct files defeat the analysis cache; unique_files=1 measures cache hits
+    files = [render(generate_resume(words, density, seed), file_type) for seed in range(unique_files)]
+    skills = [s["name"] for s in services.skill_extractor.extract_skills(generate_resume(words, density, 0))]
+    required = [s["name"] for s in get_required_skills(role)]
+
+    async def analyze(client: httpx.AsyncClient, i: int):
+        return await client.post(
+            "/api/analyze",
+            files={"file": (f"resume.{file_type}", files[i % len(files)], CONTENT_TYPES[file_type])},
+            data={"target_role": role},
+        )
+
+    async def match(client: httpx.AsyncClient, i: int):
+        return await client.post("/api/match", json={"userSkills": skills, "requiredSkills": required})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        endpoints = {
+            "/api/analyze": await _load(client, analyze, total, concurrency),
+            "/api/match": await _load(client, match, total, concurrency),
+        }
+    worker_pools.shutdown()
+
+    return {
+        "benchmark": "load_test",
+        "file_type": file_type,
+        "words": words,
+        "skill_density": density,
+        "unique_files": unique_files,
+        "cache_enabled": settings.CACHE_ENABLED,
+        "role": role,
+        "endpoints": endpoints,
+    }
+
+
+def print_table(report: Dict) -> None:
+    header = f"{'endpoint':<14} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses"
+    print(header)
+    print("-" * len(header))
+    for endpoint, r in report["endpoints"].items():
+        latency = r["latency"]
+        print(
+            f"{endpoint:<14} {r['throughput_rps']:>8} {latency.get('p50_ms', '-'):>9} "
+            f"{latency.get('p95_ms', '-'):>9} {latency.get('p99_ms', '-'):>9}  {r['statuses']}"
+        )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    arg_parser.add_argument("--concurrency", type=int, default=8, help="requests in flight")
+    arg_parser.add_argument("--file-type", choices=sorted(CONTENT_TYPES), default="pdf")
+    arg_parser.add_argument("--words", type=int, default=600, help="synthetic resume size")
+    arg_parser.add_argument("--density", type=float, default=0.05, help="share of words that are skills")
+    arg_parser.add_argument("--unique-files", type=int, default=50, help="distinct resumes cycled through")
+    arg_parser.add_argument("--role", default="fullstack-developer")
+    arg_parser.add_argument("--output", help="write the report as JSON to this path")
+    args = arg_parser.parse_args()
+
+    report = asyncio.run(run_async(
+        args.requests, args.concurrency, args.file_type, args.words,
+        args.density, args.unique_files, args.role,
+    ))
+    print_table(report)
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
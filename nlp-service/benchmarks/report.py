@@ -0,0 +1,68 @@
+"""
+Benchmark Reports
+Timing summaries and JSON reports that can be compared between commits
+"""
+
+import json
+import platform
+import subprocess
+import time
+from typing import Callable, Dict, List
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(seconds: List[float]) -> Dict:
+    """Mean and p50/p95/p99 of durations, in milliseconds"""
+    values = sorted(seconds)
+    if not values:
+        return {"runs": 0}
+    return {
+        "runs": len(values),
+        "mean_ms": round(sum(values) * 1000 / len(values), 3),
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+def time_calls(func: Callable[[], object], repeat: int, warmup: int = 1) -> Dict:
+    """Call func repeatedly and summarize the durations"""
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
+
+
+def environment() -> Dict:
+    """Commit and interpreter details recorded with every report"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def write_report(report: Dict, path: str) -> None:
+    """Write a report as JSON, tagged with the environment it ran in"""
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), **report}, f, indent=2)
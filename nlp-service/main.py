@@ -3,12 +3,20 @@ SkillLens NLP Service
 FastAPI microservice for resume parsing and skill extraction
 """
 
+import asyncio
 import logging
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routes import analysis, skills, health
+from app.routes import analysis, skills, health, admin, jobs
 from app.config import settings
+from app.nlp.taxonomy import taxonomy_store
+from app.utils.executor import worker_pools
+from app.utils.job_queue import run_job_runners
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.uploads import MULTIPART_OVERHEAD, UploadLimitMiddleware
+from app.utils.warmup import run_warmup
 
 # Configure logging
 logging.basicConfig(
@@ -35,10 +43,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Refuse oversized uploads while they arrive, before the form parser spools them
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={
+        "/api/analyze": settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        "/api/analyze/roles": settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        "/api/analyze/batch": settings.MAX_BATCH_UPLOAD_SIZE,
+        "/api/jobs": settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        "/api/jobs/batch": settings.MAX_BATCH_UPLOAD_SIZE,
+    },
+)
+
+# Request profiling, opt-in so it costs nothing unless enabled
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, sample_rate=settings.PROFILING_SAMPLE_RATE)
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(analysis.router, prefix="/api", tags=["Analysis"])
 app.include_router(skills.router, prefix="/api", tags=["Skills"])
+app.include_router(jobs.router, prefix="/api", tags=["Jobs"])
+app.include_router(admin.router, tags=["Admin"])
+
+# Worker processes hold a copy of the taxonomy, so replace them after a reload
+taxonomy_store.add_listener(lambda taxonomy: worker_pools.recycle_processes())
+
+background_tasks = []
+
+
+async def watch_taxonomy(interval: int):
+    """Reload the taxonomy whenever its data files change"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, taxonomy_store.reload_if_changed)
+        except Exception as e:
+            logger.error(f"Taxonomy reload failed: {e}")
 
 
 @app.on_event("startup")
@@ -46,7 +88,19 @@ async def startup_event():
     """Initialize models and resources on startup"""
     logger.info("Starting SkillLens NLP Service...")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
-    # Load NLP models here if needed
+    # Warm up in the background so liveness checks pass immediately;
+    # /health/ready reports when parsers, taxonomy and models are loaded
+    steps = settings.WARMUP_STEPS if settings.WARMUP_ON_STARTUP else []
+    loop = asyncio.get_running_loop()
+    background_tasks.append(loop.run_in_executor(None, run_warmup, steps))
+    if settings.TAXONOMY_RELOAD_INTERVAL > 0:
+        background_tasks.append(
+            asyncio.create_task(watch_taxonomy(settings.TAXONOMY_RELOAD_INTERVAL))
+        )
+    if settings.JOB_WORKERS > 0:
+        background_tasks.append(
+            asyncio.create_task(run_job_runners(settings.JOB_WORKERS, f"api-{os.getpid()}"))
+        )
     logger.info("NLP Service started successfully!")
 
 
@@ -54,9 +108,15 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down NLP Service...")
+    for task in background_tasks:
+        task.cancel()
+    # Let job runners hand their running jobs back to the queue
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    worker_pools.shutdown()
 
 
 if __name__ == "__main__":
+    # Development server; production runs serve.py (pre-forked workers, no reload)
     import uvicorn
     uvicorn.run(
         "main:app",
@@ -0,0 +1,250 @@
+"""
+SkillLens NLP Production Server
+Pre-forking multi-worker server with state shared copy-on-write
+
+Usage (from nlp-service/):
+    python serve.py [--workers 4] [--host 0.0.0.0] [--port 8000]
+
+The parent process imports the app and runs the PRELOAD_STEPS warm-up
+steps (compiled taxonomy, scanner automata, parser imports, compiled
+regexes) once, binds the listening socket and then forks the workers,
+which share that memory copy-on-write. Dead workers are replaced;
+SIGTERM/SIGINT stop them gracefully. SIGHUP (sent by any worker whose
+taxonomy was reloaded through the admin API) reloads the taxonomy in the
+parent and every worker. `python main.py` remains the single-process
+development server with auto-reload.
+"""
+
+import argparse
+import gc
+import importlib.util
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+from app.config import SUPERVISOR_PID_ENV, settings
+from app.nlp.taxonomy import taxonomy_store
+from app.utils.warmup import run_warmup
+
+logger = logging.getLogger("serve")
+
+# Steps that start threads or processes; those would not survive the fork
+FORK_UNSAFE_STEPS = {"pools", "semantic"}
+
+# Workers exiting sooner than this after starting are restarted with a delay
+MIN_WORKER_UPTIME = 1.0
+# Parent polling interval while supervising workers
+SUPERVISE_INTERVAL = 0.2
+
+
+def cgroup_cpu_quota(root: str = "/sys/fs/cgroup") -> Optional[float]:
+    """CPUs allowed by the container's cgroup (v2 cpu.max or v1 CFS quota), None if unlimited"""
+    try:
+        with open(os.path.join(root, "cpu.max")) as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(os.path.join(root, "cpu", "cpu.cfs_quota_us")) as f:
+            quota = int(f.read())
+        with open(os.path.join(root, "cpu", "cpu.cfs_period_us")) as f:
+            period = int(f.read())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, capped by the cgroup quota in containers"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota)))
+    return cpus
+
+
+def worker_count(requested: int, cpus: Optional[int] = None) -> int:
+    """
+    Number of server processes
+
+    With requested 0, the available CPUs are shared out so that each
+    worker together with its EXECUTOR_PROCESS_WORKERS parse processes has
+    a CPU each; job runners are coroutines and need none of their own.
+    """
+    if requested > 0:
+        return requested
+    cpus = available_cpus() if cpus is None else cpus
+    return max(1, cpus // (1 + settings.EXECUTOR_PROCESS_WORKERS))
+
+
+def server_config(app, host: str, port: int) -> uvicorn.Config:
+    """uvicorn settings shared by every worker"""
+    loop = settings.SERVER_LOOP
+    if loop == "auto":
+        loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = settings.SERVER_HTTP
+    if http == "auto":
+        http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Event loop: {loop}, HTTP parser: {http}")
+
+    return uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS,
+        access_log=settings.SERVER_ACCESS_LOG,
+        server_header=False,
+    )
+
+
+def preload(steps: List[str]) -> None:
+    """Run the fork-safe warm-up steps in the parent"""
+    unsafe = [name for name in steps if name in FORK_UNSAFE_STEPS]
+    if unsafe:
+        logger.warning(f"Not preloading {', '.join(unsafe)}: workers run them after the fork")
+    run_warmup([name for name in steps if name not in FORK_UNSAFE_STEPS])
+
+
+def reload_taxonomy() -> None:
+    """Reload the taxonomy if its data files changed since this process loaded it"""
+    try:
+        taxonomy_store.reload_if_changed()
+    except Exception as e:
+        logger.error(f"Taxonomy reload failed: {e}")
+
+
+def run_worker(config: uvicorn.Config, sockets) -> None:
+    """Serve on the inherited socket until stopped (runs in a forked child)"""
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, signal.SIG_DFL)
+    # Reloads run in a thread so the event loop keeps serving meanwhile
+    signal.signal(
+        signal.SIGHUP,
+        lambda signum, frame: threading.Thread(target=reload_taxonomy, daemon=True).start(),
+    )
+    code = 0
+    try:
+        uvicorn.Server(config).run(sockets=sockets)
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        logger.exception("Worker crashed")
+        code = 1
+    finally:
+        logging.shutdown()
+        os._exit(code)
+
+
+def supervise(config: uvicorn.Config, workers: int) -> None:
+    """Fork the workers and keep that many running until told to stop"""
+    sock = config.bind_socket()
+    children: Dict[int, float] = {}
+    stopping_since = None
+    reload_requested = False
+    # Workers signal this process to have a taxonomy reload reach all of them
+    os.environ[SUPERVISOR_PID_ENV] = str(os.getpid())
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            run_worker(config, [sock])
+        children[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+
+    def request_reload(signum, frame) -> None:
+        nonlocal reload_requested
+        reload_requested = True
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping_since
+        if stopping_since is None:
+            logger.info(f"Stopping {len(children)} workers")
+            stopping_since = time.monotonic()
+            for pid in list(children):
+                os.kill(pid, signal.SIGTERM)
+
+    # Objects allocated so far are never collected, so the collector does
+    # not touch (and copy) their pages in the workers
+    gc.collect()
+    gc.freeze()
+    for _ in range(workers):
+        spawn()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGHUP, request_reload)
+
+    kill_after = settings.SERVER_GRACEFUL_TIMEOUT + 5
+    while children:
+        if reload_requested and stopping_since is None:
+            reload_requested = False
+            # Reloaded here first so replacement workers fork with the new taxonomy
+            reload_taxonomy()
+            logger.info(f"Reloading the taxonomy in {len(children)} workers")
+            for pid in list(children):
+                os.kill(pid, signal.SIGHUP)
+
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            if stopping_since is not None and time.monotonic() - stopping_since > kill_after:
+                for pid in list(children):
+                    logger.warning(f"Killing worker {pid} after the graceful timeout")
+                    os.kill(pid, signal.SIGKILL)
+                stopping_since = time.monotonic()
+            time.sleep(SUPERVISE_INTERVAL)
+            continue
+
+        started = children.pop(pid, None)
+        if started is None or stopping_since is not None:
+            continue
+        # Also reached when a worker retires after SERVER_MAX_REQUESTS
+        logger.warning(f"Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}, replacing it")
+        if time.monotonic() - started < MIN_WORKER_UPTIME:
+            time.sleep(MIN_WORKER_UPTIME)
+        spawn()
+
+    sock.close()
+    logger.info("All workers stopped")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--workers", type=int, default=settings.WORKERS, help="server processes, 0 = sized to the available CPUs")
+    arg_parser.add_argument("--host", default=settings.HOST)
+    arg_parser.add_argument("--port", type=int, default=settings.PORT)
+    args = arg_parser.parse_args()
+
+    # Importing main configures logging and builds the app and its routes
+    from main import app
+
+    workers = worker_count(args.workers)
+    preload(settings.PRELOAD_STEPS)
+    config = server_config(app, args.host, args.port)
+
+    if workers == 1 or not hasattr(os, "fork") or not hasattr(signal, "SIGHUP"):
+        if workers > 1:
+            logger.warning("os.fork is not available, serving with a single process")
+        uvicorn.Server(config).run()
+        return
+
+    logger.info(f"Serving on {args.host}:{args.port} with {workers} workers")
+    supervise(config, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Shared test fixtures"""
+
+import sys
+import types
+import zlib
+
+import numpy as np
+import pytest
+
+STUB_DIMENSION = 64
+
+
+class StubSentenceTransformer:
+    """
+    Deterministic stand-in for a sentence-transformers model
+
+    Embeds a name as its hashed character trigrams, so similar spellings
+    are similar vectors and tests need no model download.
+    """
+
+    def __init__(self, model_name, device=None):
+        self.model_name = model_name
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self):
+        return STUB_DIMENSION
+
+    def encode(self, names, batch_size=32, convert_to_numpy=True,
+               normalize_embeddings=False, show_progress_bar=False):
+        self.encoded.append(list(names))
+        vectors = np.zeros((len(names), STUB_DIMENSION), dtype=np.float32)
+        for row, name in enumerate(names):
+            padded = f"  {name} "
+            for i in range(len(padded) - 2):
+                vectors[row, zlib.crc32(padded[i:i + 3].encode()) % STUB_DIMENSION] += 1.0
+        if normalize_embeddings:
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        return vectors
+
+
+@pytest.fixture
+def stub_sentence_transformers(monkeypatch):
+    """Install StubSentenceTransformer as the sentence_transformers module"""
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = StubSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return module
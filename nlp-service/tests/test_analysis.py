@@ -0,0 +1,84 @@
+"""/api/analyze endpoint tests"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from main import app
+
+RESUME = (
+    b"Summary\nSenior backend engineer.\n"
+    b"Experience\nBuilt Python services with Django and PostgreSQL, deployed with Docker.\n"
+    b"Education\nBSc Computer Science, Java coursework.\n"
+)
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+def _analyze(client, **params):
+    return client.post(
+        "/api/analyze",
+        params=params,
+        files={"file": ("cv.txt", RESUME, "text/plain")},
+        data={"target_role": "backend-developer"},
+    )
+
+
+@pytest.mark.parametrize("section_aware", [True, False])
+def test_sections_only_appear_when_known(client, monkeypatch, section_aware):
+    monkeypatch.setattr(settings, "SECTION_AWARE_EXTRACTION", section_aware)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    for params in ({}, {"fields": "extracted_skills,matched_skills,gap_skills"}):
+        body = _analyze(client, **params).json()
+        extracted = {skill["name"]: skill for skill in body["extracted_skills"]}
+        if section_aware:
+            assert extracted["Python"]["sections"] == ["experience"]
+        else:
+            assert all("sections" not in skill for skill in extracted.values())
+        for skill in body["matched_skills"] + body["gap_skills"]:
+            assert "sections" not in skill
+
+
+def _expand_compact(body: dict) -> dict:
+    """Rebuild the full AnalyzeResponse layout from a compact response"""
+    skills = body["skills"]
+
+    def item(skill_id, level, category=None, confidence=None):
+        return {"name": skills[skill_id]["name"], "level": level, "category": category, "confidence": confidence}
+
+    return {
+        "extracted_text": body.get("extracted_text", ""),
+        "extracted_skills": [
+            item(s["id"], s["level"], skills[s["id"]]["category"], s["confidence"])
+            for s in body["extracted_skills"]
+        ],
+        "required_skills": [
+            item(s["id"], s["level"], skills[s["id"]]["category"]) for s in body["required_skills"]
+        ],
+        "matched_skills": [item(skill_id, "intermediate") for skill_id in body["matched_skills"]],
+        "gap_skills": [item(skill_id, "beginner") for skill_id in body["gap_skills"]],
+        "match_score": body["match_score"],
+        "recommendations": [
+            {"skill": skills[r["id"]]["name"], "priority": r["priority"], "reason": r["reason"]}
+            for r in body["recommendations"]
+        ],
+    }
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_compact_response_expands_to_the_full_response(client, monkeypatch, cached):
+    # Compact rows carry no sections, so compare without section attribution
+    monkeypatch.setattr(settings, "SECTION_AWARE_EXTRACTION", False)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", cached)
+    full = _analyze(client).json()
+    compact = _analyze(client, compact="true").json()
+    assert "extracted_text" not in compact
+    assert len(compact["skills"]) == len({row["name"] for row in compact["skills"]})
+    assert full["gap_skills"] and full["matched_skills"] and full["recommendations"]
+    assert _expand_compact(compact) == {**full, "extracted_text": ""}
+
+    with_text = _analyze(client, compact="true", fields=",".join(full)).json()
+    assert _expand_compact(with_text) == full
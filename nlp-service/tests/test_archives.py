@@ -0,0 +1,80 @@
+"""
+Archive expansion tests
+"""
+
+import hashlib
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from app.config import settings
+from app.parsers.archive_parser import ArchiveTooLargeError, extract_archive
+from app.utils.uploads import UploadedDocument, spool_archive
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _tar(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("filename, build", [("cvs.zip", _zip), ("cvs.tar.gz", _tar)])
+def test_spool_archive_writes_members_to_temp_files(tmp_path, filename, build):
+    members = {
+        "a.txt": b"Python developer",
+        "nested/b.txt": b"Docker and Kubernetes",
+        "__MACOSX/._a.txt": b"metadata",
+        ".hidden": b"dotfile",
+    }
+    archive = UploadedDocument.from_bytes(build(members))
+    documents = spool_archive(filename, archive, max_files=10, max_total_size=1024, spool_dir=str(tmp_path))
+    try:
+        assert [name for name, _ in documents] == ["a.txt", "nested/b.txt"]
+        for name, document in documents:
+            assert document.spooled and os.path.dirname(document.path) == str(tmp_path)
+            assert document.read_bytes() == members[name]
+            assert document.sha256 == hashlib.sha256(members[name]).hexdigest()
+    finally:
+        for _, document in documents:
+            document.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_highly_compressible_archive_hits_the_total_limit(tmp_path):
+    # Four 1 MB members of zeros compress to a few KB
+    bomb = _zip({f"cv{i}.txt": b"\0" * (1024 * 1024) for i in range(4)})
+    assert len(bomb) < 64 * 1024
+    archive = UploadedDocument.from_bytes(bomb)
+
+    with pytest.raises(ArchiveTooLargeError):
+        spool_archive("bomb.zip", archive, max_files=10, max_total_size=3 * 1024 * 1024, spool_dir=str(tmp_path))
+    # Members spooled before the limit was hit are removed
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_members_are_skipped(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "MAX_FILE_SIZE", 10)
+    archive = UploadedDocument.from_bytes(_zip({"small.txt": b"Python", "big.txt": b"x" * 100}))
+    documents = spool_archive("cvs.zip", archive, max_files=10, max_total_size=1024, spool_dir=str(tmp_path))
+    assert [name for name, _ in documents] == ["small.txt"]
+    documents[0][1].close()
+
+
+def test_extract_archive_respects_max_files():
+    data = _zip({f"cv{i}.txt": b"Python" for i in range(5)})
+    assert len(extract_archive("cvs.zip", data, max_files=3, max_member_size=100)) == 3
@@ -0,0 +1,43 @@
+"""
+Analysis cache tests
+"""
+
+from app.utils.cache import AnalysisCache
+
+
+def test_memory_tier_hits_and_misses():
+    cache = AnalysisCache(max_entries=2, ttl_seconds=60)
+    assert cache.get("a") is None
+    cache.put("a", {"text": "a"})
+    assert cache.get("a") == {"text": "a"}
+    cache.put("b", {"text": "b"})
+    cache.put("c", {"text": "c"})
+    assert cache.get_memory("a") is None
+
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["memory_entries"] == 2
+
+
+def test_disk_tier_is_shared_and_promoted(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer = AnalysisCache(max_entries=10, ttl_seconds=60, db_path=path)
+    writer.put_memory("key", {"text": "resume"})
+    writer.put_disk("key", {"text": "resume"})
+
+    reader = AnalysisCache(max_entries=10, ttl_seconds=60, db_path=path)
+    assert reader.get_memory("key") is None
+    assert reader.get_disk("key") == {"text": "resume"}
+    assert reader.get_memory("key") == {"text": "resume"}
+    assert reader.get_disk("missing") is None
+    assert reader.get_stats()["disk_hits"] == 1
+    assert reader.get_stats()["misses"] == 1
+
+
+def test_disk_tier_creates_its_directory(tmp_path):
+    path = tmp_path / "fresh" / "deploy" / "cache.sqlite3"
+    cache = AnalysisCache(max_entries=10, ttl_seconds=60, db_path=str(path))
+    cache.put_disk("key", {"text": "resume"})
+    assert path.exists()
+    assert cache.get_disk("key") == {"text": "resume"}
@@ -0,0 +1,20 @@
+"""
+Candidate index tests
+"""
+
+from app.utils.candidate_index import CandidateIndex
+
+
+def test_top_candidates_rank_by_coverage_then_recency(tmp_path, monkeypatch):
+    clock = iter([100.0, 200.0, 300.0])
+    monkeypatch.setattr("app.utils.candidate_index.time.time", lambda: next(clock))
+    index = CandidateIndex(str(tmp_path / "candidates.sqlite3"))
+    index.add("older", ["python", "docker"], label="older.pdf")
+    index.add("full", ["python", "docker", "aws"], label="full.pdf")
+    index.add("newer", ["python", "docker"], label="newer.pdf")
+
+    candidates = index.top_candidates(["python", "docker", "aws"], top=3)
+    assert [c["resume_id"] for c in candidates] == ["full", "newer", "older"]
+    assert candidates[0]["match_score"] == 100.0
+    assert candidates[1]["label"] == "newer.pdf"
+    assert index.count() == 3
@@ -0,0 +1,80 @@
+"""
+Fuzzy skill matching tests
+"""
+
+import pytest
+
+from app.nlp.fuzzy_index import FuzzySkillIndex, FuzzySkillResolver, bounded_distance
+from app.nlp.skill_extractor import SkillExtractor
+from app.nlp.taxonomy import taxonomy_store
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    return taxonomy_store.current
+
+
+def test_bounded_distance_counts_transposition_as_one_edit():
+    assert bounded_distance("pyhton", "python", 1) == 1
+    assert bounded_distance("pythn", "python", 1) == 1
+    assert bounded_distance("pyton", "pithon", 1) is None
+
+
+@pytest.mark.parametrize("candidate, expected", [
+    ("pyhton", "python"),            # transposition
+    ("docekr", "docker"),            # transposition
+    ("kubernets", "kubernetes"),     # deletion
+    ("javscript", "javascript"),     # deletion
+    ("postgressql", "postgresql"),   # insertion
+    ("nodejs", "node.js"),           # respacing (compact form)
+])
+def test_lookup_recovers_typos(taxonomy, candidate, expected):
+    resolver = FuzzySkillResolver(cache_size=16)
+    assert resolver.lookup(taxonomy, candidate)[0] == expected
+
+
+def test_lookup_rejects_ambiguous_and_distant_candidates():
+    index = FuzzySkillIndex({"java": "java", "jade": "jade", "python": "python"})
+    assert index.lookup("jave", 1) == (None, 0)
+    assert index.lookup("pascal", 1) == (None, 0)
+
+
+def test_extractor_finds_misspelled_and_respaced_skills():
+    extractor = SkillExtractor(fuzzy=True, resolver=FuzzySkillResolver(cache_size=64))
+    text = "Built services in Pyhton and Node JS, deployed on Kubernets with Tensor Flow models."
+    names = {skill["name"] for skill in extractor.extract_skills(text)}
+    assert {"Python", "Node.js", "Kubernetes", "TensorFlow"} <= names
+
+
+def test_extractor_without_fuzzy_ignores_typos():
+    extractor = SkillExtractor(fuzzy=False)
+    names = {skill["name"] for skill in extractor.extract_skills("Pyhton and Kubernets")}
+    assert not names & {"Python", "Kubernetes"}
+
+
+def test_extractor_resolves_misspelled_synonyms_to_their_skill():
+    extractor = SkillExtractor(fuzzy=True, resolver=FuzzySkillResolver(cache_size=64))
+    names = {skill["name"] for skill in extractor.extract_skills(
+        "Amazon Web Servics and Natural Language Processing"
+    )}
+    assert names == {"AWS", "NLP"}
+
+
+def test_extractor_leaves_ordinary_words_alone():
+    extractor = SkillExtractor(fuzzy=True, resolver=FuzzySkillResolver(cache_size=64))
+    text = "Each node in the graph; seaborne trade; docket review; bootstraps"
+    assert extractor.extract_skills(text) == []
+
+
+def test_misspelled_word_needs_a_nearby_skill(taxonomy):
+    resolver = FuzzySkillResolver(cache_size=16)
+    assert resolver.find(taxonomy, "docket review") == {}
+    assert "docker" in resolver.find(taxonomy, "python, docekr", covered=[(0, 6)])
+    far = "python" + " filler" * 20 + " docekr"
+    assert "docker" not in resolver.find(taxonomy, far, covered=[(0, 6)])
+
+
+def test_named_only_synonyms_still_resolve_by_name(taxonomy):
+    resolver = FuzzySkillResolver(cache_size=16)
+    assert resolver.resolve(taxonomy, "Node") == "node.js"
+    assert resolver.find(taxonomy, "a node") == {}
@@ -0,0 +1,96 @@
+"""
+Job queue and runner tests
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.job_queue import JOB_HANDLERS, JobQueue, JobRunner, callback_url_error
+from main import app
+
+
+def _queue(tmp_path) -> JobQueue:
+    return JobQueue(
+        db_path=str(tmp_path / "jobs.sqlite3"),
+        job_dir=str(tmp_path / "jobs"),
+        lease_seconds=60,
+        max_attempts=3,
+    )
+
+
+def test_claim_order_and_completion(tmp_path):
+    queue = _queue(tmp_path)
+    queue.enqueue("low", "analyze", {}, priority=0)
+    queue.enqueue("high", "analyze", {}, priority=5)
+
+    job = queue.claim("runner-0")
+    assert job["id"] == "high"
+    assert job["status"] == "running"
+    assert job["attempts"] == 1
+
+    assert queue.complete("high", {"ok": True})
+    assert queue.get("high")["result"] == {"ok": True}
+    assert queue.get_stats()["succeeded"] == 1
+
+
+def test_cancel_running_job(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "JOB_LEASE_SECONDS", 0)
+    queue = _queue(tmp_path)
+    handler_events = []
+
+    async def slow_handler(payload, files_dir):
+        handler_events.append("started")
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            handler_events.append("cancelled")
+            raise
+
+    monkeypatch.setitem(JOB_HANDLERS, "test-slow", slow_handler)
+    queue.enqueue("job-1", "test-slow", {})
+    job = queue.claim("runner-0")
+
+    async def scenario():
+        runner = JobRunner(queue, "runner-0")
+        running = asyncio.create_task(runner.run_job(job))
+        while not handler_events:
+            await asyncio.sleep(0.01)
+        queue.cancel("job-1")
+        # Must return normally instead of raising InvalidStateError
+        await asyncio.wait_for(running, timeout=5)
+
+    asyncio.run(scenario())
+    assert handler_events == ["started", "cancelled"]
+    assert queue.get("job-1")["status"] == "cancelled"
+
+
+def test_callback_url_checks(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_CALLBACK_ALLOWED_HOSTS", [])
+    assert callback_url_error("https://93.184.216.34/hook") is None
+    for url in (
+        "ftp://93.184.216.34/hook",
+        "http://127.0.0.1:8000/hook",
+        "http://10.0.0.5/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://[::1]/hook",
+        "http://224.0.0.1/hook",
+    ):
+        assert callback_url_error(url) is not None, url
+
+    monkeypatch.setattr(settings, "JOB_CALLBACK_ALLOWED_HOSTS", ["localhost"])
+    assert callback_url_error("http://LOCALHOST:9000/hook") is None
+    assert callback_url_error("https://93.184.216.34/hook") is not None
+
+
+def test_submit_rejects_unknown_role():
+    client = TestClient(app)
+    response = client.post(
+        "/api/jobs",
+        files={"file": ("cv.txt", b"Python and Docker experience", "text/plain")},
+        data={"target_role": "astronaut"},
+    )
+    assert response.status_code == 400
+    assert "astronaut" in response.json()["detail"]
@@ -0,0 +1,91 @@
+"""Metrics registry and /metrics endpoint tests"""
+
+import io
+import re
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.metrics import Counter, Histogram, Metrics
+from main import app
+
+SAMPLE_LINE = re.compile(r'^[a-z_]+(\{[a-z_]+="[^"]*"(,[a-z_]+="[^"]*")*\})? -?[0-9.e+]+$')
+
+
+def _samples(text: str) -> dict:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            assert line.startswith(("# HELP ", "# TYPE ")), line
+            continue
+        assert SAMPLE_LINE.match(line), line
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("t_seconds", "Test", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(("parse",), value)
+    samples = _samples("\n".join(histogram.render()))
+    assert samples['t_seconds_bucket{stage="parse",le="0.1"}'] == 1
+    assert samples['t_seconds_bucket{stage="parse",le="1.0"}'] == 3
+    assert samples['t_seconds_bucket{stage="parse",le="+Inf"}'] == 4
+    assert samples['t_seconds_count{stage="parse"}'] == 4
+    assert samples['t_seconds_sum{stage="parse"}'] == 6.05
+
+
+def test_document_timer_defers_to_record_document():
+    registry = Metrics(enabled=True)
+    with registry.document() as timer:
+        with registry.stage("parse"):
+            pass
+        registry.fallback("pdf_page", "pdfminer")
+    # Nothing is recorded until the exported timings come back labelled
+    assert "pdf_page" not in registry.render()
+    registry.record_document(timer.export(), "pdf", "lt_100kb")
+    samples = _samples(registry.render())
+    assert samples['nlp_stage_duration_seconds_count{stage="parse",file_type="pdf",size="lt_100kb"}'] == 1
+    assert samples['nlp_parser_fallbacks_total{kind="pdf_page",backend="pdfminer"}'] == 1
+
+
+def test_disabled_registry_records_nothing():
+    registry = Metrics(enabled=False)
+    with registry.document() as timer:
+        assert timer is None
+        registry.fallback("docx")
+    registry.observe("read", 0.1, "pdf", "lt_100kb")
+    assert _samples(registry.render()) == {}
+    assert Counter("c_total", "Test", ()).render() == ["# HELP c_total Test", "# TYPE c_total counter"]
+
+
+def test_metrics_scrape_after_analysis(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    # A DOCX without word/document.xml: the streaming parser falls back to python-docx
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as docx:
+        docx.writestr("[Content_Types].xml", "<Types/>")
+    client = TestClient(app)
+    before = _samples(client.get("/metrics").text)
+
+    response = client.post(
+        "/api/analyze",
+        files={"file": ("cv.docx", archive.getvalue(), "application/octet-stream")},
+        data={"target_role": "backend-developer"},
+    )
+    assert response.status_code == 200
+
+    scrape = client.get("/metrics")
+    assert scrape.headers["content-type"].startswith("text/plain")
+    after = _samples(scrape.text)
+
+    def delta(name):
+        return after.get(name, 0) - before.get(name, 0)
+
+    labels = 'file_type="docx",size="lt_100kb"'
+    for stage in ("read", "parse", "extract", "match", "total"):
+        assert delta(f'nlp_stage_duration_seconds_count{{stage="{stage}",{labels}}}') == 1, stage
+    assert delta(f'nlp_stage_duration_seconds_bucket{{stage="total",{labels},le="+Inf"}}') == 1
+    assert delta('nlp_parser_fallbacks_total{kind="docx",backend="python-docx"}') == 1
@@ -0,0 +1,27 @@
+"""
+PDF backend smoke tests
+"""
+
+import pytest
+
+from app.parsers.pdf_backends import PDF_BACKENDS, get_backend
+from benchmarks.corpus import render_pdf
+
+TEXT = "Jane Doe\nSenior Python developer\nSkills: Docker, Kubernetes, PostgreSQL"
+
+
+@pytest.mark.parametrize("name", sorted(PDF_BACKENDS))
+def test_backend_extracts_rendered_pdf(name):
+    if not PDF_BACKENDS[name].is_available():
+        pytest.skip(f"{name} is not installed")
+
+    document = get_backend(name).open(render_pdf(TEXT))
+    try:
+        assert document.page_count == 1
+        text = document.extract_page(0) or ""
+    finally:
+        document.close()
+
+    words = text.split()
+    for word in ("Jane", "Python", "Docker", "Kubernetes", "PostgreSQL"):
+        assert any(word in w for w in words), f"{name} lost {word!r}: {text!r}"
@@ -0,0 +1,44 @@
+"""Skill engine selection and spaCy PhraseMatcher parity tests"""
+
+import pytest
+
+from app.nlp import phrase_engine
+from app.nlp.phrase_engine import SpacyPhraseEngine, resolve_engine
+from app.nlp.skill_extractor import SkillExtractor
+from app.nlp.taxonomy import taxonomy_store
+
+TEXT = (
+    "senior engineer: python, docker and kubernetes on aws. "
+    "built rest apis with node.js and postgresql; ci/cd with jenkins"
+)
+
+
+def test_resolve_engine_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown skill engine: regex"):
+        resolve_engine("regex")
+    with pytest.raises(ValueError):
+        SkillExtractor(engine="regex")
+
+
+def test_resolve_engine_falls_back_without_spacy(monkeypatch):
+    monkeypatch.setattr(phrase_engine, "spacy_available", lambda: False)
+    assert resolve_engine("spacy") == "scanner"
+    assert resolve_engine("scanner") == "scanner"
+    extractor = SkillExtractor(engine="spacy")
+    assert extractor.engine == "scanner"
+    assert extractor.phrase_engine is None
+    assert "+spacy" not in extractor.cache_version
+
+
+def test_spacy_engine_matches_scanner():
+    pytest.importorskip("spacy")
+    taxonomy = taxonomy_store.current
+    engine = SpacyPhraseEngine()
+    expected = taxonomy.scanner.scan_lower(TEXT)
+    assert expected
+    assert engine.scan(taxonomy, TEXT) == expected
+    assert list(engine.scan_many(taxonomy, [TEXT, TEXT], n_process=1)) == [expected, expected]
+
+    spacy_skills = SkillExtractor(engine="spacy", fuzzy=False).extract_skills(TEXT)
+    scanner_skills = SkillExtractor(engine="scanner", fuzzy=False).extract_skills(TEXT)
+    assert spacy_skills == scanner_skills
@@ -0,0 +1,40 @@
+"""Request profiling tests"""
+
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.profiling import ProfileStore, ProfilingMiddleware
+
+
+def test_profiles_are_saved_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    store = ProfileStore(str(tmp_path), max_files=2)
+    save_threads = []
+    save = store.save
+
+    def recording_save(*args):
+        save_threads.append(threading.current_thread())
+        return save(*args)
+
+    monkeypatch.setattr(store, "save", recording_save)
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"loop_thread": threading.current_thread().name}
+
+    app.add_middleware(ProfilingMiddleware, store=store)
+    with TestClient(app) as client:
+        headers = {"X-Profile": "1", "X-Admin-Token": "secret"}
+        responses = [client.get("/ping", headers=headers) for _ in range(3)]
+
+    loop_thread = responses[0].json()["loop_thread"]
+    assert all(response.headers["X-Profile-Id"] for response in responses)
+    assert len(save_threads) == 3
+    assert all(thread.name != loop_thread for thread in save_threads)
+    # Pruned down to max_files
+    assert len(store.list()) == 2
+    assert store.list()[0]["seconds"] >= 0
@@ -0,0 +1,52 @@
+"""Semantic skill index tests (stub sentence-transformers model)"""
+
+import numpy as np
+import pytest
+
+from app.nlp.semantic_index import SemanticSkillIndex
+
+
+@pytest.fixture
+def index(stub_sentence_transformers):
+    return SemanticSkillIndex(["python", "docker", "aws"], model_name="stub", cache_size=2)
+
+
+def _direct(index, names):
+    return index.model.encode(names, normalize_embeddings=True)
+
+
+def test_embed_keeps_input_order(index):
+    index.embed(["golang"])
+    index.model.encoded.clear()
+
+    names = ["rust", "python", "golang", "rust", "aws", "terraform"]
+    rows = index.embed(names)
+
+    # Only the new names are encoded, once each and in one batch
+    assert index.model.encoded == [["rust", "terraform"]]
+    assert rows.shape == (len(names), index._matrix.shape[1])
+    assert rows.dtype == np.float32
+    np.testing.assert_allclose(rows, _direct(index, names), rtol=1e-6)
+
+
+def test_lru_evicts_least_recently_used(index):
+    index.embed(["rust"])
+    index.embed(["golang"])
+    index.embed(["rust"])  # refreshes rust
+    index.embed(["terraform"])  # evicts golang
+    assert list(index._cache) == ["rust", "terraform"]
+
+    index.model.encoded.clear()
+    index.embed(["rust", "terraform", "python"])
+    assert index.model.encoded == []
+    index.embed(["golang"])
+    assert index.model.encoded == [["golang"]]
+    assert list(index._cache) == ["terraform", "golang"]
+
+
+def test_known_names_never_enter_the_cache(index):
+    index.model.encoded.clear()
+    index.embed(["python", "docker"])
+    assert index.model.encoded == []
+    assert not index._cache
+    assert index.embed([]).shape == (0, index._matrix.shape[1])
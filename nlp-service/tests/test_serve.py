@@ -0,0 +1,29 @@
+"""Tests for production server sizing"""
+
+from app.config import settings
+from serve import cgroup_cpu_quota, worker_count
+
+
+def test_cgroup_v2_quota(tmp_path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    assert cgroup_cpu_quota(str(tmp_path)) == 1.5
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert cgroup_cpu_quota(str(tmp_path)) is None
+
+
+def test_cgroup_v1_quota(tmp_path):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    assert cgroup_cpu_quota(str(tmp_path)) == 2.0
+
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+    assert cgroup_cpu_quota(str(tmp_path)) is None
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.setattr(settings, "EXECUTOR_PROCESS_WORKERS", 2)
+    assert worker_count(3, cpus=64) == 3
+    assert worker_count(0, cpus=12) == 4
+    assert worker_count(0, cpus=2) == 1
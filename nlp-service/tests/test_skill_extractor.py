@@ -0,0 +1,81 @@
+"""Skill extraction tests"""
+
+import pytest
+
+from app.config import settings
+from app.nlp.skill_extractor import SkillExtractor
+from app.parsers.sections import find_headings, segment
+from app.parsers.text_normalizer import text_normalizer
+
+
+def _names(text: str) -> set:
+    return {skill["name"] for skill in SkillExtractor(fuzzy=False).extract_skills(text)}
+
+
+def test_symbol_names_survive_normalization():
+    text = text_normalizer.normalize("Built CI/CD pipelines in C++ and C#\non .NET ／ Azure")
+    assert "CI/CD" in text
+    assert {"CI/CD", "C++", "C#", ".NET", "Azure"} <= _names(text)
+
+
+RESUME = (
+    "Jane Doe\n"
+    "Skills: Python, Docker\n"
+    "Experience\n"
+    "Lead developer of our Python services, deployed with Docker.\n"
+    "Education\n"
+    "Senior thesis written in Java.\n"
+)
+
+
+def _skills(text: str) -> dict:
+    return {skill["name"]: skill for skill in SkillExtractor(fuzzy=False).extract_skills(text)}
+
+
+def test_headings_and_section_lookup():
+    index = segment(RESUME)
+    assert [name for _, name in find_headings(RESUME)] == ["skills", "experience", "education"]
+    assert index.section_at(0) is None
+    assert index.section_at(RESUME.index("Lead")) == "experience"
+    assert index.section_at(RESUME.index("Java")) == "education"
+    # Body text starting like a heading is not one
+    assert find_headings("Experience with Docker\n") == []
+
+
+def test_mentions_are_attributed_and_weighted_by_section():
+    skills = _skills(RESUME)
+    assert skills["Python"]["sections"] == ["skills", "experience"]
+    assert skills["Java"]["sections"] == ["education"]
+    # Skills 1.0 + experience 1.5 mentions versus one education mention (0.5)
+    assert skills["Python"]["confidence"] == 0.75
+    assert skills["Java"]["confidence"] == 0.55
+    # "Senior" sits next to Java, but education mentions are not level-checked
+    assert skills["Java"]["level"] == "intermediate"
+    assert skills["Python"]["level"] == "advanced"
+
+
+def test_without_section_awareness(monkeypatch):
+    monkeypatch.setattr(settings, "SECTION_AWARE_EXTRACTION", False)
+    skills = _skills(RESUME)
+    assert all("sections" not in skill for skill in skills.values())
+    assert skills["Java"]["confidence"] == 0.6
+    assert skills["Java"]["level"] == "advanced"
+
+
+@pytest.mark.parametrize("text, level", [
+    ("Lead developer of our Python services", "advanced"),      # 4 tokens before
+    ("Lead developer of all our Python services", "intermediate"),  # 5 tokens before
+    ("Python architect for the platform", "advanced"),          # 1 token after
+    ("Python platform architect", "intermediate"),              # 2 tokens after
+    ("Expert in Python", "advanced"),
+])
+def test_level_window(text, level):
+    assert _skills(text)["Python"]["level"] == level
+
+
+def test_token_map_levels_match_text_windows():
+    text = "Summary\nLead developer of our Python and Docker services.\nExpert in Kubernetes, worked with Java"
+    pages = [text_normalizer.normalize_with_views(text)]
+    _, from_pages = SkillExtractor(fuzzy=False).extract_skills_from_pages(pages)
+    from_text = SkillExtractor(fuzzy=False).extract_skills(text)
+    assert {s["name"]: s["level"] for s in from_pages} == {s["name"]: s["level"] for s in from_text}
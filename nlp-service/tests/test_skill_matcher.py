@@ -0,0 +1,78 @@
+"""Role matching tests"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.nlp.skill_matcher import SkillMatcher
+from app.utils.services import services
+from main import app
+
+RESUME = (
+    b"Backend engineer. Python, Django, PostgreSQL, Docker, Kubernetes, AWS, "
+    b"REST API design, Git and Linux. Some React and JavaScript on the side."
+)
+USER_SKILLS = ["Python", "Django", "Postgres", "Docker", "Kubernetes", "AWS", "React", "Git"]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def _rank(client, **data):
+    return client.post(
+        "/api/analyze/roles", files={"file": ("cv.txt", RESUME, "text/plain")}, data=data
+    )
+
+
+def test_rank_roles_orders_by_score_and_agrees_with_matcher(client):
+    response = _rank(client)
+    assert response.status_code == 200
+    body = response.json()
+    scores = [role["match_score"] for role in body["roles"]]
+    assert scores == sorted(scores, reverse=True)
+
+    matcher = services.skill_matcher
+    user_skills = [skill["name"] for skill in body["extracted_skills"]]
+    expected = matcher.match_all_roles(user_skills)
+    assert [(r["role"], r["match_score"]) for r in body["roles"]] == [
+        (r["role"], r["score"]) for r in expected
+    ]
+    # Matrix scores agree with the per-role bitmask match
+    for role in body["roles"]:
+        single = matcher.match_role(user_skills, role["role"])
+        assert single["score"] == role["match_score"]
+        assert single["matched"] == role["matched_skills"]
+        assert single["gaps"] == role["gap_skills"]
+
+
+def test_rank_roles_top_and_subset(client):
+    full = _rank(client).json()["roles"]
+    top = _rank(client, top="2").json()["roles"]
+    assert top == full[:2]
+
+    subset = _rank(client, roles=["frontend-developer", "backend-developer"]).json()["roles"]
+    assert {role["role"] for role in subset} == {"frontend-developer", "backend-developer"}
+
+
+@pytest.mark.parametrize("top", ["0", "-1"])
+def test_rank_roles_rejects_non_positive_top(client, top):
+    assert _rank(client, top=top).status_code == 422
+
+
+def test_semantic_ranking_matches_per_role_matching(stub_sentence_transformers, monkeypatch):
+    monkeypatch.setattr(settings, "SEMANTIC_THRESHOLD", 0.5)
+    matcher = SkillMatcher(semantic=True, fuzzy=False)
+    ranking = matcher.match_all_roles(USER_SKILLS)
+    assert matcher.semantic_enabled
+
+    expected = []
+    for role_id, role in matcher.role_index.roles.items():
+        result = matcher.match_role(USER_SKILLS, role_id)
+        expected.append({**result, "role": role_id, "label": role["label"]})
+    expected.sort(key=lambda r: r["score"], reverse=True)
+    assert ranking == expected
+    assert any(result["semanticMatches"] for result in ranking)
+    assert matcher.match_all_roles(USER_SKILLS, top=3) == expected[:3]
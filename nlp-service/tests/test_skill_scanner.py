@@ -0,0 +1,31 @@
+"""Skill scanner tests"""
+
+from app.nlp.skill_scanner import SkillScanner
+
+KEYWORDS = ["Java", "JavaScript", "Spring", "Spring Boot", "C++", "C#", ".NET", "Go"]
+TEXT = "java, javascript and spring boot; c++/c# on .net. gopher xjava go"
+
+
+def test_scan_respects_word_boundaries():
+    hits = SkillScanner(KEYWORDS).scan(TEXT.upper())
+    assert hits["java"] == [(0, 4)]
+    assert hits["spring boot"] == [(21, 32)]
+    assert hits["spring"] == [(21, 27)]
+    assert hits["c++"] == [(34, 37)]
+    assert hits["go"] == [(63, 65)]
+
+
+def test_session_matches_whole_scan_at_any_chunk_boundary():
+    scanner = SkillScanner(KEYWORDS)
+    expected = scanner.scan_lower(TEXT)
+    for split in range(len(TEXT) + 1):
+        session = scanner.session()
+        session.feed(TEXT[:split])
+        session.feed(TEXT[split:])
+        assert session.finish() == expected, split
+
+    # One character at a time: every hit spans a chunk boundary
+    session = scanner.session()
+    for char in TEXT:
+        session.feed(char)
+    assert session.finish() == expected
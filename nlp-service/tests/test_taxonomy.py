@@ -0,0 +1,24 @@
+"""Taxonomy artifact tests"""
+
+import json
+
+from app.nlp import taxonomy
+from app.nlp.taxonomy import DEFAULT_TAXONOMY_DIR, TaxonomyStore
+
+
+def test_artifact_reused_until_code_changes(tmp_path, monkeypatch):
+    artifact_path = str(tmp_path / "taxonomy.pkl")
+    compiled = TaxonomyStore(DEFAULT_TAXONOMY_DIR, artifact_path).current
+    with open(artifact_path, "rb") as f:
+        header = json.loads(f.readline())
+    assert header["code"] == taxonomy.code_fingerprint()
+
+    reloaded = TaxonomyStore(DEFAULT_TAXONOMY_DIR, artifact_path).current
+    assert reloaded.version == compiled.version
+    assert reloaded.compiled_at == compiled.compiled_at
+
+    # Same data, different compiler code: the artifact must not be reused
+    monkeypatch.setattr(taxonomy, "code_fingerprint", lambda: "changed")
+    rebuilt = TaxonomyStore(DEFAULT_TAXONOMY_DIR, artifact_path).current
+    assert rebuilt.version == compiled.version
+    assert rebuilt.compiled_at != compiled.compiled_at
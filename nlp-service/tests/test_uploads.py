@@ -0,0 +1,118 @@
+"""Upload size limit and spooling tests"""
+
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import FastAPI, Request, UploadFile
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.uploads import (
+    MULTIPART_OVERHEAD,
+    UploadLimitMiddleware,
+    UploadTooLargeError,
+    receive_upload,
+)
+from main import app
+
+RESUME = b"Experienced Python developer. Docker, AWS and PostgreSQL.\n" * 20
+
+
+def _receive(data: bytes, **kwargs):
+    upload = UploadFile(io.BytesIO(data), filename="cv.txt")
+    return asyncio.run(receive_upload(upload, chunk_size=64, **kwargs))
+
+
+@pytest.fixture
+def limited_client():
+    limited = FastAPI()
+    calls = []
+
+    @limited.post("/small")
+    @limited.post("/large")
+    @limited.post("/free")
+    async def echo(request: Request):
+        calls.append(request.url.path)
+        return {"size": len(await request.body())}
+
+    limited.add_middleware(UploadLimitMiddleware, limits={"/small": 100, "/large": 1000})
+    client = TestClient(limited)
+    client.calls = calls
+    return client
+
+
+def test_limits_are_per_path(limited_client):
+    body = b"x" * 500
+    assert limited_client.post("/small", content=body).status_code == 413
+    assert limited_client.post("/large", content=body).json() == {"size": 500}
+    assert limited_client.post("/free", content=b"x" * 5000).json() == {"size": 5000}
+    assert limited_client.post("/small", content=b"x" * 100).json() == {"size": 100}
+
+
+def test_declared_length_is_refused_before_the_app_runs(limited_client):
+    response = limited_client.post("/small", content=b"x" * 101)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body exceeds 100 bytes"}
+    assert limited_client.calls == []
+
+
+def test_streamed_body_is_cut_off_at_the_limit(limited_client):
+    chunks = (b"x" * 40 for _ in range(10))
+    response = limited_client.post("/small", content=chunks)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body exceeds 100 bytes"}
+    # No Content-Length, so the app started reading before the limit hit
+    assert limited_client.calls == ["/small"]
+
+
+def test_analyze_rejects_oversized_uploads(monkeypatch):
+    client = TestClient(app)
+    too_large = b"x" * (settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD + 1)
+    response = client.post(
+        "/api/analyze",
+        files={"file": ("cv.txt", too_large, "text/plain")},
+        data={"target_role": "backend-developer"},
+    )
+    assert response.status_code == 413
+
+    # Under the middleware limit, the file itself is still checked as it is read
+    monkeypatch.setattr(settings, "MAX_FILE_SIZE", 100)
+    response = client.post(
+        "/api/analyze",
+        files={"file": ("cv.txt", RESUME, "text/plain")},
+        data={"target_role": "backend-developer"},
+    )
+    assert response.status_code == 413
+    assert "100 bytes" in response.json()["detail"]
+
+
+def test_small_uploads_stay_in_memory(tmp_path):
+    document = _receive(RESUME, max_size=len(RESUME), spool_threshold=len(RESUME), spool_dir=str(tmp_path))
+    assert not document.spooled
+    assert document.source == RESUME
+    assert document.size == len(RESUME)
+    assert document.sha256 == hashlib.sha256(RESUME).hexdigest()
+    assert document.file_type == "text"
+    assert os.listdir(tmp_path) == []
+
+
+def test_large_uploads_spool_to_disk(tmp_path):
+    document = _receive(RESUME, max_size=len(RESUME), spool_threshold=100, spool_dir=str(tmp_path))
+    try:
+        assert document.spooled
+        assert os.path.dirname(document.source) == str(tmp_path)
+        assert document.read_bytes() == RESUME
+        assert document.size == len(RESUME)
+        assert document.sha256 == hashlib.sha256(RESUME).hexdigest()
+    finally:
+        document.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_upload_removes_its_spool_file(tmp_path):
+    with pytest.raises(UploadTooLargeError):
+        _receive(RESUME, max_size=len(RESUME) - 1, spool_threshold=100, spool_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,58 @@
+"""
+SkillLens NLP Job Worker
+Drains the async analysis job queue outside the API processes
+
+Usage (from nlp-service/):
+    python worker.py [--runners 4]
+
+Any number of workers (and API processes with JOB_WORKERS > 0) can share
+one queue; each job is claimed by exactly one of them.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+
+from app.config import settings
+from app.routes import jobs  # noqa: F401  (registers the job handlers)
+from app.utils.executor import worker_pools
+from app.utils.job_queue import run_job_runners
+from app.utils.warmup import run_warmup
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def serve(runners: int) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, run_warmup, settings.WARMUP_STEPS)
+
+    task = asyncio.create_task(run_job_runners(runners, f"worker-{os.getpid()}"))
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+    logger.info(f"Job worker started with {runners} runners")
+    try:
+        await task
+    except asyncio.CancelledError:
+        logger.info("Job worker stopping, running jobs go back to the queue")
+    finally:
+        worker_pools.shutdown()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--runners", type=int, default=max(settings.JOB_WORKERS, 1),
+        help="jobs run concurrently by this worker",
+    )
+    args = arg_parser.parse_args()
+    asyncio.run(serve(args.runners))
+
+
+if __name__ == "__main__":
+    main()